@@ -4,27 +4,40 @@ Football Focus API - Flask Backend
 Provides REST API endpoints for the Football Focus blog website
 """
 
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, redirect, request
 from flask_cors import CORS
+from functools import wraps
 import os
 import logging
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import json
 import io
 import base64
 from PIL import Image
 import shutil
+import threading
+import time
+import re
+import uuid
 
 # Add the parent directory to the path to import from crew_ai
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from supabase import create_client, Client
+from supabase import create_client, Client, ClientOptions
 from dotenv import load_dotenv
 import google.generativeai as genai
 from langchain_google_genai import ChatGoogleGenerativeAI
 
+from config import Config
+from response_cache import ResponseCache
+from cache_invalidation import start_invalidation_subscriber
+from search_index import LocalSearchIndex
+from http_transport import RetryPolicy
+from placeholder_images import PlaceholderImages
+from static_images import StaticImageIndex
+
 # Load environment variables
 load_dotenv()
 
@@ -46,29 +59,127 @@ CORS(app)  # Enable CORS for all routes
 # Initialize Supabase client
 def get_supabase_client():
     """Get a fresh Supabase client instance"""
-    return create_client(os.getenv('SUPABASE_URL'), os.getenv('SUPABASE_KEY'))
+    return create_client(
+        os.getenv('SUPABASE_URL'),
+        os.getenv('SUPABASE_KEY'),
+        options=ClientOptions(postgrest_client_timeout=Config.HTTP_READ_TIMEOUT)
+    )
 
 # Create initial client
 api:Client = get_supabase_client()
 
 # Helper function for database operations with automatic reconnection
-def execute_with_retry(operation, max_retries=3):
+# Same bounded, jittered backoff as the simple backend's HTTP transport
+retry_policy = RetryPolicy(Config.HTTP_MAX_RETRIES, Config.HTTP_BACKOFF_BASE, Config.HTTP_BACKOFF_MAX)
+
+def is_connection_error(error: Exception) -> bool:
+    """Check whether a database error looks like a dropped connection or timeout"""
+    error_str = str(error).lower()
+    return "server disconnected" in error_str or "connection" in error_str or "timeout" in error_str
+
+def execute_with_retry(operation, policy: RetryPolicy = retry_policy):
     """Execute a database operation with automatic reconnection on failure"""
-    for attempt in range(max_retries):
-        try:
-            return operation()
-        except Exception as e:
-            error_str = str(e).lower()
-            if "server disconnected" in error_str or "connection" in error_str or "timeout" in error_str:
-                logger.warning(f"Database connection issue on attempt {attempt + 1}: {e}")
-                if attempt < max_retries - 1:
-                    # Recreate the client and retry
-                    global api
-                    api = get_supabase_client()
-                    logger.info(f"Recreated Supabase client, retrying...")
-                    continue
-            raise e
-    return None
+    def reconnect(attempt, error):
+        # Recreate the client so the retry doesn't reuse a dead keep-alive connection
+        global api
+        api = get_supabase_client()
+        logger.info(f"Recreated Supabase client, retrying...")
+    
+    return policy.run(operation, is_connection_error, on_retry=reconnect)
+
+# Response cache shared by the read endpoints
+response_cache = ResponseCache(max_entries=Config.CACHE_MAX_ENTRIES, default_ttl=Config.CACHE_TIMEOUT)
+
+def make_cache_key(route_name: str) -> tuple:
+    """Build a cache key from the route name, path and normalized query args"""
+    args = sorted(
+        (key.strip().lower(), value.strip())
+        for key, values in request.args.lists()
+        for value in values
+        if value.strip()
+    )
+    return (route_name, request.path, tuple(args))
+
+# Headers of a view's response that are not replayed from the cache
+UNCACHED_HEADERS = {'content-length', 'set-cookie'}
+
+def cacheable_headers(response) -> tuple:
+    """Headers set by a view (Content-Type, Cache-Control, ETag, ...) to store with its cached body"""
+    return tuple(
+        (name, value) for name, value in response.headers.items()
+        if name.lower() not in UNCACHED_HEADERS
+    )
+
+def cached_response(route_name: str):
+    """
+    Cache successful JSON responses of an endpoint, with their headers, in the response cache
+    
+    Args:
+        route_name: Name used for the cache key and to look up the route's TTL
+                    in Config.CACHE_ROUTE_TIMEOUTS
+    """
+    ttl = Config.cache_timeout_for(route_name)
+    
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            def render():
+                response = app.make_response(view(*args, **kwargs))
+                return response.status_code, response.get_data(), cacheable_headers(response)
+            
+            (status, body, headers), outcome = response_cache.get_or_compute(
+                make_cache_key(route_name),
+                render,
+                ttl=ttl,
+                cacheable=lambda rendered: rendered[0] == 200
+            )
+            
+            response = Response(body, status=status, headers=list(headers))
+            response.headers['X-Cache'] = outcome.upper()
+            return response
+        return wrapper
+    return decorator
+
+# Routes whose cached responses each kind of fixture service write can change
+INVALIDATED_ROUTES = {
+    'articles': {'featured', 'trending', 'categories', 'stats', 'gameweek', 'search'},
+    'score': {'featured', 'stats', 'gameweek', 'search'},
+    'fixture_status': {'stats'}
+}
+
+def handle_invalidation_event(event: Dict[str, Any]):
+    """Evict the cached responses affected by a write in the fixture service"""
+    kind = event.get('kind')
+    routes = INVALIDATED_ROUTES.get(kind)
+    if routes is None:
+        # Unknown write; be safe and drop everything
+        response_cache.clear()
+        logger.info(f"Cleared response cache for invalidation event {kind}")
+        return
+    
+    matchday = event.get('matchday')
+    matchday_path = f"/api/gameweek/{matchday}" if matchday is not None else None
+    
+    def is_affected(key: tuple) -> bool:
+        route_name, path, _ = key
+        if route_name not in routes:
+            return False
+        # Pages for other specific matchdays are unchanged
+        if route_name == 'gameweek' and matchday_path and path not in (
+            '/api/gameweek/latest', '/api/gameweek/strip', matchday_path
+        ):
+            return False
+        return True
+    
+    evicted = response_cache.invalidate(is_affected)
+    logger.info(f"Invalidation event {kind} (fixture {event.get('fixture_id')}, matchday {matchday}): "
+                f"evicted {evicted} cached responses")
+
+invalidation_subscriber = start_invalidation_subscriber(
+    Config.INVALIDATION_CHANNEL,
+    Config.INVALIDATION_PATH,
+    handle_invalidation_event
+)
 
 # Helper functions for image generation and storage
 def ensure_images_directory():
@@ -146,40 +257,409 @@ def ensure_supabase_bucket():
 
 # Removed image upload function - now only reading from Supabase storage
 
-def get_article_image_url(article_id: str) -> str:
+PLACEHOLDER_IMAGE_URL = "/api/placeholder/400/250"
+
+# Cached listing of the article-images bucket, shared by all list endpoints
+_image_listing = {'names': None, 'fetched_at': 0.0}
+_image_listing_lock = threading.Lock()
+
+def get_image_public_base_url() -> Optional[str]:
+    """Get the public URL prefix for objects in the article-images bucket"""
+    supabase_url = os.getenv('SUPABASE_URL')
+    if not supabase_url:
+        return None
+    return f"{supabase_url.rstrip('/')}/storage/v1/object/public/{Config.IMAGE_BUCKET}"
+
+def fetch_image_bucket_listing() -> set:
+    """List every object name in the article-images bucket, page by page"""
+    names = set()
+    offset = 0
+    page_size = Config.IMAGE_LISTING_PAGE_SIZE
+    
+    while True:
+        def list_page():
+            return api.storage.from_(Config.IMAGE_BUCKET).list(
+                '', {'limit': page_size, 'offset': offset, 'sortBy': {'column': 'name', 'order': 'asc'}}
+            )
+        
+        page = execute_with_retry(list_page) or []
+        names.update(item['name'] for item in page if item.get('name'))
+        
+        if len(page) < page_size:
+            return names
+        offset += page_size
+
+def get_image_bucket_listing(missing_ids: Optional[List[str]] = None) -> Optional[set]:
+    """
+    Get the cached set of object names in the article-images bucket
+    
+    The listing is refreshed once it is older than IMAGE_LISTING_TTL, or earlier
+    (at most every IMAGE_LISTING_MISS_REFRESH seconds) when asked about articles
+    it doesn't know yet, so freshly uploaded images show up quickly.
+    
+    Returns:
+        Set of object names, or None if the bucket could not be listed
+    """
+    with _image_listing_lock:
+        names = _image_listing['names']
+        age = time.monotonic() - _image_listing['fetched_at']
+        
+        needs_refresh = names is None or age >= Config.IMAGE_LISTING_TTL
+        if not needs_refresh and missing_ids and age >= Config.IMAGE_LISTING_MISS_REFRESH:
+            needs_refresh = any(f"{article_id}.jpg" not in names for article_id in missing_ids)
+        
+        if needs_refresh:
+            try:
+                names = fetch_image_bucket_listing()
+                _image_listing['names'] = names
+                logger.info(f"Refreshed image bucket listing: {len(names)} objects")
+            except Exception as e:
+                # Keep serving the previous listing (if any) rather than failing the request
+                logger.warning(f"Could not list image bucket: {e}")
+            # Also back off after a failure so every request doesn't retry the listing
+            _image_listing['fetched_at'] = time.monotonic()
+        
+        return names
+
+def get_article_image_urls(article_ids: List[str], size: Optional[str] = None, extension: str = 'webp') -> Dict[str, str]:
+    """
+    Resolve image URLs for many articles in one pass
+    
+    URLs follow the deterministic public storage pattern, so the only remote
+    call is the (cached) bucket listing used to tell which images exist.
+    
+    Args:
+        article_ids: IDs of the articles to resolve
+        size: Derivative size from Config.IMAGE_SIZES ('strip', 'card', 'hero'), or None
+              for the original; falls back to the original if the derivative doesn't exist
+        extension: Derivative format, 'webp' or 'jpg'
+        
+    Returns:
+        Dictionary mapping article ID to image URL (or the placeholder URL)
+    """
+    base_url = get_image_public_base_url()
+    if not base_url:
+        return {article_id: PLACEHOLDER_IMAGE_URL for article_id in article_ids}
+    
+    existing = get_image_bucket_listing(missing_ids=article_ids)
+    
+    image_urls = {}
+    for article_id in article_ids:
+        filename = f"{article_id}.jpg"
+        derivative = f"{article_id}-{size}.{extension}"
+        if size in Config.IMAGE_SIZES and existing is not None and derivative in existing:
+            image_urls[article_id] = f"{base_url}/{derivative}"
+        # Without a listing we can't tell, so assume the image exists as before
+        elif existing is None or filename in existing:
+            image_urls[article_id] = f"{base_url}/{filename}"
+        else:
+            image_urls[article_id] = PLACEHOLDER_IMAGE_URL
+    
+    return image_urls
+
+def get_image_size(default: str) -> str:
+    """Get the image size requested with the image_size query parameter"""
+    size = request.args.get('image_size', default)
+    return size if size in Config.IMAGE_SIZES else default
+
+def get_article_image_url(article_id: str, size: Optional[str] = None) -> str:
     """Get article image URL from Supabase storage only"""
     try:
-        def get_public_url():
-            return api.storage.from_('article-images').get_public_url(f"{article_id}.jpg")
+        return get_article_image_urls([article_id], size)[article_id]
+    except Exception as e:
+        print(f"ERROR: Error getting image for article {article_id}: {e}")
+        return PLACEHOLDER_IMAGE_URL
+
+def find_latest_matchday_from_fixtures() -> Optional[int]:
+    """Find the latest matchday by scanning fixtures (used when gameweek_summary is unavailable)"""
+    # First, find the most recent fixture with articles
+    def get_latest_fixture():
+        return api.table('fixtures').select(
+            'matchday, match_date, generated_articles!inner(fixture_id)'
+        ).order('match_date', desc=True).limit(1).execute()
+    
+    latest_fixture = execute_with_retry(get_latest_fixture)
+    if latest_fixture.data:
+        return latest_fixture.data[0]['matchday']
+    
+    # Fallback: get the highest matchday with completed fixtures
+    def get_fallback_matchday():
+        return api.table('fixtures').select(
+            'matchday'
+        ).not_.is_('home_score', 'null').order('matchday', desc=True).limit(1).execute()
+    
+    result = execute_with_retry(get_fallback_matchday)
+    return result.data[0]['matchday'] if result.data else None
+
+def resolve_latest_matchday() -> Tuple[Optional[int], Optional[Dict[str, Any]]]:
+    """
+    Resolve the latest gameweek with a single lookup on gameweek_summary
+    
+    Prefers the matchday flagged as the latest with match reports, then the
+    highest matchday with completed fixtures.
+    
+    Returns:
+        Tuple of (matchday, summary row); the row is None when the fixture scan fallback was used
+    """
+    try:
+        def get_latest_summary():
+            return api.table('gameweek_summary').select('*').or_(
+                'is_latest.eq.true,completed_matches.gt.0'
+            ).order('is_latest', desc=True).order('matchday', desc=True).limit(1).execute()
+        
+        result = execute_with_retry(get_latest_summary)
+        if result.data:
+            return result.data[0]['matchday'], result.data[0]
+    except Exception as e:
+        logger.warning(f"gameweek_summary lookup failed, scanning fixtures instead: {e}")
+    
+    return find_latest_matchday_from_fixtures(), None
+
+def build_gameweek_summary(match_reports: List[Dict[str, Any]], summary_row: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Build the summary block of a gameweek response, preferring the stored gameweek_summary totals"""
+    if summary_row and summary_row.get('reported_matches') == len(match_reports):
+        total_matches = summary_row['reported_matches']
+        total_goals = summary_row['total_goals']
+        gameweek_complete = summary_row['gameweek_complete']
+    else:
+        total_matches = len(match_reports)
+        total_goals = sum(report['home_score'] + report['away_score'] for report in match_reports)
+        gameweek_complete = total_matches >= 10  # Premier League typically has 10 matches per gameweek
+    
+    return {
+        'total_matches': total_matches,
+        'total_goals': total_goals,
+        'avg_goals_per_match': round(total_goals / total_matches, 1) if total_matches > 0 else 0,
+        'gameweek_complete': gameweek_complete
+    }
+
+def format_excerpt(row: Dict[str, Any], length: int) -> str:
+    """Trim an article's stored excerpt to the length an endpoint displays"""
+    excerpt = row.get('excerpt') or ''
+    return excerpt[:length] + '...' if len(excerpt) > length else excerpt
+
+def format_read_time(row: Dict[str, Any]) -> str:
+    """Format an article's read time, estimating it from the word count if not stored"""
+    minutes = row.get('read_time') or max(1, (row.get('word_count') or 0) // 200)
+    return f"{minutes} min read"
+
+# Columns selected by the endpoints below (shared with the ASGI app in asgi_app.py)
+FEATURED_ARTICLE_COLUMNS = (
+    'id, title, excerpt, read_time, article_type, word_count, created_at, '
+    'fixtures!inner(home_team, away_team, match_date, home_score, away_score, competition)'
+)
+MATCH_REPORT_COLUMNS = (
+    'id, title, excerpt, read_time, article_type, word_count, created_at, '
+    'fixtures!inner(id, home_team, away_team, match_date, match_time, home_score, away_score, competition, venue, matchday)'
+)
+STRIP_CARD_COLUMNS = (
+    'id, title, fixture_id, '
+    'fixtures!inner(id, home_team, away_team, home_score, away_score, match_date)'
+)
+TRENDING_COLUMNS = 'title, fixtures!inner(home_team, away_team)'
+
+def build_category_list(categories_data: Dict[str, int]) -> List[Dict[str, Any]]:
+    """Map article type counts to the frontend category format"""
+    # Map to frontend format with colors
+    color_map = {
+        'match_report': 'bg-green-500',
+        'player_focus': 'bg-blue-500', 
+        'tactical_analysis': 'bg-purple-500',
+        'transfer_news': 'bg-orange-500',
+        'weekly_roundup': 'bg-red-500'
+    }
+    
+    categories = []
+    for category, count in categories_data.items():
+        # Convert category name to display format
+        display_name = category.replace('_', ' ').title()
+        if display_name == 'Match Report':
+            display_name = 'Match Reports'
+        elif display_name == 'Player Focus':
+            display_name = 'Player Focus'
+        elif display_name == 'Tactical Analysis':
+            display_name = 'Tactical Analysis'
+        elif display_name == 'Transfer News':
+            display_name = 'Transfer News'
+        elif display_name == 'Weekly Roundup':
+            display_name = 'Weekly Roundup'
+        
+        categories.append({
+            'name': display_name,
+            'value': category,
+            'count': count,
+            'color': color_map.get(category, 'bg-gray-500')
+        })
+    
+    return categories
+
+def build_trending_topics(rows: List[Dict[str, Any]]) -> List[str]:
+    """Build the trending topics list from recent articles' fixtures"""
+    trending_topics = []
+    teams_mentioned = {}
+    
+    for row in rows:
+        fixture = row.get('fixtures', {})
+        home_team = fixture.get('home_team', '')
+        away_team = fixture.get('away_team', '')
+        
+        # Count team mentions
+        if home_team:
+            teams_mentioned[home_team] = teams_mentioned.get(home_team, 0) + 1
+        if away_team:
+            teams_mentioned[away_team] = teams_mentioned.get(away_team, 0) + 1
+    
+    # Get top trending teams/topics
+    sorted_teams = sorted(teams_mentioned.items(), key=lambda x: x[1], reverse=True)[:5]
+    
+    for team, count in sorted_teams:
+        trending_topics.append(f"{team} Match Analysis")
+    
+    # Add some generic trending topics if not enough
+    if len(trending_topics) < 5:
+        generic_topics = [
+            "Premier League Title Race",
+            "Transfer Window Updates", 
+            "VAR Controversy Analysis",
+            "Player Performance Reviews",
+            "Tactical Innovations"
+        ]
+        trending_topics.extend(generic_topics[:5-len(trending_topics)])
+    
+    return trending_topics[:5]
+
+def build_featured_article(row: Dict[str, Any], image_url: str) -> Dict[str, Any]:
+    """Build the featured article response from an article row"""
+    fixture = row.get('fixtures', {})
+    
+    return {
+        'id': row['id'],
+        'title': row['title'],
+        'content': format_excerpt(row, 300),
+        'excerpt': format_excerpt(row, 300),
+        'category': row['article_type'],
+        'word_count': row['word_count'],
+        'created_at': row['created_at'],
+        'fixture_match': f"{fixture.get('home_team', 'Unknown')} vs {fixture.get('away_team', 'Unknown')}",
+        'match_date': fixture.get('match_date', ''),
+        'home_team': fixture.get('home_team', ''),
+        'away_team': fixture.get('away_team', ''),
+        'score': f"{fixture.get('home_score', 0)}-{fixture.get('away_score', 0)}" if fixture.get('home_score') is not None else '',
+        'competition': fixture.get('competition', 'Premier League'),
+        'tags': [
+            fixture.get('home_team', ''),
+            fixture.get('away_team', ''),
+            fixture.get('competition', 'Premier League')
+        ],
+        'author': 'Final Whistle AI',
+        'readTime': format_read_time(row),
+        'featured': True,
+        'image': image_url
+    }
+
+def build_match_reports(rows: List[Dict[str, Any]], image_urls: Dict[str, str]) -> List[Dict[str, Any]]:
+    """Build one match report card per fixture from gameweek article rows"""
+    match_reports = []
+    seen_fixtures = set()
+    for row in rows:
+        fixture = row.get('fixtures', {})
+        fixture_id = fixture.get('id')
+        
+        # Skip if we've already seen this fixture
+        if fixture_id in seen_fixtures:
+            continue
+        seen_fixtures.add(fixture_id)
+        
+        home_score_raw = fixture.get('home_score')
+        away_score_raw = fixture.get('away_score')
+        home_score_safe = 0 if home_score_raw is None else home_score_raw
+        away_score_safe = 0 if away_score_raw is None else away_score_raw
+        score_display_value = f"{home_score_raw}-{away_score_raw}" if (home_score_raw is not None and away_score_raw is not None) else ''
+        if home_score_raw is not None and away_score_raw is not None:
+            result_value = 'W' if home_score_raw > away_score_raw else 'L' if home_score_raw < away_score_raw else 'D'
+        else:
+            result_value = ''
         
-        public_url = execute_with_retry(get_public_url)
-        if public_url:
+        match_report = {
+            'id': row['id'],
+            'title': row['title'],
+            'excerpt': format_excerpt(row, 250),
+            'category': 'Match Reports',
+            'word_count': row['word_count'],
+            'created_at': row['created_at'],
+            'fixture_id': fixture.get('id'),
+            'home_team': fixture.get('home_team', ''),
+            'away_team': fixture.get('away_team', ''),
+            'home_score': home_score_safe,
+            'away_score': away_score_safe,
+            'match_date': fixture.get('match_date', ''),
+            'match_time': fixture.get('match_time', ''),
+            'competition': fixture.get('competition', 'Premier League'),
+            'venue': fixture.get('venue', ''),
+            'matchday': fixture.get('matchday', 0),
+            'fixture_match': f"{fixture.get('home_team', 'Unknown')} vs {fixture.get('away_team', 'Unknown')}",
+            'score_display': score_display_value,
+            'result': result_value,
+            'tags': [
+                fixture.get('home_team', ''),
+                fixture.get('away_team', ''),
+                f"Matchday {fixture.get('matchday', 0)}",
+                fixture.get('competition', 'Premier League')
+            ],
+            'author': 'Final Whistle AI',
+            'readTime': format_read_time(row),
+            'image': image_urls[row['id']]
+        }
+        
+        match_reports.append(match_report)
+    
+    return match_reports
 
-            print(f"INFO: Found Supabase image for article {article_id}")
-            
-            # Handle different URL formats
-            if isinstance(public_url, dict) and 'publicUrl' in public_url:
-                actual_url = clean_supabase_url(public_url['publicUrl'])
-                if actual_url:
-                    return actual_url
-            elif isinstance(public_url, str):
-                clean_url = clean_supabase_url(public_url)
-                if clean_url:
-                    return clean_url
-            
-            # Fallback to manual URL construction
-            supabase_url = os.getenv('SUPABASE_URL')
-            if supabase_url:
-                manual_url = f"{supabase_url}/storage/v1/object/public/article-images/{article_id}.jpg"
-                return manual_url
+def build_strip_cards(rows: List[Dict[str, Any]], image_urls: Dict[str, str]) -> List[Dict[str, Any]]:
+    """Build the gameweek strip cards (one article per fixture)"""
+    # Create unique fixtures list (one article per fixture)
+    strip_cards = []
+    seen_fixtures = set()
+    
+    for row in rows:
+        fixture = row.get('fixtures', {})
+        fixture_id = fixture.get('id')
         
-        # No image found, return placeholder
-        print(f"INFO: No image found for article {article_id}, using placeholder")
-        return f"/api/placeholder/400/250"
+        # Skip if we've already processed this fixture
+        if fixture_id in seen_fixtures:
+            continue
+        seen_fixtures.add(fixture_id)
         
-    except Exception as e:
-        print(f"ERROR: Error getting image for article {article_id}: {e}")
-        return f"/api/placeholder/400/250"
+        home_score = fixture.get('home_score', 0)
+        away_score = fixture.get('away_score', 0)
+        home_team = fixture.get('home_team', '')
+        away_team = fixture.get('away_team', '')
+        
+        strip_card = {
+            'id': row['id'],
+            'title': row['title'],
+            'fixture_id': fixture_id,
+            'fixture_label': f"{home_team} vs {away_team}",
+            'home_team': home_team,
+            'away_team': away_team,
+            'score': f"{home_score}-{away_score}" if home_score is not None and away_score is not None else '',
+            'image': image_urls[row['id']],
+            'match_date': fixture.get('match_date', '')
+        }
+        
+        strip_cards.append(strip_card)
+    
+    return strip_cards
+
+def build_stats(total_articles: int, total_fixtures: int, recent_count: int, latest_gameweek: int) -> Dict[str, Any]:
+    """Build the blog statistics response"""
+    return {
+        'total_articles': total_articles,
+        'total_fixtures_processed': total_fixtures,
+        'articles_this_week': recent_count,
+        'latest_gameweek': latest_gameweek,
+        'last_updated': datetime.now().isoformat()
+    }
 
 @app.route('/health', methods=['GET'])
 def health_check():
@@ -190,6 +670,31 @@ def health_check():
         'timestamp': datetime.now().isoformat()
     })
 
+CURSOR_TIMESTAMP_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}[T ][\d:.]+([+-]\d{2}:?\d{2}|Z)?$')
+
+def encode_article_cursor(row: Dict[str, Any]) -> str:
+    """Encode an article's (created_at, id) sort key as an opaque pagination cursor"""
+    payload = json.dumps([row['created_at'], row['id']], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+def decode_article_cursor(cursor: str) -> Tuple[str, str]:
+    """
+    Decode a pagination cursor back into its (created_at, id) sort key
+    
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        payload = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        created_at, article_id = json.loads(payload)
+    except (TypeError, ValueError) as e:
+        raise ValueError('malformed cursor') from e
+    
+    # Both values end up in a PostgREST filter, so only accept what the database produces
+    if not isinstance(created_at, str) or not CURSOR_TIMESTAMP_PATTERN.match(created_at):
+        raise ValueError('malformed cursor')
+    return created_at, str(uuid.UUID(str(article_id)))
+
 @app.route('/api/articles', methods=['GET'])
 def get_articles():
     """
@@ -197,8 +702,10 @@ def get_articles():
     
     Query parameters:
     - category: Filter by category
-    - limit: Number of articles to return (default: 10)
-    - offset: Number of articles to skip for pagination (default: 0)
+    - limit: Number of articles to return (default: 10, max: MAX_PAGE_SIZE)
+    - cursor: Opaque cursor from a previous response's next_cursor (preferred over offset)
+    - offset: Number of articles to skip for pagination (default: 0, ignored with cursor)
+    - count: Include a total count, 'estimated' or 'exact' (default: no count)
     - featured: Get only featured articles (true/false)
     - search: Search in title and content
     - fixture_id: Filter by specific fixture ID
@@ -206,16 +713,25 @@ def get_articles():
     try:
         # Get query parameters
         category = request.args.get('category')
-        limit = int(request.args.get('limit', 10))
-        offset = int(request.args.get('offset', 0))
+        limit = max(1, min(int(request.args.get('limit', Config.DEFAULT_PAGE_SIZE)), Config.MAX_PAGE_SIZE))
+        offset = max(0, int(request.args.get('offset', 0)))
         featured = request.args.get('featured', '').lower() == 'true'
         search = request.args.get('search', '')
+        cursor = request.args.get('cursor')
+        count_mode = request.args.get('count')
+        
+        if count_mode not in (None, 'estimated', 'exact'):
+            return jsonify({
+                'success': False,
+                'error': "count must be 'estimated' or 'exact'"
+            }), 400
         
         # Build the query
         query = api.table('generated_articles').select(
-            'id, title, content, article_type, word_count, file_path, created_at, '
+            'id, title, excerpt, read_time, article_type, word_count, file_path, created_at, '
             'fixture_id, processing_id, '
-            'fixtures!inner(home_team, away_team, match_date, home_score, away_score, competition)'
+            'fixtures!inner(home_team, away_team, match_date, home_score, away_score, competition)',
+            count=count_mode
         )
         
         # Apply filters
@@ -223,19 +739,27 @@ def get_articles():
             query = query.eq('article_type', category)
         
         if search:
-            # Search in title and content (basic search)
-            query = query.or_(f'title.ilike.%{search}%,content.ilike.%{search}%')
+            # Full-text search on title and content (GIN-indexed search_vector)
+            query = query.filter('search_vector', 'wfts(english)', search)
         
         # Filter by fixture_id if provided
         fixture_id = request.args.get('fixture_id')
         if fixture_id:
             query = query.eq('fixture_id', fixture_id)
         
-        # Apply pagination
-        query = query.range(offset, offset + limit - 1)
+        # Apply pagination, fetching one extra row to know whether another page exists
+        if cursor:
+            cursor_created_at, cursor_id = decode_article_cursor(cursor)
+            query = query.or_(
+                f'created_at.lt.{cursor_created_at},'
+                f'and(created_at.eq.{cursor_created_at},id.lt.{cursor_id})'
+            ).limit(limit + 1)
+            offset = 0
+        else:
+            query = query.range(offset, offset + limit)
         
-        # Order by creation date (newest first)
-        query = query.order('created_at', desc=True)
+        # Order by creation date (newest first), with id as a tie-breaker so cursors are stable
+        query = query.order('created_at', desc=True).order('id', desc=True)
         
         # Execute query with retry
         def execute_articles_query():
@@ -243,20 +767,23 @@ def get_articles():
         
         result = execute_with_retry(execute_articles_query)
         
+        rows = result.data[:limit]
+        has_more = len(result.data) > limit
+        
+        # Resolve all image URLs in one pass
+        image_urls = get_article_image_urls([row['id'] for row in rows], get_image_size('card'))
+        
         # Transform the data for frontend
         articles = []
-        for row in result.data:
+        for row in rows:
             fixture = row.get('fixtures', {})
             
-            # Get image URL for the article
-            article_image_url = get_article_image_url(row['id'])
-            
             # Create article object
             article = {
                 'id': row['id'],
                 'title': row['title'],
-                'content': row['content'][:200] + '...' if len(row['content']) > 200 else row['content'],  # Excerpt
-                'excerpt': row['content'][:200] + '...' if len(row['content']) > 200 else row['content'],
+                'content': format_excerpt(row, 200),  # Excerpt
+                'excerpt': format_excerpt(row, 200),
                 'category': row['article_type'],
                 'word_count': row['word_count'],
                 'created_at': row['created_at'],
@@ -272,9 +799,9 @@ def get_articles():
                     fixture.get('competition', 'Premier League')
                 ],
                 'author': 'Final Whistle AI',
-                'readTime': f"{max(1, row['word_count'] // 200)} min read",
+                'readTime': format_read_time(row),
                 'featured': False,  # We'll implement featured logic later
-                'image': article_image_url
+                'image': image_urls[row['id']]
             }
             
             articles.append(article)
@@ -285,10 +812,18 @@ def get_articles():
             'pagination': {
                 'limit': limit,
                 'offset': offset,
-                'total': len(articles)  # We'll implement total count later
+                'total': result.count if count_mode else None,
+                'count': count_mode,
+                'has_more': has_more,
+                'next_cursor': encode_article_cursor(rows[-1]) if has_more else None
             }
         })
         
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': f'Invalid pagination parameter: {e}'
+        }), 400
     except Exception as e:
         logger.error(f"Error retrieving articles: {e}")
         return jsonify({
@@ -296,12 +831,147 @@ def get_articles():
             'error': str(e)
         }), 500
 
+# Fallback search engine over the markdown export, for databases without full-text search
+local_search_index = LocalSearchIndex(Config.SEARCH_FALLBACK_DIR)
+
+def search_articles_postgres(search_query: str, limit: int, offset: int) -> Tuple[List[Dict[str, Any]], int]:
+    """Search articles with the search_articles RPC (Postgres full-text search)"""
+    def run_search():
+        return api.rpc('search_articles', {
+            'search_query': search_query,
+            'result_limit': limit,
+            'result_offset': offset
+        }).execute()
+    
+    result = execute_with_retry(run_search)
+    rows = result.data or []
+    if rows:
+        total = rows[0]['total_count']
+    elif offset > 0:
+        # Past the last result the page carries no total_count; count the matches instead
+        total = execute_with_retry(
+            lambda: api.rpc('count_search_articles', {'search_query': search_query}).execute()
+        ).data or 0
+    else:
+        total = 0
+    return rows, total
+
+def search_articles_local(search_query: str, limit: int, offset: int) -> Tuple[List[Dict[str, Any]], int]:
+    """Search the local markdown index and map the hits back to article IDs"""
+    rows, total = local_search_index.search(search_query, limit, offset)
+    
+    # The markdown export doesn't know article IDs, but the database stores each file's path
+    ids_by_path = {}
+    if rows:
+        try:
+            def get_ids():
+                return api.table('generated_articles').select('id, file_path').in_(
+                    'file_path', [row['file_path'] for row in rows]
+                ).execute()
+            
+            ids_by_path = {row['file_path']: row['id'] for row in execute_with_retry(get_ids).data}
+        except Exception as e:
+            logger.warning(f"Could not resolve article IDs for local search results: {e}")
+    
+    for row in rows:
+        row['id'] = ids_by_path.get(row['file_path'])
+    return rows, total
+
+@app.route('/api/search', methods=['GET'])
+@cached_response('search')
+def search_articles():
+    """
+    Ranked full-text search over articles
+    
+    Query parameters:
+    - q: Search query (supports quoted phrases, OR and -exclusions)
+    - limit: Number of results to return (default: 10)
+    - offset: Number of results to skip for pagination (default: 0)
+    """
+    try:
+        search_query = request.args.get('q', '').strip()
+        if not search_query:
+            return jsonify({
+                'success': False,
+                'error': 'Query parameter q is required'
+            }), 400
+        
+        limit = max(1, min(int(request.args.get('limit', Config.DEFAULT_PAGE_SIZE)), Config.MAX_PAGE_SIZE))
+        offset = max(0, int(request.args.get('offset', 0)))
+        
+        engine = 'local' if Config.SEARCH_ENGINE == 'local' else 'postgres'
+        if engine == 'postgres':
+            try:
+                rows, total = search_articles_postgres(search_query, limit, offset)
+            except Exception as e:
+                if Config.SEARCH_ENGINE == 'postgres':
+                    raise
+                logger.warning(f"Postgres full-text search failed, using local index: {e}")
+                engine = 'local'
+        if engine == 'local':
+            rows, total = search_articles_local(search_query, limit, offset)
+        
+        image_urls = get_article_image_urls([row['id'] for row in rows if row.get('id')], get_image_size('card'))
+        
+        results = []
+        for row in rows:
+            home_team = row.get('home_team', '')
+            away_team = row.get('away_team', '')
+            home_score = row.get('home_score')
+            away_score = row.get('away_score')
+            
+            results.append({
+                'id': row.get('id'),
+                'title': row.get('title', ''),
+                'snippet': row.get('snippet', ''),
+                'category': row.get('article_type', ''),
+                'word_count': row.get('word_count'),
+                'created_at': row.get('created_at') or row.get('generated_date', ''),
+                'fixture_id': row.get('fixture_id'),
+                'fixture_match': row.get('fixture_match') or f"{home_team or 'Unknown'} vs {away_team or 'Unknown'}",
+                'match_date': row.get('match_date', ''),
+                'home_team': home_team,
+                'away_team': away_team,
+                'score': f"{home_score}-{away_score}" if home_score is not None and away_score is not None else '',
+                'competition': row.get('competition', 'Premier League'),
+                'author': 'Final Whistle AI',
+                'readTime': format_read_time({
+                    'read_time': row.get('read_time'),
+                    'word_count': int(row.get('word_count') or 0)
+                }),
+                'rank': row.get('rank'),
+                'image': image_urls.get(row.get('id'), PLACEHOLDER_IMAGE_URL)
+            })
+        
+        return jsonify({
+            'success': True,
+            'data': results,
+            'engine': engine,
+            'pagination': {
+                'limit': limit,
+                'offset': offset,
+                'total': total
+            }
+        })
+        
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': f'Invalid pagination parameter: {e}'
+        }), 400
+    except Exception as e:
+        logger.error(f"Error searching articles: {e}")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
 @app.route('/api/articles/<article_id>', methods=['GET'])
 def get_article(article_id):
     """Get a specific article by ID"""
     try:
         result = api.table('generated_articles').select(
-            'id, title, content, article_type, word_count, file_path, created_at, '
+            'id, title, content, read_time, article_type, word_count, file_path, created_at, '
             'fixture_id, processing_id, '
             'fixtures!inner(home_team, away_team, match_date, match_time, home_score, away_score, competition, venue)'
         ).eq('id', article_id).execute()
@@ -316,7 +986,7 @@ def get_article(article_id):
         fixture = row.get('fixtures', {})
         
         # Get or generate image for the article
-        article_image_url = get_article_image_url(row['id'])
+        article_image_url = get_article_image_url(row['id'], get_image_size('hero'))
         
         article = {
             'id': row['id'],
@@ -340,7 +1010,7 @@ def get_article(article_id):
                 fixture.get('competition', 'Premier League')
             ],
             'author': 'Final Whistle AI',
-            'readTime': f"{max(1, row['word_count'] // 200)} min read",
+            'readTime': format_read_time(row),
             'image': article_image_url
         }
         
@@ -357,6 +1027,7 @@ def get_article(article_id):
         }), 500
 
 @app.route('/api/categories', methods=['GET'])
+@cached_response('categories')
 def get_categories():
     """Get all available article categories with counts"""
     try:
@@ -373,36 +1044,7 @@ def get_categories():
         else:
             categories_data = {row['article_type']: row['count'] for row in result.data}
         
-        # Map to frontend format with colors
-        color_map = {
-            'match_report': 'bg-green-500',
-            'player_focus': 'bg-blue-500', 
-            'tactical_analysis': 'bg-purple-500',
-            'transfer_news': 'bg-orange-500',
-            'weekly_roundup': 'bg-red-500'
-        }
-        
-        categories = []
-        for category, count in categories_data.items():
-            # Convert category name to display format
-            display_name = category.replace('_', ' ').title()
-            if display_name == 'Match Report':
-                display_name = 'Match Reports'
-            elif display_name == 'Player Focus':
-                display_name = 'Player Focus'
-            elif display_name == 'Tactical Analysis':
-                display_name = 'Tactical Analysis'
-            elif display_name == 'Transfer News':
-                display_name = 'Transfer News'
-            elif display_name == 'Weekly Roundup':
-                display_name = 'Weekly Roundup'
-            
-            categories.append({
-                'name': display_name,
-                'value': category,
-                'count': count,
-                'color': color_map.get(category, 'bg-gray-500')
-            })
+        categories = build_category_list(categories_data)
         
         return jsonify({
             'success': True,
@@ -417,6 +1059,7 @@ def get_categories():
         }), 500
 
 @app.route('/api/trending', methods=['GET'])
+@cached_response('trending')
 def get_trending():
     """Get trending topics based on recent articles"""
     try:
@@ -424,39 +1067,10 @@ def get_trending():
         week_ago = (datetime.now() - timedelta(days=7)).isoformat()
         
         result = api.table('generated_articles').select(
-            'title, fixtures!inner(home_team, away_team)'
+            TRENDING_COLUMNS
         ).gte('created_at', week_ago).limit(10).execute()
         
-        trending_topics = []
-        teams_mentioned = {}
-        
-        for row in result.data:
-            fixture = row.get('fixtures', {})
-            home_team = fixture.get('home_team', '')
-            away_team = fixture.get('away_team', '')
-            
-            # Count team mentions
-            if home_team:
-                teams_mentioned[home_team] = teams_mentioned.get(home_team, 0) + 1
-            if away_team:
-                teams_mentioned[away_team] = teams_mentioned.get(away_team, 0) + 1
-        
-        # Get top trending teams/topics
-        sorted_teams = sorted(teams_mentioned.items(), key=lambda x: x[1], reverse=True)[:5]
-        
-        for team, count in sorted_teams:
-            trending_topics.append(f"{team} Match Analysis")
-        
-        # Add some generic trending topics if not enough
-        if len(trending_topics) < 5:
-            generic_topics = [
-                "Premier League Title Race",
-                "Transfer Window Updates", 
-                "VAR Controversy Analysis",
-                "Player Performance Reviews",
-                "Tactical Innovations"
-            ]
-            trending_topics.extend(generic_topics[:5-len(trending_topics)])
+        trending_topics = build_trending_topics(result.data)
         
         return jsonify({
             'success': True,
@@ -471,6 +1085,7 @@ def get_trending():
         }), 500
 
 @app.route('/api/featured', methods=['GET'])
+@cached_response('featured')
 def get_featured_article():
     """Get the most recent featured article"""
     try:
@@ -478,8 +1093,7 @@ def get_featured_article():
         # Later we can add a featured flag to the database
         def get_featured_data():
             return api.table('generated_articles').select(
-                'id, title, content, article_type, word_count, created_at, '
-                'fixtures!inner(home_team, away_team, match_date, home_score, away_score, competition)'
+                FEATURED_ARTICLE_COLUMNS
             ).order('created_at', desc=True).limit(1).execute()
         
         result = execute_with_retry(get_featured_data)
@@ -491,35 +1105,7 @@ def get_featured_article():
             }), 404
         
         row = result.data[0]
-        fixture = row.get('fixtures', {})
-        
-        # Get or generate image for the article
-        article_image_url = get_article_image_url(row['id'])
-        
-        article = {
-            'id': row['id'],
-            'title': row['title'],
-            'content': row['content'][:300] + '...' if len(row['content']) > 300 else row['content'],
-            'excerpt': row['content'][:300] + '...' if len(row['content']) > 300 else row['content'],
-            'category': row['article_type'],
-            'word_count': row['word_count'],
-            'created_at': row['created_at'],
-            'fixture_match': f"{fixture.get('home_team', 'Unknown')} vs {fixture.get('away_team', 'Unknown')}",
-            'match_date': fixture.get('match_date', ''),
-            'home_team': fixture.get('home_team', ''),
-            'away_team': fixture.get('away_team', ''),
-            'score': f"{fixture.get('home_score', 0)}-{fixture.get('away_score', 0)}" if fixture.get('home_score') is not None else '',
-            'competition': fixture.get('competition', 'Premier League'),
-            'tags': [
-                fixture.get('home_team', ''),
-                fixture.get('away_team', ''),
-                fixture.get('competition', 'Premier League')
-            ],
-            'author': 'Final Whistle AI',
-            'readTime': f"{max(1, row['word_count'] // 200)} min read",
-            'featured': True,
-            'image': article_image_url
-        }
+        article = build_featured_article(row, get_article_image_url(row['id'], get_image_size('hero')))
         
         return jsonify({
             'success': True,
@@ -534,110 +1120,35 @@ def get_featured_article():
         }), 500
 
 @app.route('/api/gameweek/latest', methods=['GET'])
+@cached_response('gameweek')
 def get_latest_gameweek_match_reports():
     """Get match reports for the latest completed gameweek"""
     try:
         # Get the latest completed gameweek with match reports
-        # First, find the most recent fixture with articles
-        latest_fixture = api.table('fixtures').select(
-            'matchday, match_date, generated_articles!inner(fixture_id)'
-        ).order('match_date', desc=True).limit(1).execute()
-        print(latest_fixture.data)
-        if not latest_fixture.data:
-            # Fallback: get the highest matchday with completed fixtures
-            result = api.table('fixtures').select(
-                'matchday'
-            ).not_.is_('home_score', 'null').order('matchday', desc=True).limit(1).execute()
-            
-            if not result.data:
-                return jsonify({
-                    'success': False,
-                    'error': 'No completed gameweeks found'
-                }), 404
-            
-            latest_matchday = result.data[0]['matchday']
-        else:
-            latest_matchday = latest_fixture.data[0]['matchday']
+        latest_matchday, summary_row = resolve_latest_matchday()
+        
+        if latest_matchday is None:
+            return jsonify({
+                'success': False,
+                'error': 'No completed gameweeks found'
+            }), 404
         
         # Get all match reports for this gameweek
         gameweek_articles = api.table('generated_articles').select(
-            'id, title, content, article_type, word_count, created_at, '
-            'fixtures!inner(id, home_team, away_team, match_date, match_time, home_score, away_score, competition, venue, matchday)'
+            MATCH_REPORT_COLUMNS
         ).eq('fixtures.matchday', latest_matchday).eq('article_type', 'match_report').order('match_date', desc=False, foreign_table='fixtures').execute()
         
-        # Transform data for frontend
-        match_reports = []
-        seen_fixtures = set()
-        for row in gameweek_articles.data:
-            fixture = row.get('fixtures', {})
-            fixture_id = fixture.get('id')
-            
-            # Skip if we've already seen this fixture
-            if fixture_id in seen_fixtures:
-                continue
-            seen_fixtures.add(fixture_id)
-            
-            home_score_raw = fixture.get('home_score')
-            away_score_raw = fixture.get('away_score')
-            home_score_safe = 0 if home_score_raw is None else home_score_raw
-            away_score_safe = 0 if away_score_raw is None else away_score_raw
-            score_display_value = f"{home_score_raw}-{away_score_raw}" if (home_score_raw is not None and away_score_raw is not None) else ''
-            if home_score_raw is not None and away_score_raw is not None:
-                result_value = 'W' if home_score_raw > away_score_raw else 'L' if home_score_raw < away_score_raw else 'D'
-            else:
-                result_value = ''
-            
-            # Get image URL for the article
-            article_image_url = get_article_image_url(row['id'])
-            match_report = {
-                'id': row['id'],
-                'title': row['title'],
-                'excerpt': row['content'][:250] + '...' if len(row['content']) > 250 else row['content'],
-                'category': 'Match Reports',
-                'word_count': row['word_count'],
-                'created_at': row['created_at'],
-                'fixture_id': fixture.get('id'),
-                'home_team': fixture.get('home_team', ''),
-                'away_team': fixture.get('away_team', ''),
-                'home_score': home_score_safe,
-                'away_score': away_score_safe,
-                'match_date': fixture.get('match_date', ''),
-                'match_time': fixture.get('match_time', ''),
-                'competition': fixture.get('competition', 'Premier League'),
-                'venue': fixture.get('venue', ''),
-                'matchday': fixture.get('matchday', 0),
-                'fixture_match': f"{fixture.get('home_team', 'Unknown')} vs {fixture.get('away_team', 'Unknown')}",
-                'score_display': score_display_value,
-                'result': result_value,
-                'tags': [
-                    fixture.get('home_team', ''),
-                    fixture.get('away_team', ''),
-                    f"Matchday {fixture.get('matchday', 0)}",
-                    fixture.get('competition', 'Premier League')
-                ],
-                'author': 'Final Whistle AI',
-                'readTime': f"{max(1, row['word_count'] // 200)} min read",
-                'image': article_image_url
-            }
-            
-            match_reports.append(match_report)
+        # Resolve all image URLs in one pass
+        image_urls = get_article_image_urls([row['id'] for row in gameweek_articles.data], get_image_size('card'))
         
-        # Get gameweek summary
-        total_matches = len(match_reports)
-        total_goals = sum(report['home_score'] + report['away_score'] for report in match_reports)
-        avg_goals_per_match = round(total_goals / total_matches, 1) if total_matches > 0 else 0
+        match_reports = build_match_reports(gameweek_articles.data, image_urls)
         
         return jsonify({
             'success': True,
             'data': {
                 'matchday': latest_matchday,
                 'match_reports': match_reports,
-                'summary': {
-                    'total_matches': total_matches,
-                    'total_goals': total_goals,
-                    'avg_goals_per_match': avg_goals_per_match,
-                    'gameweek_complete': total_matches >= 10  # Premier League typically has 10 matches per gameweek
-                }
+                'summary': build_gameweek_summary(match_reports, summary_row)
             }
         })
         
@@ -649,13 +1160,13 @@ def get_latest_gameweek_match_reports():
         }), 500
 
 @app.route('/api/gameweek/<int:matchday>', methods=['GET'])
+@cached_response('gameweek')
 def get_gameweek_match_reports(matchday):
     """Get match reports for a specific gameweek"""
     try:
         # Get all match reports for the specified gameweek
         gameweek_articles = api.table('generated_articles').select(
-            'id, title, content, article_type, word_count, created_at, '
-            'fixtures!inner(id, home_team, away_team, match_date, match_time, home_score, away_score, competition, venue, matchday)'
+            MATCH_REPORT_COLUMNS
         ).eq('fixtures.matchday', matchday).eq('article_type', 'match_report').order('match_date', desc=False, foreign_table='fixtures').execute()
         
         if not gameweek_articles.data:
@@ -664,80 +1175,17 @@ def get_gameweek_match_reports(matchday):
                 'error': f'No match reports found for matchday {matchday}'
             }), 404
         
-        # Transform data for frontend
-        match_reports = []
-        seen_fixtures = set()
-        for row in gameweek_articles.data:
-            fixture = row.get('fixtures', {})
-            fixture_id = fixture.get('id')
-            
-            # Skip if we've already seen this fixture
-            if fixture_id in seen_fixtures:
-                continue
-            seen_fixtures.add(fixture_id)
-            
-            home_score_raw = fixture.get('home_score')
-            away_score_raw = fixture.get('away_score')
-            home_score_safe = 0 if home_score_raw is None else home_score_raw
-            away_score_safe = 0 if away_score_raw is None else away_score_raw
-            score_display_value = f"{home_score_raw}-{away_score_raw}" if (home_score_raw is not None and away_score_raw is not None) else ''
-            if home_score_raw is not None and away_score_raw is not None:
-                result_value = 'W' if home_score_raw > away_score_raw else 'L' if home_score_raw < away_score_raw else 'D'
-            else:
-                result_value = ''
-            
-            # Get image URL for the article
-            article_image_url = get_article_image_url(row['id'])
-            
-            match_report = {
-                'id': row['id'],
-                'title': row['title'],
-                'excerpt': row['content'][:250] + '...' if len(row['content']) > 250 else row['content'],
-                'category': 'Match Reports',
-                'word_count': row['word_count'],
-                'created_at': row['created_at'],
-                'fixture_id': fixture.get('id'),
-                'home_team': fixture.get('home_team', ''),
-                'away_team': fixture.get('away_team', ''),
-                'home_score': home_score_safe,
-                'away_score': away_score_safe,
-                'match_date': fixture.get('match_date', ''),
-                'match_time': fixture.get('match_time', ''),
-                'competition': fixture.get('competition', 'Premier League'),
-                'venue': fixture.get('venue', ''),
-                'matchday': fixture.get('matchday', 0),
-                'fixture_match': f"{fixture.get('home_team', 'Unknown')} vs {fixture.get('away_team', 'Unknown')}",
-                'score_display': score_display_value,
-                'result': result_value,
-                'tags': [
-                    fixture.get('home_team', ''),
-                    fixture.get('away_team', ''),
-                    f"Matchday {fixture.get('matchday', 0)}",
-                    fixture.get('competition', 'Premier League')
-                ],
-                'author': 'Final Whistle AI',
-                'readTime': f"{max(1, row['word_count'] // 200)} min read",
-                'image': article_image_url
-            }
-            
-            match_reports.append(match_report)
+        # Resolve all image URLs in one pass
+        image_urls = get_article_image_urls([row['id'] for row in gameweek_articles.data], get_image_size('card'))
         
-        # Get gameweek summary
-        total_matches = len(match_reports)
-        total_goals = sum(report['home_score'] + report['away_score'] for report in match_reports)
-        avg_goals_per_match = round(total_goals / total_matches, 1) if total_matches > 0 else 0
+        match_reports = build_match_reports(gameweek_articles.data, image_urls)
         
         return jsonify({
             'success': True,
             'data': {
                 'matchday': matchday,
                 'match_reports': match_reports,
-                'summary': {
-                    'total_matches': total_matches,
-                    'total_goals': total_goals,
-                    'avg_goals_per_match': avg_goals_per_match,
-                    'gameweek_complete': total_matches >= 10
-                }
+                'summary': build_gameweek_summary(match_reports)
             }
         })
         
@@ -749,79 +1197,31 @@ def get_gameweek_match_reports(matchday):
         }), 500
 
 @app.route('/api/gameweek/strip', methods=['GET'])
+@cached_response('gameweek')
 def get_gameweek_strip():
     """Get one match report per fixture for latest gameweek - optimized for horizontal strip display"""
     try:
         # Get the latest completed gameweek with match reports
-        def get_latest_fixture():
-            return api.table('fixtures').select(
-                'matchday, match_date, generated_articles!inner(fixture_id)'
-            ).order('match_date', desc=True).limit(1).execute()
-        
-        latest_fixture = execute_with_retry(get_latest_fixture)
-        
-        if not latest_fixture.data:
-            # Fallback: get the highest matchday with completed fixtures
-            def get_fallback_matchday():
-                return api.table('fixtures').select(
-                    'matchday'
-                ).not_.is_('home_score', 'null').order('matchday', desc=True).limit(1).execute()
-            
-            result = execute_with_retry(get_fallback_matchday)
-            
-            if not result.data:
-                return jsonify({
-                    'success': False,
-                    'error': 'No completed gameweeks found'
-                }), 404
-            
-            latest_matchday = result.data[0]['matchday']
-        else:
-            latest_matchday = latest_fixture.data[0]['matchday']
+        latest_matchday, _ = resolve_latest_matchday()
+        
+        if latest_matchday is None:
+            return jsonify({
+                'success': False,
+                'error': 'No completed gameweeks found'
+            }), 404
         
         # Get one match report per fixture for this gameweek (distinct fixture_id)
         def get_gameweek_articles():
             return api.table('generated_articles').select(
-                'id, title, fixture_id, '
-                'fixtures!inner(id, home_team, away_team, home_score, away_score, match_date)'
+                STRIP_CARD_COLUMNS
             ).eq('fixtures.matchday', latest_matchday).eq('article_type', 'match_report').order('match_date', desc=False, foreign_table='fixtures').execute()
         
         gameweek_articles = execute_with_retry(get_gameweek_articles)
         
-        # Create unique fixtures list (one article per fixture)
-        strip_cards = []
-        seen_fixtures = set()
+        # Resolve all image URLs in one pass
+        image_urls = get_article_image_urls([row['id'] for row in gameweek_articles.data], get_image_size('strip'))
         
-        for row in gameweek_articles.data:
-            fixture = row.get('fixtures', {})
-            fixture_id = fixture.get('id')
-            
-            # Skip if we've already processed this fixture
-            if fixture_id in seen_fixtures:
-                continue
-            seen_fixtures.add(fixture_id)
-            
-            home_score = fixture.get('home_score', 0)
-            away_score = fixture.get('away_score', 0)
-            home_team = fixture.get('home_team', '')
-            away_team = fixture.get('away_team', '')
-            
-            # Get image URL for the article
-            article_image_url = get_article_image_url(row['id'])
-            
-            strip_card = {
-                'id': row['id'],
-                'title': row['title'],
-                'fixture_id': fixture_id,
-                'fixture_label': f"{home_team} vs {away_team}",
-                'home_team': home_team,
-                'away_team': away_team,
-                'score': f"{home_score}-{away_score}" if home_score is not None and away_score is not None else '',
-                'image': article_image_url,
-                'match_date': fixture.get('match_date', '')
-            }
-            
-            strip_cards.append(strip_card)
+        strip_cards = build_strip_cards(gameweek_articles.data, image_urls)
         
         return jsonify({
             'success': True,
@@ -839,60 +1239,103 @@ def get_gameweek_strip():
             'error': str(e)
         }), 500
 
+# Encoded placeholder images, rendered once per size and format
+placeholder_images = PlaceholderImages(
+    font_path=Config.PLACEHOLDER_FONT,
+    min_size=Config.PLACEHOLDER_MIN_SIZE,
+    max_size=Config.PLACEHOLDER_MAX_SIZE,
+    max_entries=Config.PLACEHOLDER_CACHE_ENTRIES
+)
+
+def accepts_webp() -> bool:
+    """
+    Check whether the Accept header lists image/webp with a non-zero quality
+    
+    Wildcards don't count, since clients sending only */* may not decode WebP.
+    """
+    return any(
+        value.lower() == 'image/webp' and quality > 0
+        for value, quality in request.accept_mimetypes
+    )
+
 @app.route('/api/placeholder/<int:width>/<int:height>', methods=['GET'])
 def serve_placeholder_image(width, height):
-    """Serve a placeholder image"""
+    """Serve a placeholder image (WebP if the client accepts it, JPEG otherwise)"""
     try:
-        from flask import send_file
-        import io
-        
-        # Create a simple placeholder image
-        img = Image.new('RGB', (width, height), color='#1e40af')  # Blue background
+        data, etag, mimetype = placeholder_images.get(width, height, 'WEBP' if accepts_webp() else 'JPEG')
         
-        # Add some text if possible
-        try:
-            from PIL import ImageDraw, ImageFont
-            draw = ImageDraw.Draw(img)
-            
-            # Try to use a default font
-            try:
-                font = ImageFont.truetype("arial.ttf", 20)
-            except:
-                font = ImageFont.load_default()
-            
-            text = "No Image"
-            # Get text size and center it
-            bbox = draw.textbbox((0, 0), text, font=font)
-            text_width = bbox[2] - bbox[0]
-            text_height = bbox[3] - bbox[1]
-            
-            x = (width - text_width) // 2
-            y = (height - text_height) // 2
-            
-            draw.text((x, y), text, fill='white', font=font)
-        except:
-            pass  # If text rendering fails, just return the blue image
-        
-        img_buffer = io.BytesIO()
-        img.save(img_buffer, format='JPEG', quality=85)
-        img_buffer.seek(0)
-        
-        return send_file(img_buffer, mimetype='image/jpeg')
+        response = Response(data, mimetype=mimetype)
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = f'public, max-age={Config.STATIC_CACHE_MAX_AGE}, immutable'
+        response.vary.add('Accept')
+        return response.make_conditional(request)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/article-image/<article_id>', methods=['GET'])
+def redirect_article_image(article_id):
+    """
+    Redirect to an article's image in storage
+    
+    Query parameters:
+    - size: strip (320px), card (640px) or hero (1280px); default: the original image
+    
+    The WebP derivative is chosen when the Accept header lists image/webp (with q > 0), JPEG otherwise.
+    """
+    size = request.args.get('size')
+    image_url = get_article_image_urls(
+        [article_id],
+        size if size in Config.IMAGE_SIZES else None,
+        'webp' if accepts_webp() else 'jpg'
+    )[article_id]
+    
+    response = redirect(image_url, code=302)
+    response.vary.add('Accept')
+    response.cache_control.public = True
+    response.cache_control.max_age = Config.IMAGE_LISTING_TTL
+    return response
+
+# Index of api/images/ with content-hash ETags
+static_images = StaticImageIndex(ensure_images_directory())
+
 @app.route('/api/images/<filename>', methods=['GET'])
 def serve_local_image(filename):
-    """Serve local images from the images directory"""
+    """
+    Serve local images from the images directory
+    
+    Supports If-None-Match/If-Modified-Since (304) and Range requests. With
+    STATIC_SENDFILE set, the file body is sent by the front-end server instead.
+    """
     try:
-        images_dir = ensure_images_directory()
-        image_path = os.path.join(images_dir, filename)
-        
-        if os.path.exists(image_path):
-            from flask import send_file
-            return send_file(image_path, mimetype='image/jpeg')
-        else:
+        # Only names found in the directory index are served, never a joined raw path
+        image = static_images.lookup(filename)
+        if image is None:
             return jsonify({'error': 'Image not found'}), 404
+        
+        sendfile_mode = Config.STATIC_SENDFILE.lower()
+        if sendfile_mode in ('x-accel', 'x-sendfile'):
+            # Headers only: nginx (X-Accel-Redirect) or Apache/lighttpd (X-Sendfile) streams
+            # the file, including Range requests, with zero-copy sendfile
+            response = Response(status=200, mimetype=image.mimetype)
+            if sendfile_mode == 'x-accel':
+                response.headers['X-Accel-Redirect'] = Config.STATIC_ACCEL_PREFIX + image.filename
+            else:
+                response.headers['X-Sendfile'] = image.path
+            response.set_etag(image.etag)
+            response.last_modified = image.mtime
+            response.cache_control.public = True
+            response.cache_control.max_age = Config.STATIC_IMAGE_MAX_AGE
+            return response.make_conditional(request)
+        
+        from flask import send_file
+        return send_file(
+            image.path,
+            mimetype=image.mimetype,
+            conditional=True,
+            etag=image.etag,
+            last_modified=image.mtime,
+            max_age=Config.STATIC_IMAGE_MAX_AGE
+        )
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -1112,6 +1555,7 @@ def debug_image_url(article_id):
         }), 500
 
 @app.route('/api/stats', methods=['GET'])
+@cached_response('stats')
 def get_stats():
     """Get general statistics about the blog"""
     try:
@@ -1129,18 +1573,16 @@ def get_stats():
         recent_count = recent_articles.count or 0
         
         # Get latest gameweek number
-        latest_gameweek_result = api.table('fixtures').select('matchday').not_.is_('home_score', 'null').order('matchday', desc=True).limit(1).execute()
+        try:
+            latest_gameweek_result = api.table('gameweek_summary').select('matchday').gt('completed_matches', 0).order('matchday', desc=True).limit(1).execute()
+        except Exception as e:
+            logger.warning(f"gameweek_summary lookup failed, scanning fixtures instead: {e}")
+            latest_gameweek_result = api.table('fixtures').select('matchday').not_.is_('home_score', 'null').order('matchday', desc=True).limit(1).execute()
         latest_gameweek = latest_gameweek_result.data[0]['matchday'] if latest_gameweek_result.data else 0
         
         return jsonify({
             'success': True,
-            'data': {
-                'total_articles': total_articles,
-                'total_fixtures_processed': total_fixtures,
-                'articles_this_week': recent_count,
-                'latest_gameweek': latest_gameweek,
-                'last_updated': datetime.now().isoformat()
-            }
+            'data': build_stats(total_articles, total_fixtures, recent_count, latest_gameweek)
         })
         
     except Exception as e:
@@ -1150,6 +1592,14 @@ def get_stats():
             'error': str(e)
         }), 500
 
+@app.route('/api/cache/stats', methods=['GET'])
+def get_cache_stats():
+    """Get response cache hit/miss counters"""
+    return jsonify({
+        'success': True,
+        'data': response_cache.stats()
+    })
+
 @app.errorhandler(404)
 def not_found(error):
     """Handle 404 errors"""
@@ -8,13 +8,15 @@ from flask import Flask, jsonify, request
 from flask_cors import CORS
 import os
 import logging
-import requests
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 import json
 
 from dotenv import load_dotenv
 
+from config import Config
+from http_transport import PooledTransport, RetryPolicy, TransportError
+
 # Load environment variables
 load_dotenv()
 
@@ -56,6 +58,17 @@ class FootballFocusAPI:
                 'Prefer': 'return=representation'
             }
             
+            # One keep-alive connection pool for all queries
+            self.transport = PooledTransport(
+                self.base_url,
+                headers=self.headers,
+                pool_size=Config.HTTP_POOL_SIZE,
+                connect_timeout=Config.HTTP_CONNECT_TIMEOUT,
+                read_timeout=Config.HTTP_READ_TIMEOUT,
+                retry_policy=RetryPolicy(Config.HTTP_MAX_RETRIES, Config.HTTP_BACKOFF_BASE, Config.HTTP_BACKOFF_MAX),
+                http2=Config.HTTP2_ENABLED
+            )
+            
             logger.info("✅ Supabase HTTP client initialized")
             
         except Exception as e:
@@ -65,7 +78,6 @@ class FootballFocusAPI:
     def query_table(self, table: str, select: str = "*", filters: Dict = None, order: str = None, limit: int = None) -> Dict:
         """Query a Supabase table using REST API"""
         try:
-            url = f"{self.base_url}/{table}"
             params = {"select": select}
             
             # Add filters
@@ -81,15 +93,14 @@ class FootballFocusAPI:
             if limit:
                 params["limit"] = limit
             
-            response = requests.get(url, headers=self.headers, params=params)
-            response.raise_for_status()
+            response = self.transport.get(table, params=params)
             
             return {
                 'data': response.json(),
                 'success': True
             }
             
-        except requests.exceptions.RequestException as e:
+        except TransportError as e:
             logger.error(f"Error querying {table}: {e}")
             return {
                 'data': [],
@@ -100,6 +111,16 @@ class FootballFocusAPI:
 # Initialize API
 api = FootballFocusAPI()
 
+def format_excerpt(row: Dict, length: int) -> str:
+    """Trim an article's stored excerpt to the length an endpoint displays"""
+    excerpt = row.get('excerpt') or ''
+    return excerpt[:length] + '...' if len(excerpt) > length else excerpt
+
+def format_read_time(row: Dict) -> str:
+    """Format an article's read time, estimating it from the word count if not stored"""
+    minutes = row.get('read_time') or max(1, (row.get('word_count') or 0) // 200)
+    return f"{minutes} min read"
+
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
@@ -121,7 +142,7 @@ def get_articles():
         
         # Build query parameters
         select_clause = (
-            "id,title,content,article_type,word_count,file_path,created_at,fixture_id,processing_id,"
+            "id,title,excerpt,read_time,article_type,word_count,file_path,created_at,fixture_id,processing_id,"
             "fixtures!inner(home_team,away_team,match_date,home_score,away_score,competition)"
         )
         
@@ -131,9 +152,9 @@ def get_articles():
         if category and category != 'All':
             filters['article_type'] = f"eq.{category}"
         
-        # Apply search filter (basic implementation)
+        # Apply full-text search filter on title and content
         if search:
-            filters['title'] = f"ilike.*{search}*"
+            filters['search_vector'] = f"wfts(english).{search}"
         
         # Apply pagination
         filters['limit'] = limit
@@ -161,8 +182,8 @@ def get_articles():
             article = {
                 'id': row['id'],
                 'title': row['title'],
-                'content': row['content'][:200] + '...' if len(row['content']) > 200 else row['content'],
-                'excerpt': row['content'][:200] + '...' if len(row['content']) > 200 else row['content'],
+                'content': format_excerpt(row, 200),
+                'excerpt': format_excerpt(row, 200),
                 'category': row['article_type'],
                 'word_count': row['word_count'],
                 'created_at': row['created_at'],
@@ -178,7 +199,7 @@ def get_articles():
                     fixture.get('competition', 'Premier League')
                 ],
                 'author': 'Final Whistle AI',
-                'readTime': f"{max(1, row['word_count'] // 200)} min read",
+                'readTime': format_read_time(row),
                 'featured': False
             }
             
@@ -224,7 +245,7 @@ def get_latest_gameweek_match_reports():
         
         # Get all match reports for this gameweek
         select_clause = (
-            "id,title,content,article_type,word_count,created_at,"
+            "id,title,excerpt,read_time,article_type,word_count,created_at,"
             "fixtures!inner(id,home_team,away_team,match_date,match_time,home_score,away_score,competition,venue,matchday)"
         )
         
@@ -252,7 +273,7 @@ def get_latest_gameweek_match_reports():
             match_report = {
                 'id': row['id'],
                 'title': row['title'],
-                'excerpt': row['content'][:250] + '...' if len(row['content']) > 250 else row['content'],
+                'excerpt': format_excerpt(row, 250),
                 'category': 'Match Reports',
                 'word_count': row['word_count'],
                 'created_at': row['created_at'],
@@ -276,7 +297,7 @@ def get_latest_gameweek_match_reports():
                     fixture.get('competition', 'Premier League')
                 ],
                 'author': 'Final Whistle AI',
-                'readTime': f"{max(1, row['word_count'] // 200)} min read",
+                'readTime': format_read_time(row),
                 'image': f"/api/placeholder/400/250"
             }
             
@@ -0,0 +1,408 @@
+#!/usr/bin/env python3
+"""
+Football Focus API - ASGI entry point
+Serves the read endpoints with an async Supabase client so independent queries
+run concurrently over one shared connection pool. Every other route is handed
+to the Flask app in app.py, so both entry points expose the same API.
+
+Run with: hypercorn asgi_app:application --bind 0.0.0.0:5000
+"""
+
+import asyncio
+import logging
+import os
+from datetime import datetime, timedelta
+from functools import wraps
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from asgiref.wsgi import WsgiToAsgi
+from quart import Quart, Response, jsonify, request
+from supabase import AsyncClient, AsyncClientOptions, acreate_client
+
+import app as flask_app
+from app import (
+    FEATURED_ARTICLE_COLUMNS, MATCH_REPORT_COLUMNS, STRIP_CARD_COLUMNS, TRENDING_COLUMNS,
+    build_category_list, build_featured_article, build_gameweek_summary, build_match_reports,
+    build_stats, build_strip_cards, build_trending_topics, cacheable_headers,
+    get_article_image_urls, get_image_bucket_listing, is_connection_error, response_cache, retry_policy
+)
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+app = Quart(__name__)
+
+# Async Supabase client, created once the event loop is running
+db: Optional[AsyncClient] = None
+
+@app.before_serving
+async def create_db_client():
+    """Create the shared async Supabase client"""
+    global db
+    db = await acreate_client(
+        os.getenv('SUPABASE_URL'),
+        os.getenv('SUPABASE_KEY'),
+        options=AsyncClientOptions(postgrest_client_timeout=Config.HTTP_READ_TIMEOUT)
+    )
+    logger.info("✅ Async Supabase client initialized")
+
+@app.after_request
+async def add_cors_headers(response):
+    """Allow all origins, like CORS(app) in the Flask app"""
+    response.headers.setdefault('Access-Control-Allow-Origin', '*')
+    return response
+
+async def execute(build_query: Callable[[], Any]) -> Any:
+    """Execute a query built by build_query, retrying dropped connections with backoff"""
+    return await retry_policy.run_async(lambda: build_query().execute(), is_connection_error)
+
+def get_image_size(default: str) -> str:
+    """Get the image size requested with the image_size query parameter"""
+    size = request.args.get('image_size', default)
+    return size if size in Config.IMAGE_SIZES else default
+
+async def warm_image_listing():
+    """Refresh the storage listing in a thread while the article query runs"""
+    await asyncio.to_thread(get_image_bucket_listing)
+
+def make_cache_key(route_name: str) -> tuple:
+    """Build the same cache key as app.make_cache_key so both apps share entries and invalidation"""
+    args = sorted(
+        (key.strip().lower(), value.strip())
+        for key, values in request.args.lists()
+        for value in values
+        if value.strip()
+    )
+    return (route_name, request.path, tuple(args))
+
+def cached_response(route_name: str):
+    """Async counterpart of app.cached_response, backed by the same response cache"""
+    ttl = Config.cache_timeout_for(route_name)
+
+    def decorator(view):
+        @wraps(view)
+        async def wrapper(*args, **kwargs):
+            async def render():
+                response = await app.make_response(await view(*args, **kwargs))
+                return response.status_code, await response.get_data(), cacheable_headers(response)
+
+            (status, body, headers), outcome = await response_cache.get_or_compute_async(
+                make_cache_key(route_name),
+                render,
+                ttl=ttl,
+                cacheable=lambda rendered: rendered[0] == 200
+            )
+
+            response = Response(body, status=status, headers=list(headers))
+            response.headers['X-Cache'] = outcome.upper()
+            return response
+
+        return wrapper
+
+    return decorator
+
+async def resolve_latest_matchday() -> Tuple[Optional[int], Optional[Dict[str, Any]]]:
+    """Async version of app.resolve_latest_matchday"""
+    try:
+        result = await execute(lambda: db.table('gameweek_summary').select('*').or_(
+            'is_latest.eq.true,completed_matches.gt.0'
+        ).order('is_latest', desc=True).order('matchday', desc=True).limit(1))
+        if result.data:
+            return result.data[0]['matchday'], result.data[0]
+    except Exception as e:
+        logger.warning(f"gameweek_summary lookup failed, scanning fixtures instead: {e}")
+
+    latest_fixture = await execute(lambda: db.table('fixtures').select(
+        'matchday, match_date, generated_articles!inner(fixture_id)'
+    ).order('match_date', desc=True).limit(1))
+    if latest_fixture.data:
+        return latest_fixture.data[0]['matchday'], None
+
+    result = await execute(lambda: db.table('fixtures').select(
+        'matchday'
+    ).not_.is_('home_score', 'null').order('matchday', desc=True).limit(1))
+    return (result.data[0]['matchday'] if result.data else None), None
+
+async def fetch_match_reports(matchday: int) -> list:
+    """Fetch the match report rows for a gameweek"""
+    result = await execute(lambda: db.table('generated_articles').select(
+        MATCH_REPORT_COLUMNS
+    ).eq('fixtures.matchday', matchday).eq('article_type', 'match_report').order(
+        'match_date', desc=False, foreign_table='fixtures'
+    ))
+    return result.data
+
+@app.route('/health', methods=['GET'])
+async def health_check():
+    """Health check endpoint"""
+    return jsonify({
+        'status': 'healthy',
+        'message': 'Football Focus API is running',
+        'timestamp': datetime.now().isoformat()
+    })
+
+@app.route('/api/categories', methods=['GET'])
+@cached_response('categories')
+async def get_categories():
+    """Get all available article categories with counts"""
+    try:
+        result = await execute(lambda: db.rpc('get_article_categories_with_counts'))
+
+        if not result.data:
+            # Fallback: get distinct categories manually
+            result = await execute(lambda: db.table('generated_articles').select('article_type'))
+            categories_data = {}
+            for row in result.data:
+                category = row['article_type']
+                categories_data[category] = categories_data.get(category, 0) + 1
+        else:
+            categories_data = {row['article_type']: row['count'] for row in result.data}
+
+        return jsonify({
+            'success': True,
+            'data': build_category_list(categories_data)
+        })
+
+    except Exception as e:
+        logger.error(f"Error retrieving categories: {e}")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/trending', methods=['GET'])
+@cached_response('trending')
+async def get_trending():
+    """Get trending topics based on recent articles"""
+    try:
+        week_ago = (datetime.now() - timedelta(days=7)).isoformat()
+        result = await execute(lambda: db.table('generated_articles').select(
+            TRENDING_COLUMNS
+        ).gte('created_at', week_ago).limit(10))
+
+        return jsonify({
+            'success': True,
+            'data': build_trending_topics(result.data)
+        })
+
+    except Exception as e:
+        logger.error(f"Error retrieving trending topics: {e}")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/featured', methods=['GET'])
+@cached_response('featured')
+async def get_featured_article():
+    """Get the most recent featured article"""
+    try:
+        result, _ = await asyncio.gather(
+            execute(lambda: db.table('generated_articles').select(
+                FEATURED_ARTICLE_COLUMNS
+            ).order('created_at', desc=True).limit(1)),
+            warm_image_listing()
+        )
+
+        if not result.data:
+            return jsonify({
+                'success': False,
+                'error': 'No featured article found'
+            }), 404
+
+        row = result.data[0]
+        image_urls = await asyncio.to_thread(get_article_image_urls, [row['id']], get_image_size('hero'))
+
+        return jsonify({
+            'success': True,
+            'data': build_featured_article(row, image_urls[row['id']])
+        })
+
+    except Exception as e:
+        logger.error(f"Error retrieving featured article: {e}")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/gameweek/latest', methods=['GET'])
+@cached_response('gameweek')
+async def get_latest_gameweek_match_reports():
+    """Get match reports for the latest completed gameweek"""
+    try:
+        (latest_matchday, summary_row), _ = await asyncio.gather(resolve_latest_matchday(), warm_image_listing())
+
+        if latest_matchday is None:
+            return jsonify({
+                'success': False,
+                'error': 'No completed gameweeks found'
+            }), 404
+
+        rows = await fetch_match_reports(latest_matchday)
+        image_urls = await asyncio.to_thread(
+            get_article_image_urls, [row['id'] for row in rows], get_image_size('card')
+        )
+        match_reports = build_match_reports(rows, image_urls)
+
+        return jsonify({
+            'success': True,
+            'data': {
+                'matchday': latest_matchday,
+                'match_reports': match_reports,
+                'summary': build_gameweek_summary(match_reports, summary_row)
+            }
+        })
+
+    except Exception as e:
+        logger.error(f"Error retrieving latest gameweek match reports: {e}")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/gameweek/<int:matchday>', methods=['GET'])
+@cached_response('gameweek')
+async def get_gameweek_match_reports(matchday):
+    """Get match reports for a specific gameweek"""
+    try:
+        rows, _ = await asyncio.gather(fetch_match_reports(matchday), warm_image_listing())
+
+        if not rows:
+            return jsonify({
+                'success': False,
+                'error': f'No match reports found for matchday {matchday}'
+            }), 404
+
+        image_urls = await asyncio.to_thread(
+            get_article_image_urls, [row['id'] for row in rows], get_image_size('card')
+        )
+        match_reports = build_match_reports(rows, image_urls)
+
+        return jsonify({
+            'success': True,
+            'data': {
+                'matchday': matchday,
+                'match_reports': match_reports,
+                'summary': build_gameweek_summary(match_reports)
+            }
+        })
+
+    except Exception as e:
+        logger.error(f"Error retrieving gameweek {matchday} match reports: {e}")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/gameweek/strip', methods=['GET'])
+@cached_response('gameweek')
+async def get_gameweek_strip():
+    """Get one match report per fixture for latest gameweek - optimized for horizontal strip display"""
+    try:
+        (latest_matchday, _), _ = await asyncio.gather(resolve_latest_matchday(), warm_image_listing())
+
+        if latest_matchday is None:
+            return jsonify({
+                'success': False,
+                'error': 'No completed gameweeks found'
+            }), 404
+
+        result = await execute(lambda: db.table('generated_articles').select(
+            STRIP_CARD_COLUMNS
+        ).eq('fixtures.matchday', latest_matchday).eq('article_type', 'match_report').order(
+            'match_date', desc=False, foreign_table='fixtures'
+        ))
+        image_urls = await asyncio.to_thread(
+            get_article_image_urls, [row['id'] for row in result.data], get_image_size('strip')
+        )
+        strip_cards = build_strip_cards(result.data, image_urls)
+
+        return jsonify({
+            'success': True,
+            'data': {
+                'matchday': latest_matchday,
+                'total_matches': len(strip_cards),
+                'strip_cards': strip_cards
+            }
+        })
+
+    except Exception as e:
+        logger.error(f"Error retrieving gameweek strip data: {e}")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/stats', methods=['GET'])
+@cached_response('stats')
+async def get_stats():
+    """Get general statistics about the blog, running the four lookups concurrently"""
+    try:
+        week_ago = (datetime.now() - timedelta(days=7)).isoformat()
+
+        async def count(build_query: Callable[[], Any]) -> int:
+            result = await execute(build_query)
+            return result.count or 0
+
+        async def latest_gameweek() -> int:
+            try:
+                result = await execute(lambda: db.table('gameweek_summary').select('matchday').gt(
+                    'completed_matches', 0
+                ).order('matchday', desc=True).limit(1))
+            except Exception as e:
+                logger.warning(f"gameweek_summary lookup failed, scanning fixtures instead: {e}")
+                result = await execute(lambda: db.table('fixtures').select('matchday').not_.is_(
+                    'home_score', 'null'
+                ).order('matchday', desc=True).limit(1))
+            return result.data[0]['matchday'] if result.data else 0
+
+        total_articles, total_fixtures, recent_count, latest = await asyncio.gather(
+            count(lambda: db.table('generated_articles').select('id', count='exact')),
+            count(lambda: db.table('fixture_processing_status').select('id', count='exact').eq(
+                'processing_status', 'completed'
+            )),
+            count(lambda: db.table('generated_articles').select('id', count='exact').gte('created_at', week_ago)),
+            latest_gameweek()
+        )
+
+        return jsonify({
+            'success': True,
+            'data': build_stats(total_articles, total_fixtures, recent_count, latest)
+        })
+
+    except Exception as e:
+        logger.error(f"Error retrieving stats: {e}")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/cache/stats', methods=['GET'])
+async def get_cache_stats():
+    """Get response cache hit/miss counters"""
+    return jsonify({
+        'success': True,
+        'data': response_cache.stats()
+    })
+
+# Routes without an async version are served by the Flask app in a thread pool
+flask_fallback = WsgiToAsgi(flask_app.app)
+
+def serves_natively(scope: Dict[str, Any]) -> bool:
+    """Check whether the async app has a route for this request"""
+    return app.url_map.bind('localhost').test(scope['path'], scope['method'])
+
+async def application(scope, receive, send):
+    """ASGI entry point: async routes first, Flask for everything else"""
+    if scope['type'] == 'http' and not serves_natively(scope):
+        await flask_fallback(scope, receive, send)
+    else:
+        await app(scope, receive, send)
+
+if __name__ == '__main__':
+    from hypercorn.asyncio import serve
+    from hypercorn.config import Config as HypercornConfig
+
+    hypercorn_config = HypercornConfig()
+    hypercorn_config.bind = [f"0.0.0.0:{int(os.getenv('PORT', 5000))}"]
+    asyncio.run(serve(application, hypercorn_config))
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Cache invalidation subscribers for Football Focus API
+Receives the JSON events published by the fixture service (see
+crew_ai/fixture_service/invalidation.py) and hands them to a callback.
+"""
+
+import json
+import logging
+import os
+import socket
+import threading
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+EventHandler = Callable[[Dict[str, Any]], None]
+
+class InvalidationSubscriber:
+    """Base subscriber that runs a daemon thread delivering events to a handler"""
+
+    def __init__(self, path: str, handler: EventHandler):
+        self.path = path
+        self.handler = handler
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+    def start(self):
+        """Start receiving events in the background"""
+        self._thread = threading.Thread(target=self._run, name=self.__class__.__name__, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop receiving events"""
+        self._stopped.set()
+
+    def _run(self):
+        raise NotImplementedError
+
+    def _dispatch(self, raw: str):
+        """Decode one event and pass it to the handler"""
+        raw = raw.strip()
+        if not raw:
+            return
+        try:
+            event = json.loads(raw)
+        except json.JSONDecodeError:
+            logger.warning(f"Ignoring malformed invalidation event: {raw[:200]}")
+            return
+        try:
+            self.handler(event)
+        except Exception as e:
+            logger.error(f"Error handling invalidation event {event}: {e}")
+
+class FileInvalidationSubscriber(InvalidationSubscriber):
+    """
+    Tails the JSON-lines file written by the fixture service
+
+    Every worker process can tail the same file, so this works with multi-worker servers.
+    """
+
+    def __init__(self, path: str, handler: EventHandler, poll_interval: float = 1.0):
+        super().__init__(path, handler)
+        self.poll_interval = poll_interval
+
+    def _run(self):
+        # Events written before we started can't affect an empty cache
+        position = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+
+        while not self._stopped.is_set():
+            try:
+                if os.path.exists(self.path):
+                    size = os.path.getsize(self.path)
+                    if size < position:
+                        # File was truncated or rotated
+                        position = 0
+                    if size > position:
+                        with open(self.path, 'rb') as f:
+                            f.seek(position)
+                            chunk = f.read()
+                        # Only consume complete lines; a partial line is picked up next time
+                        complete, newline, _ = chunk.rpartition(b'\n')
+                        if newline:
+                            position += len(complete) + 1
+                            for line in complete.split(b'\n'):
+                                self._dispatch(line.decode('utf-8', errors='replace'))
+            except Exception as e:
+                logger.error(f"Error reading invalidation file {self.path}: {e}")
+
+            self._stopped.wait(self.poll_interval)
+
+class UnixSocketInvalidationSubscriber(InvalidationSubscriber):
+    """
+    Receives datagrams on a Unix socket
+
+    Only one process can bind the socket, so use the file channel with multi-worker servers.
+    """
+
+    def _run(self):
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        try:
+            sock.bind(self.path)
+        except OSError as e:
+            logger.error(f"Could not bind invalidation socket {self.path}: {e}")
+            sock.close()
+            return
+        sock.settimeout(1.0)
+
+        try:
+            while not self._stopped.is_set():
+                try:
+                    data = sock.recv(65536)
+                except socket.timeout:
+                    continue
+                self._dispatch(data.decode('utf-8', errors='replace'))
+        finally:
+            sock.close()
+
+def start_invalidation_subscriber(channel_type: str, path: str, handler: EventHandler) -> Optional[InvalidationSubscriber]:
+    """
+    Start a subscriber for the configured channel
+
+    Args:
+        channel_type: 'none', 'file' or 'unix'
+        path: File or socket path shared with the fixture service
+        handler: Called with each decoded event dictionary
+
+    Returns:
+        The running subscriber, or None if invalidation is disabled
+    """
+    channel_type = (channel_type or 'none').lower()
+
+    if channel_type == 'file':
+        subscriber = FileInvalidationSubscriber(path, handler)
+    elif channel_type == 'unix':
+        subscriber = UnixSocketInvalidationSubscriber(path, handler)
+    else:
+        if channel_type != 'none':
+            logger.error(f"Unknown invalidation channel '{channel_type}', invalidation disabled")
+        return None
+
+    subscriber.start()
+    logger.info(f"Listening for cache invalidation events on {channel_type}:{path}")
+    return subscriber
@@ -22,12 +22,70 @@ class Config:
     API_TITLE = 'Football Focus API'
     API_VERSION = '1.0.0'
     
+    # HTTP transport settings (connection pool and retries for Supabase requests)
+    HTTP_POOL_SIZE = int(os.getenv('HTTP_POOL_SIZE', '10'))
+    HTTP_CONNECT_TIMEOUT = float(os.getenv('HTTP_CONNECT_TIMEOUT', '3'))
+    HTTP_READ_TIMEOUT = float(os.getenv('HTTP_READ_TIMEOUT', '10'))
+    HTTP_MAX_RETRIES = int(os.getenv('HTTP_MAX_RETRIES', '3'))
+    HTTP_BACKOFF_BASE = float(os.getenv('HTTP_BACKOFF_BASE', '0.2'))  # seconds
+    HTTP_BACKOFF_MAX = float(os.getenv('HTTP_BACKOFF_MAX', '5'))  # seconds
+    HTTP2_ENABLED = os.getenv('HTTP2_ENABLED', 'true').lower() == 'true'
+    
     # Pagination defaults
     DEFAULT_PAGE_SIZE = 10
     MAX_PAGE_SIZE = 100
     
     # Cache settings
-    CACHE_TIMEOUT = 3600  # 60 minutes
+    CACHE_TIMEOUT = int(os.getenv('CACHE_TIMEOUT', '3600'))  # 60 minutes
+    CACHE_MAX_ENTRIES = int(os.getenv('CACHE_MAX_ENTRIES', '512'))
+    CACHE_ROUTE_TIMEOUTS = {
+        'featured': 300,
+        'trending': 900,
+        'categories': 3600,
+        'stats': 300,
+        'gameweek': 600,
+        'search': 300
+    }
+    
+    # Search settings
+    SEARCH_ENGINE = os.getenv('SEARCH_ENGINE', 'auto')  # auto (Postgres, falling back to local), postgres, local
+    SEARCH_FALLBACK_DIR = os.getenv(
+        'SEARCH_FALLBACK_DIR',
+        os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'crew_ai', 'generated_articles')
+    )
+    
+    # Cache invalidation settings (must match the fixture service's settings)
+    INVALIDATION_CHANNEL = os.getenv('INVALIDATION_CHANNEL', 'none')  # none, file, unix
+    INVALIDATION_PATH = os.getenv('INVALIDATION_PATH', '/tmp/final_whistle_invalidation')
+    # With invalidation events, entries only need to expire as a safety net
+    CACHE_INVALIDATED_TIMEOUT = int(os.getenv('CACHE_INVALIDATED_TIMEOUT', '21600'))  # 6 hours
+    
+    @classmethod
+    def cache_timeout_for(cls, route_name: str) -> int:
+        """Get the response cache TTL for a route"""
+        timeout = cls.CACHE_ROUTE_TIMEOUTS.get(route_name, cls.CACHE_TIMEOUT)
+        if cls.INVALIDATION_CHANNEL.lower() != 'none':
+            timeout = max(timeout, cls.CACHE_INVALIDATED_TIMEOUT)
+        return timeout
+    
+    # Placeholder image settings
+    PLACEHOLDER_FONT = os.getenv('PLACEHOLDER_FONT', 'arial.ttf')
+    PLACEHOLDER_MIN_SIZE = 16
+    PLACEHOLDER_MAX_SIZE = 2000
+    PLACEHOLDER_CACHE_ENTRIES = int(os.getenv('PLACEHOLDER_CACHE_ENTRIES', '64'))
+    STATIC_CACHE_MAX_AGE = 31536000  # 1 year, for responses that never change
+    
+    # Local image serving settings (api/images/)
+    STATIC_IMAGE_MAX_AGE = int(os.getenv('STATIC_IMAGE_MAX_AGE', '86400'))  # 1 day, files can be regenerated
+    STATIC_SENDFILE = os.getenv('STATIC_SENDFILE', 'none')  # none, x-accel (nginx) or x-sendfile
+    STATIC_ACCEL_PREFIX = os.getenv('STATIC_ACCEL_PREFIX', '/_protected_images/')
+    
+    # Storage settings
+    IMAGE_BUCKET = 'article-images'
+    IMAGE_LISTING_TTL = int(os.getenv('IMAGE_LISTING_TTL', '300'))  # 5 minutes
+    IMAGE_LISTING_MISS_REFRESH = int(os.getenv('IMAGE_LISTING_MISS_REFRESH', '30'))  # seconds
+    IMAGE_LISTING_PAGE_SIZE = 1000
+    IMAGE_SIZES = ('strip', 'card', 'hero')  # Derivatives written by the fixture service (image_derivatives.py)
     
     @classmethod
     def validate_config(cls) -> Dict[str, Any]:
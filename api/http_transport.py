@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Pooled HTTP transport for the Supabase REST API
+Keeps connections alive between requests (HTTP/2 when httpx and h2 are
+installed, otherwise a pooled requests session) and retries transient
+failures with jittered exponential backoff.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import httpx
+    import h2  # noqa: F401 - httpx needs h2 for HTTP/2
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Status codes worth retrying: rate limiting and gateway/overload errors
+RETRYABLE_STATUS_CODES = {429, 502, 503, 504}
+
+# Methods that are safe to send twice
+IDEMPOTENT_METHODS = {'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'}
+
+class TransportError(Exception):
+    """Raised when a request fails after all retries"""
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+class RetryPolicy:
+    """Bounded retries with full-jitter exponential backoff"""
+
+    def __init__(self, max_retries: int = 3, backoff_base: float = 0.2, backoff_max: float = 5.0):
+        """
+        Initialize the retry policy
+
+        Args:
+            max_retries: Number of retries after the first attempt
+            backoff_base: Backoff ceiling in seconds for the first retry, doubled on each retry
+            backoff_max: Maximum backoff in seconds
+        """
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Get the number of seconds to wait before retry number `attempt` (starting at 1)
+
+        A server-provided Retry-After is honoured up to backoff_max.
+        """
+        if retry_after is not None:
+            return min(retry_after, self.backoff_max)
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+
+    def run(self, operation: Callable[[], Any], is_retryable: Callable[[Exception], bool],
+            on_retry: Optional[Callable[[int, Exception], None]] = None) -> Any:
+        """
+        Call an operation, retrying it while it raises retryable errors
+
+        Args:
+            operation: Zero-argument callable to run
+            is_retryable: Decides whether an exception is transient
+            on_retry: Called with (attempt, error) before each retry, e.g. to reconnect
+        """
+        attempt = 0
+        while True:
+            try:
+                return operation()
+            except Exception as e:
+                if attempt >= self.max_retries or not is_retryable(e):
+                    raise
+                attempt += 1
+                delay = self.delay(attempt, getattr(e, 'retry_after', None))
+                logger.warning(f"Transient error ({e}), retry {attempt}/{self.max_retries} in {delay:.2f}s")
+                if on_retry:
+                    on_retry(attempt, e)
+                time.sleep(delay)
+
+    async def run_async(self, operation: Callable[[], Awaitable[Any]], is_retryable: Callable[[Exception], bool]) -> Any:
+        """Async variant of run() that awaits the operation and sleeps without blocking the event loop"""
+        attempt = 0
+        while True:
+            try:
+                return await operation()
+            except Exception as e:
+                if attempt >= self.max_retries or not is_retryable(e):
+                    raise
+                attempt += 1
+                delay = self.delay(attempt, getattr(e, 'retry_after', None))
+                logger.warning(f"Transient error ({e}), retry {attempt}/{self.max_retries} in {delay:.2f}s")
+                await asyncio.sleep(delay)
+
+class _RetryableStatus(Exception):
+    """Internal signal for a response whose status code should be retried"""
+
+    def __init__(self, response: Any, retry_after: Optional[float]):
+        super().__init__(f"HTTP {response.status_code}")
+        self.response = response
+        self.retry_after = retry_after
+
+class PooledTransport:
+    """
+    Keep-alive HTTP client shared by every request to one base URL
+
+    Uses an HTTP/2 httpx client when available (many requests multiplexed over
+    one connection), otherwise a requests session with a fixed-size connection pool.
+    """
+
+    def __init__(self, base_url: str, headers: Optional[Dict[str, str]] = None, pool_size: int = 10,
+                 connect_timeout: float = 3.0, read_timeout: float = 10.0,
+                 retry_policy: Optional[RetryPolicy] = None, http2: bool = True):
+        """
+        Initialize the transport
+
+        Args:
+            base_url: URL that request paths are relative to
+            headers: Headers sent with every request
+            pool_size: Maximum number of kept-alive connections
+            connect_timeout: Seconds to wait for a connection
+            read_timeout: Seconds to wait for a response
+            retry_policy: Retry policy (default: RetryPolicy())
+            http2: Use HTTP/2 if httpx and h2 are installed
+        """
+        self.base_url = base_url.rstrip('/')
+        self.headers = dict(headers or {})
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.http2 = http2 and HTTP2_AVAILABLE
+
+        if self.http2:
+            self._client = httpx.Client(
+                http2=True,
+                headers=self.headers,
+                timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+                limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+            )
+            self._timeout: Any = None  # set on the client
+            self._errors: Tuple[type, ...] = (httpx.TransportError,)
+        else:
+            self._client = requests.Session()
+            self._client.headers.update(self.headers)
+            # Retries are handled here so they get jitter, not by urllib3
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0, pool_block=True)
+            self._client.mount('https://', adapter)
+            self._client.mount('http://', adapter)
+            self._timeout = (connect_timeout, read_timeout)
+            self._errors = (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+
+        logger.info(f"HTTP transport for {self.base_url}: {'HTTP/2 (httpx)' if self.http2 else 'HTTP/1.1 (requests)'}, "
+                    f"pool size {pool_size}")
+
+    def request(self, method: str, path: str, params: Optional[Dict[str, Any]] = None,
+                json: Any = None, headers: Optional[Dict[str, str]] = None) -> Any:
+        """
+        Send a request, retrying connection errors and retryable statuses for idempotent methods
+
+        Returns:
+            The response object (requests.Response or httpx.Response)
+
+        Raises:
+            TransportError: If the request fails or returns an error status
+        """
+        method = method.upper()
+        url = f"{self.base_url}/{path.lstrip('/')}"
+        retryable_method = method in IDEMPOTENT_METHODS
+
+        def send():
+            kwargs = {'params': params, 'json': json, 'headers': headers}
+            if self._timeout is not None:
+                kwargs['timeout'] = self._timeout
+            response = self._client.request(method, url, **kwargs)
+            if retryable_method and response.status_code in RETRYABLE_STATUS_CODES:
+                raise _RetryableStatus(response, self._retry_after(response))
+            return response
+
+        def is_retryable(error: Exception) -> bool:
+            return retryable_method and isinstance(error, (_RetryableStatus,) + self._errors)
+
+        try:
+            response = self.retry_policy.run(send, is_retryable)
+        except _RetryableStatus as e:
+            response = e.response
+        except self._errors as e:
+            raise TransportError(f"{method} {url} failed: {e}") from e
+
+        if response.status_code >= 400:
+            raise TransportError(f"{method} {url} returned HTTP {response.status_code}: {response.text[:200]}",
+                                 status_code=response.status_code)
+        return response
+
+    def get(self, path: str, params: Optional[Dict[str, Any]] = None, **kwargs) -> Any:
+        """Send a GET request"""
+        return self.request('GET', path, params=params, **kwargs)
+
+    def close(self):
+        """Close all pooled connections"""
+        self._client.close()
+
+    @staticmethod
+    def _retry_after(response: Any) -> Optional[float]:
+        """Read a Retry-After header given in seconds"""
+        value = response.headers.get('Retry-After')
+        try:
+            return float(value) if value is not None else None
+        except ValueError:
+            return None
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Placeholder images for Football Focus API
+Renders the "No Image" placeholder once per (width, height, format) and keeps
+the encoded bytes in a bounded LRU cache, so serving one is a memory copy.
+"""
+
+import hashlib
+import io
+import logging
+from typing import Tuple
+
+from PIL import Image, ImageDraw, ImageFont, features
+
+from response_cache import ResponseCache
+
+logger = logging.getLogger(__name__)
+
+BACKGROUND_COLOR = '#1e40af'  # Blue background
+TEXT_COLOR = 'white'
+TEXT = "No Image"
+
+MIMETYPES = {
+    'JPEG': 'image/jpeg',
+    'WEBP': 'image/webp'
+}
+
+# Rendered bytes never change, so entries only leave the cache through LRU eviction
+ONE_YEAR = 365 * 24 * 60 * 60
+
+def load_font(font_path: str, size: int = 20) -> ImageFont.ImageFont:
+    """Load the placeholder font, falling back to PIL's built-in font"""
+    try:
+        return ImageFont.truetype(font_path, size)
+    except OSError:
+        logger.info(f"Font {font_path} not found, using the default placeholder font")
+        return ImageFont.load_default()
+
+class PlaceholderImages:
+    """Bounded cache of encoded placeholder images"""
+
+    def __init__(self, font_path: str = 'arial.ttf', min_size: int = 16, max_size: int = 2000,
+                 max_entries: int = 64):
+        """
+        Initialize the placeholder cache
+
+        Args:
+            font_path: TrueType font for the placeholder text, loaded once here
+            min_size: Smallest width/height rendered; smaller requests are clamped up
+            max_size: Largest width/height rendered; larger requests are clamped down
+            max_entries: Maximum number of encoded images kept in memory
+        """
+        self.font = load_font(font_path)
+        self.min_size = min_size
+        self.max_size = max_size
+        self.webp_supported = features.check('webp')
+        self._cache = ResponseCache(max_entries=max_entries, default_ttl=ONE_YEAR)
+
+    def clamp(self, width: int, height: int) -> Tuple[int, int]:
+        """Clamp requested dimensions to the supported range"""
+        return (
+            max(self.min_size, min(width, self.max_size)),
+            max(self.min_size, min(height, self.max_size))
+        )
+
+    def get(self, width: int, height: int, image_format: str = 'JPEG') -> Tuple[bytes, str, str]:
+        """
+        Get an encoded placeholder image
+
+        Args:
+            width: Requested width in pixels
+            height: Requested height in pixels
+            image_format: 'JPEG' or 'WEBP' (falls back to JPEG if WebP is unsupported)
+
+        Returns:
+            Tuple of (image bytes, ETag, mimetype)
+        """
+        if image_format not in MIMETYPES or (image_format == 'WEBP' and not self.webp_supported):
+            image_format = 'JPEG'
+        width, height = self.clamp(width, height)
+
+        (data, etag), _ = self._cache.get_or_compute(
+            (width, height, image_format),
+            lambda: self._render(width, height, image_format)
+        )
+        return data, etag, MIMETYPES[image_format]
+
+    def stats(self):
+        """Get cache counters"""
+        return self._cache.stats()
+
+    def _render(self, width: int, height: int, image_format: str) -> Tuple[bytes, str]:
+        """Draw and encode a placeholder image"""
+        img = Image.new('RGB', (width, height), color=BACKGROUND_COLOR)
+
+        # Center the text
+        draw = ImageDraw.Draw(img)
+        bbox = draw.textbbox((0, 0), TEXT, font=self.font)
+        text_width = bbox[2] - bbox[0]
+        text_height = bbox[3] - bbox[1]
+        draw.text(((width - text_width) // 2, (height - text_height) // 2), TEXT, fill=TEXT_COLOR, font=self.font)
+
+        img_buffer = io.BytesIO()
+        img.save(img_buffer, format=image_format, quality=85)
+        data = img_buffer.getvalue()
+        return data, hashlib.sha1(data).hexdigest()[:16]
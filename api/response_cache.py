@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+In-process response cache for the Football Focus API
+Bounded LRU with per-entry TTLs, single-flight computation and hit/miss counters
+"""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+class _Flight:
+    """A computation in progress that other requests for the same key can wait on"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU cache with per-entry expiry
+
+    Concurrent misses on the same key are coalesced: the first caller computes
+    the value while the others wait for it, so a cold key hits the database once.
+    A value whose computation overlapped an invalidation is returned but not
+    stored, since it may have been read before the change.
+    """
+
+    def __init__(self, max_entries: int = 512, default_ttl: int = 3600):
+        """
+        Initialize the cache
+
+        Args:
+            max_entries: Maximum number of entries kept before evicting the least recently used
+            default_ttl: Time to live in seconds for entries stored without an explicit TTL
+        """
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._async_flights: Dict[Hashable, asyncio.Future] = {}
+        self._lock = threading.Lock()
+        # Bumped by invalidate() and clear(), so computations that overlap one aren't stored
+        self._generation = 0
+        self._counters = {
+            'hits': 0,
+            'misses': 0,
+            'coalesced': 0,
+            'evictions': 0,
+            'expirations': 0,
+            'invalidations': 0,
+            'stale_discards': 0
+        }
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """
+        Look up a key without computing it
+
+        Returns:
+            Tuple of (found, value)
+        """
+        with self._lock:
+            found, value = self._lookup(key)
+            if not found:
+                self._counters['misses'] += 1
+            return found, value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[int] = None):
+        """Store a value under a key"""
+        with self._lock:
+            self._store(key, value, ttl)
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any], ttl: Optional[int] = None,
+                       cacheable: Callable[[Any], bool] = lambda value: True) -> Tuple[Any, str]:
+        """
+        Return the cached value for a key, computing it once if missing
+
+        Args:
+            key: Cache key
+            compute: Zero-argument callable producing the value
+            ttl: Time to live in seconds (default: the cache's default TTL)
+            cacheable: Predicate deciding whether a computed value may be stored
+
+        Returns:
+            Tuple of (value, outcome) where outcome is 'hit', 'miss' or 'coalesced'
+        """
+        with self._lock:
+            found, value = self._lookup(key)
+            if found:
+                return value, 'hit'
+
+            generation = self._generation
+            flight = self._flights.get(key)
+            if flight is None:
+                flight = _Flight()
+                self._flights[key] = flight
+                leader = True
+                self._counters['misses'] += 1
+            else:
+                leader = False
+                self._counters['coalesced'] += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value, 'coalesced'
+
+        try:
+            flight.value = compute()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                if flight.error is None and cacheable(flight.value):
+                    self._store_if_current(key, flight.value, ttl, generation)
+                self._flights.pop(key, None)
+            flight.done.set()
+
+        return flight.value, 'miss'
+
+    async def get_or_compute_async(self, key: Hashable, compute: Callable[[], Awaitable[Any]], ttl: Optional[int] = None,
+                                   cacheable: Callable[[Any], bool] = lambda value: True) -> Tuple[Any, str]:
+        """
+        Async variant of get_or_compute for callers on an event loop
+
+        Coalesced callers await the leader's result instead of blocking a thread.
+        """
+        with self._lock:
+            found, value = self._lookup(key)
+            if found:
+                return value, 'hit'
+
+            generation = self._generation
+            flight = self._async_flights.get(key)
+            if flight is None:
+                flight = asyncio.get_running_loop().create_future()
+                self._async_flights[key] = flight
+                leader = True
+                self._counters['misses'] += 1
+            else:
+                leader = False
+                self._counters['coalesced'] += 1
+
+        if not leader:
+            return await asyncio.shield(flight), 'coalesced'
+
+        try:
+            value = await compute()
+        except asyncio.CancelledError:
+            flight.cancel()
+            raise
+        except BaseException as e:
+            flight.set_exception(e)
+            flight.exception()  # Mark as retrieved in case nobody was waiting
+            raise
+        else:
+            flight.set_result(value)
+        finally:
+            with self._lock:
+                if not flight.cancelled() and flight.exception() is None and cacheable(value):
+                    self._store_if_current(key, value, ttl, generation)
+                self._async_flights.pop(key, None)
+
+        return value, 'miss'
+
+    def invalidate(self, predicate: Callable[[Hashable], bool]) -> int:
+        """
+        Remove every entry whose key matches a predicate
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            self._generation += 1
+            matching = [key for key in self._entries if predicate(key)]
+            for key in matching:
+                del self._entries[key]
+            self._counters['invalidations'] += len(matching)
+            return len(matching)
+
+    def clear(self):
+        """Remove all entries"""
+        with self._lock:
+            self._generation += 1
+            self._counters['invalidations'] += len(self._entries)
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache counters and current size"""
+        with self._lock:
+            lookups = self._counters['hits'] + self._counters['misses'] + self._counters['coalesced']
+            return {
+                **self._counters,
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'hit_rate': round(self._counters['hits'] / lookups, 3) if lookups else 0.0
+            }
+
+    def _lookup(self, key: Hashable) -> Tuple[bool, Any]:
+        """Find a live entry and mark it as recently used (caller holds the lock)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self._counters['expirations'] += 1
+            return False, None
+
+        self._entries.move_to_end(key)
+        self._counters['hits'] += 1
+        return True, value
+
+    def _store_if_current(self, key: Hashable, value: Any, ttl: Optional[int], generation: int):
+        """Store a computed value unless the cache was invalidated since it started (caller holds the lock)"""
+        if generation != self._generation:
+            self._counters['stale_discards'] += 1
+            return
+        self._store(key, value, ttl)
+
+    def _store(self, key: Hashable, value: Any, ttl: Optional[int]):
+        """Insert an entry and evict the least recently used ones (caller holds the lock)"""
+        ttl = self.default_ttl if ttl is None else ttl
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._counters['evictions'] += 1
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Local full-text search for Football Focus API
+In-memory inverted index over the markdown articles exported by the fixture
+service (crew_ai/generated_articles/), used when Postgres full-text search
+is not available.
+"""
+
+import html
+import math
+import os
+import re
+import threading
+import time
+from collections import Counter, defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+STOP_WORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'has', 'he', 'in', 'is',
+    'it', 'its', 'of', 'on', 'or', 'that', 'the', 'to', 'was', 'were', 'will', 'with', 'vs'
+}
+
+# Title matches count this many times more than body matches
+TITLE_WEIGHT = 3
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase search terms, dropping stop words"""
+    return [token for token in TOKEN_PATTERN.findall((text or '').lower()) if token not in STOP_WORDS]
+
+def parse_markdown_article(text: str) -> Dict[str, str]:
+    """
+    Parse an exported markdown article into its front matter fields and body
+
+    Returns:
+        Dictionary of front matter fields plus 'content'
+    """
+    lines = [line.strip() for line in text.splitlines()]
+    article: Dict[str, str] = {}
+
+    # Front matter sits between the first two '---' lines
+    body_start = 0
+    if lines and lines[0] == '---':
+        for i, line in enumerate(lines[1:], start=1):
+            if line == '---':
+                body_start = i + 1
+                break
+            key, sep, value = line.partition(':')
+            if sep:
+                article[key.strip()] = value.strip().strip('"')
+
+    body = lines[body_start:]
+
+    # Drop the footer that follows the last '---' and the repeated title heading
+    if '---' in body:
+        body = body[:len(body) - 1 - body[::-1].index('---')]
+    body = [line for line in body if line != f"# {article.get('title', '')}"]
+
+    article['content'] = '\n'.join(body).strip()
+    return article
+
+def highlight(content: str, terms: List[str], max_words: int = 30) -> str:
+    """
+    Build an HTML snippet around the first matching term, wrapping matches in <mark> tags
+
+    Args:
+        content: Article content
+        terms: Query terms (already tokenized)
+        max_words: Number of words in the snippet
+    """
+    words = content.split()
+    if not words:
+        return ''
+
+    term_set = set(terms)
+
+    def is_match(word: str) -> bool:
+        return any(token in term_set for token in TOKEN_PATTERN.findall(word.lower()))
+
+    first_match = next((i for i, word in enumerate(words) if is_match(word)), 0)
+    start = max(0, first_match - max_words // 3)
+    window = words[start:start + max_words]
+
+    snippet = ' '.join(
+        f"<mark>{html.escape(word)}</mark>" if is_match(word) else html.escape(word) for word in window
+    )
+    if start > 0:
+        snippet = '... ' + snippet
+    if start + max_words < len(words):
+        snippet += ' ...'
+    return snippet
+
+class LocalSearchIndex:
+    """
+    Inverted index over a directory of exported markdown articles
+
+    Ranking is BM25 over title and body, with title terms weighted higher. The
+    directory is rescanned at most every `refresh_interval` seconds and the index
+    rebuilt only if files were added, removed or modified.
+    """
+
+    def __init__(self, directory: str, refresh_interval: int = 60):
+        self.directory = directory
+        self.refresh_interval = refresh_interval
+        self._documents: List[Dict[str, Any]] = []
+        self._postings: Dict[str, Dict[int, int]] = {}
+        self._doc_lengths: List[int] = []
+        self._avg_length = 0.0
+        self._signature: Optional[Tuple[int, float]] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def search(self, query: str, limit: int = 10, offset: int = 0) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Search the index, requiring every query term to match
+
+        Returns:
+            Tuple of (page of results, total number of matches)
+        """
+        self._refresh_if_stale()
+        terms = tokenize(query)
+        if not terms:
+            return [], 0
+
+        with self._lock:
+            postings = [self._postings.get(term, {}) for term in terms]
+            if any(not posting for posting in postings):
+                return [], 0
+
+            # Intersect starting from the rarest term
+            postings.sort(key=len)
+            candidates = set(postings[0])
+            for posting in postings[1:]:
+                candidates &= posting.keys()
+
+            doc_count = len(self._documents)
+            scored = []
+            for doc_id in candidates:
+                score = 0.0
+                length_norm = 1 - BM25_B + BM25_B * self._doc_lengths[doc_id] / (self._avg_length or 1)
+                for posting in postings:
+                    tf = posting[doc_id]
+                    idf = math.log(1 + (doc_count - len(posting) + 0.5) / (len(posting) + 0.5))
+                    score += idf * tf * (BM25_K1 + 1) / (tf + BM25_K1 * length_norm)
+                scored.append((score, doc_id))
+
+            # Best match first, newest first among equal scores
+            scored.sort(key=lambda item: (item[0], self._documents[item[1]].get('generated_date', '')), reverse=True)
+            page = scored[offset:offset + limit]
+
+            results = []
+            for score, doc_id in page:
+                document = self._documents[doc_id]
+                results.append({
+                    **{key: value for key, value in document.items() if key != 'content'},
+                    'rank': round(score, 4),
+                    'snippet': highlight(document['content'], terms)
+                })
+
+            return results, len(scored)
+
+    def _directory_signature(self) -> Tuple[int, float]:
+        """Summarize the directory contents so changes can be detected cheaply"""
+        count = 0
+        latest_mtime = 0.0
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.name.endswith('.md'):
+                    count += 1
+                    latest_mtime = max(latest_mtime, entry.stat().st_mtime)
+        return count, latest_mtime
+
+    def _refresh_if_stale(self):
+        """Rebuild the index if the directory changed since the last build"""
+        now = time.monotonic()
+        if self._signature is not None and now - self._checked_at < self.refresh_interval:
+            return
+        self._checked_at = now
+
+        if not os.path.isdir(self.directory):
+            return
+
+        signature = self._directory_signature()
+        if signature != self._signature:
+            self._build()
+            self._signature = signature
+
+    def _build(self):
+        """Read every markdown article and rebuild the postings"""
+        documents = []
+        postings: Dict[str, Dict[int, int]] = defaultdict(dict)
+        doc_lengths = []
+        folder = os.path.basename(os.path.normpath(self.directory))
+
+        for name in sorted(os.listdir(self.directory)):
+            if not name.endswith('.md'):
+                continue
+            try:
+                with open(os.path.join(self.directory, name), 'r', encoding='utf-8') as f:
+                    article = parse_markdown_article(f.read())
+            except (OSError, UnicodeDecodeError):
+                continue
+
+            doc_id = len(documents)
+            # Same relative path the fixture service stores in generated_articles.file_path
+            article['file_path'] = f"{folder}/{name}"
+            documents.append(article)
+
+            title_terms = tokenize(article.get('title', ''))
+            body_terms = tokenize(article['content'])
+            counts = Counter(body_terms)
+            for term in title_terms:
+                counts[term] += TITLE_WEIGHT
+            for term, tf in counts.items():
+                postings[term][doc_id] = tf
+            doc_lengths.append(len(body_terms) + TITLE_WEIGHT * len(title_terms))
+
+        with self._lock:
+            self._documents = documents
+            self._postings = dict(postings)
+            self._doc_lengths = doc_lengths
+            self._avg_length = sum(doc_lengths) / len(doc_lengths) if doc_lengths else 0.0
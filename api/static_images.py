@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Static image index for Football Focus API
+Keeps an in-memory index of the files in api/images/ with content-hash ETags,
+so requests are validated against known filenames and revalidated without
+touching the disk.
+"""
+
+import hashlib
+import mimetypes
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.webp', '.gif'}
+
+@dataclass(frozen=True)
+class StaticImage:
+    """Data class for an indexed image file"""
+    filename: str
+    path: str
+    size: int
+    mtime: float
+    etag: str
+    mimetype: str
+
+def hash_file(path: str, chunk_size: int = 65536) -> str:
+    """Compute a short content hash of a file for use as an ETag"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()[:32]
+
+class StaticImageIndex:
+    """
+    Index of the image files in one directory
+
+    The directory is rescanned at most every `refresh_interval` seconds, or
+    every `miss_refresh` seconds while unknown names are requested; only files
+    whose size or modification time changed are hashed again.
+    """
+
+    def __init__(self, directory: str, refresh_interval: int = 30, miss_refresh: float = 1.0):
+        self.directory = directory
+        self.refresh_interval = refresh_interval
+        self.miss_refresh = miss_refresh
+        self._images: Dict[str, StaticImage] = {}
+        self._checked_at = float('-inf')
+        self._lock = threading.Lock()
+
+    def lookup(self, filename: str) -> Optional[StaticImage]:
+        """
+        Find an indexed image by filename
+
+        Returns:
+            The image, or None if the name is not a file in the directory
+        """
+        self._refresh_if_older_than(self.refresh_interval)
+        image = self._images.get(filename)
+        if image is None:
+            # The file may have been written since the last scan
+            self._refresh_if_older_than(self.miss_refresh)
+            image = self._images.get(filename)
+        return image
+
+    def _refresh_if_older_than(self, max_age: float):
+        """Rescan the directory if the last scan is older than max_age seconds"""
+        if time.monotonic() - self._checked_at < max_age:
+            return
+
+        with self._lock:
+            if time.monotonic() - self._checked_at < max_age:
+                return
+            self._images = self._scan()
+            self._checked_at = time.monotonic()
+
+    def _scan(self) -> Dict[str, StaticImage]:
+        """Build the index, reusing ETags of unchanged files"""
+        if not os.path.isdir(self.directory):
+            return {}
+
+        images = {}
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if not entry.is_file() or os.path.splitext(entry.name)[1].lower() not in IMAGE_EXTENSIONS:
+                    continue
+
+                stat = entry.stat()
+                previous = self._images.get(entry.name)
+                if previous and (previous.size, previous.mtime) == (stat.st_size, stat.st_mtime):
+                    images[entry.name] = previous
+                    continue
+
+                try:
+                    etag = hash_file(entry.path)
+                except OSError:
+                    continue
+
+                images[entry.name] = StaticImage(
+                    filename=entry.name,
+                    path=entry.path,
+                    size=stat.st_size,
+                    mtime=stat.st_mtime,
+                    etag=etag,
+                    mimetype=mimetypes.guess_type(entry.name)[0] or 'application/octet-stream'
+                )
+
+        return images
@@ -62,6 +62,9 @@ class APITester:
         self.test_endpoint("/api/articles", params={'category': 'match_report'})
         self.test_endpoint("/api/articles", params={'search': 'Manchester'})
         
+        # Test search
+        self.test_endpoint("/api/search", params={'q': 'Manchester'})
+        
         # Test categories
         self.test_endpoint("/api/categories")
         
@@ -78,6 +81,9 @@ class APITester:
         self.test_endpoint("/api/gameweek/latest")
         self.test_endpoint("/api/gameweek/1")  # Test specific gameweek
         
+        # Test cache counters
+        self.test_endpoint("/api/cache/stats")
+        
         # Test specific article (might fail if no articles)
         articles_response = self.test_endpoint("/api/articles", params={'limit': 1})
         if articles_response.get('success') and articles_response.get('data'):
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Agent registry for the Crew AI workflow
+Building an Agent is expensive (prompt templates, tool schemas, executor
+setup) and every fixture and article needs the same handful of roles. The
+registry keeps pools of idle agents keyed by role and LLM configuration.
+A crew run checks agents out, so concurrent crews never share one, and
+returns them afterwards with their per-run state reset.
+
+    registry.register('writer', create_writer, llm_config=('gpt-4o-mini', 0.7))
+    writer = registry.acquire('writer')
+    try:
+        Crew(agents=[writer], ...).kickoff()
+    finally:
+        registry.release('writer', writer)
+"""
+
+import threading
+from typing import Any, Callable, Dict, Hashable, List, Tuple
+
+# Per-run state a crewai Agent keeps after a crew has used it, and its fresh value
+AGENT_RUN_STATE: Dict[str, Callable[[], Any]] = {
+    'crew': lambda: None,
+    'tools_results': list,
+    '_rpm_controller': lambda: None,
+    '_times_executed': lambda: 0,
+}
+
+def reset_agent(agent: Any):
+    """Clear the state a crew run leaves on an agent, so the next crew starts clean"""
+    for name, fresh in AGENT_RUN_STATE.items():
+        if hasattr(agent, name):
+            setattr(agent, name, fresh())
+
+class AgentRegistry:
+    """Thread-safe pools of reusable agents keyed by role and LLM configuration"""
+
+    def __init__(self, max_idle: int = 8, reset: Callable[[Any], None] = reset_agent):
+        """
+        Initialize the registry
+
+        Args:
+            max_idle: Idle agents kept per role; extra returned agents are dropped
+            reset: Hook run on an agent when it is returned, before it is reused
+        """
+        self.max_idle = max_idle
+        self.reset = reset
+        self.created = 0
+        self.reused = 0
+        self._factories: Dict[str, Tuple[Hashable, Callable[[], Any]]] = {}
+        self._idle: Dict[Tuple[str, Hashable], List[Any]] = {}
+        self._lock = threading.Lock()
+
+    def register(self, role: str, factory: Callable[[], Any], llm_config: Hashable = None):
+        """
+        Register how to build the agent for a role
+
+        Re-registering a role with a different LLM configuration makes later
+        checkouts build new agents; idle agents built for the old one are dropped.
+        """
+        with self._lock:
+            previous = self._factories.get(role)
+            if previous and previous[0] != llm_config:
+                self._idle.pop((role, previous[0]), None)
+            self._factories[role] = (llm_config, factory)
+
+    def acquire(self, role: str) -> Any:
+        """Check out an idle agent for a role, building one if none is free"""
+        with self._lock:
+            llm_config, factory = self._factories[role]
+            idle = self._idle.get((role, llm_config))
+            if idle:
+                self.reused += 1
+                return idle.pop()
+            self.created += 1
+        return factory()
+
+    def release(self, role: str, agent: Any):
+        """Return a checked-out agent to its role's pool"""
+        self.reset(agent)
+        with self._lock:
+            idle = self._idle.setdefault((role, self._factories[role][0]), [])
+            if len(idle) < self.max_idle:
+                idle.append(agent)
+
+    def stats(self) -> Dict[str, int]:
+        """Get registry counters"""
+        with self._lock:
+            return {
+                'created': self.created,
+                'reused': self.reused,
+                'idle': sum(len(idle) for idle in self._idle.values())
+            }
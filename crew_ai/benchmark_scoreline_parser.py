@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Scoreline Parser Benchmark
+Standalone script to measure the accuracy and throughput of the deterministic
+scoreline parser against the labelled corpus in scoreline_corpus.json.
+
+Usage:
+    python benchmark_scoreline_parser.py [min_confidence]
+"""
+
+import json
+import os
+import sys
+import time
+
+# Add the crew directory to the path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from scoreline_parser import parse_scoreline
+
+CORPUS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scoreline_corpus.json')
+DEFAULT_MIN_CONFIDENCE = float(os.getenv("SCORE_PARSER_MIN_CONFIDENCE", "0.7"))
+ITERATIONS = 200
+
+def main():
+    """
+    Main function to run the scoreline parser benchmark
+    """
+    print("⚽ Scoreline Parser Benchmark")
+    print("=" * 50)
+
+    min_confidence = float(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_MIN_CONFIDENCE
+    with open(CORPUS_PATH, 'r', encoding='utf-8') as f:
+        corpus = json.load(f)
+
+    correct = wrong = deferred = 0
+    for case in corpus:
+        result = parse_scoreline(case['text'], case['home_team'], case['away_team'])
+        found = result.score if result else None
+        confident = result is not None and result.confidence >= min_confidence
+
+        if confident:
+            correct += found == case['expected']
+            wrong += found != case['expected']
+            status = "✅" if found == case['expected'] else "❌"
+        elif result is None and case['expected'] is None:
+            correct += 1
+            status = "✅"
+        else:
+            # Left to the LLM
+            deferred += 1
+            status = "🤖"
+
+        confidence = f"{result.confidence:.2f}" if result else "-"
+        print(f"{status} {case['name']}: parsed {found or 'none'} ({confidence}), expected {case['expected'] or 'none'}")
+
+    started = time.perf_counter()
+    for _ in range(ITERATIONS):
+        for case in corpus:
+            parse_scoreline(case['text'], case['home_team'], case['away_team'])
+    per_snippet = (time.perf_counter() - started) / (ITERATIONS * len(corpus))
+
+    print("\n" + "=" * 50)
+    print(f"📊 Corpus: {len(corpus)} snippets, minimum confidence {min_confidence:.2f}")
+    print(f"✅ Correct without the LLM: {correct}/{len(corpus)}")
+    print(f"❌ Confident but wrong: {wrong}")
+    print(f"🤖 Deferred to the LLM: {deferred}")
+    print(f"⚡ {per_snippet * 1e6:.1f} µs per snippet ({1 / per_snippet:,.0f} snippets/s)")
+    print("=" * 50)
+
+    if wrong:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
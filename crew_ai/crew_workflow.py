@@ -4,39 +4,123 @@ European Football Blog - Crew AI Workflow
 A scalable agent system for automated European football content creation
 """
 
+from __future__ import annotations
+
 import os
-from typing import List, Dict, Any
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Tuple
 from dotenv import load_dotenv
-from crewai import Agent, Task, Crew, Process
-from langchain_openai import ChatOpenAI
-from crewai_tools import SerperDevTool,WebsiteSearchTool
+from search_cache import SearchCache, cached_tool_class
+from scoreline_parser import parse_scoreline
+from agent_registry import AgentRegistry
 
+if TYPE_CHECKING:
+    from crewai import Agent
+    from supabase import Client
+    from llm_cache import LLMResponseCache
 
-# Load environment variables
-load_dotenv()
+# crewai, the search tools and supabase are imported where they are first used,
+# so importing this module (and the fixture service CLI with it) stays cheap and side-effect free.
+# The caches and tools below are created on first use by get_caches() and get_tools().
+llm_cache_mode = None
+llm_cache = None
+search_cache = None
+search_tool = None
+rag_tool = None
+_lazy_lock = threading.RLock()
 
-# Check for required API keys
-if not os.getenv("SERPER_API_KEY"):
-    print("❌ CRITICAL ERROR: SERPER_API_KEY not found!")
-    print("   The search tools will not work without this key.")
-    print("   Please add SERPER_API_KEY=your_key_here to your .env file")
-    print("   Get a free key from: https://serper.dev/")
-    exit(1)
+# Default cache location next to this module, wherever the workflow is started from
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache")
 
-# Instantiate tools
-search_tool = SerperDevTool()
+def validate_config():
+    """
+    Load environment variables and check the ones the workflow can't run without.
+    
+    Raises:
+        ValueError: If a required API key is missing
+    """
+    load_dotenv()
+    if not os.getenv("SERPER_API_KEY"):
+        raise ValueError("SERPER_API_KEY not found! The search tools will not work without this key. "
+                         "Please add SERPER_API_KEY=your_key_here to your .env file "
+                         "(get a free key from: https://serper.dev/)")
 
-# Initialize RAG tool with error handling for Docker environments
-try:
-    rag_tool = WebsiteSearchTool()
-except PermissionError:
-    # Fallback: Use only search_tool if RAG tool fails due to permissions
-    print("⚠️ Warning: WebsiteSearchTool initialization failed due to permissions. Using SerperDevTool only.")
-    rag_tool = search_tool
+def get_caches() -> Tuple[Optional[LLMResponseCache], Optional[SearchCache]]:
+    """
+    Get the LLM response cache and the search cache, creating them on first use.
+    
+    Returns:
+        Tuple of (llm_cache, search_cache); either is None when disabled
+    """
+    global llm_cache_mode, llm_cache, search_cache
+    with _lazy_lock:
+        if llm_cache_mode is not None:
+            return llm_cache, search_cache
+        
+        from llm_cache import LLM_CACHE_MODES, LLMResponseCache
+        
+        # LLM responses keyed by request fingerprint: on, off (fresh output) or replay (cache only, no network)
+        mode = os.getenv("LLM_CACHE_MODE", "on").lower()
+        if mode not in LLM_CACHE_MODES:
+            print(f"⚠️ Unknown LLM_CACHE_MODE '{mode}', expected one of {', '.join(LLM_CACHE_MODES)}; using 'on'")
+            mode = "on"
+        replay_mode = mode == "replay"
+        
+        if mode != "off":
+            llm_cache = LLMResponseCache(
+                os.getenv("LLM_CACHE_PATH", os.path.join(CACHE_DIR, "llm_cache.sqlite3")),
+                max_bytes=int(os.getenv("LLM_CACHE_MAX_MB", "256")) * 1024 * 1024,
+                replay=replay_mode
+            )
+        
+        # Search results shared by every agent, fixture and service restart (replayed alongside the LLM cache)
+        if replay_mode or os.getenv("SEARCH_CACHE_ENABLED", "true").lower() == "true":
+            search_cache = SearchCache(
+                os.getenv("SEARCH_CACHE_PATH", os.path.join(CACHE_DIR, "search_cache.sqlite3")),
+                ttl=int(os.getenv("SEARCH_CACHE_TTL", "21600")),  # 6 hours
+                max_entries=int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", "5000")),
+                replay=replay_mode
+            )
+        llm_cache_mode = mode
+        return llm_cache, search_cache
 
-print(f"✅ Tools initialized:")
-print(f"  - Search Tool: {search_tool.__class__.__name__}")
-print(f"  - SERPER_API_KEY: {'✅ Set' if os.getenv('SERPER_API_KEY') else '❌ Missing'}")
+def get_tools() -> Tuple[Any, Any]:
+    """
+    Get the search and RAG tools shared by every agent, creating them on first use.
+    
+    Returns:
+        Tuple of (search_tool, rag_tool)
+    """
+    global search_tool, rag_tool
+    with _lazy_lock:
+        if search_tool is not None:
+            return search_tool, rag_tool
+        
+        from crewai_tools import SerperDevTool, WebsiteSearchTool
+        
+        _, cache = get_caches()
+        if cache:
+            SerperDevTool = cached_tool_class(SerperDevTool, cache)
+            WebsiteSearchTool = cached_tool_class(WebsiteSearchTool, cache)
+        
+        # Instantiate tools
+        search = SerperDevTool()
+        
+        # Initialize RAG tool with error handling for Docker environments
+        try:
+            rag = WebsiteSearchTool()
+        except PermissionError:
+            # Fallback: Use only search_tool if RAG tool fails due to permissions
+            print("⚠️ Warning: WebsiteSearchTool initialization failed due to permissions. Using SerperDevTool only.")
+            rag = search
+        
+        print(f"✅ Tools initialized:")
+        print(f"  - Search Tool: {search.__class__.__name__}")
+        print(f"  - SERPER_API_KEY: {'✅ Set' if os.getenv('SERPER_API_KEY') else '❌ Missing'}")
+        search_tool, rag_tool = search, rag
+        return search_tool, rag_tool
 
 class AutonomousSportsBlogCrew:
     """
@@ -62,7 +146,8 @@ class AutonomousSportsBlogCrew:
     
     def _extract_and_update_score_from_data(self, match_data: str, fixture_id: str, home_team: str, away_team: str, current_home_score: int, current_away_score: int) -> Dict[str, Any]:
         """
-        Extract score from collected match data using LLM agent and update the fixtures table if a different score is found.
+        Extract score from collected match data and update the fixtures table if a different score is found.
+        The deterministic scoreline parser runs first; the LLM agent is only asked when the parser isn't confident.
         
         Args:
             match_data: Collected match data text
@@ -76,18 +161,17 @@ class AutonomousSportsBlogCrew:
             Dictionary with score extraction and update results
         """
         try:
-            # Create a specialized agent for score extraction
-            score_extraction_agent = Agent(
-                role="Score Extraction Specialist",
-                goal="Extract the final match score from match data and reports",
-                backstory="""You are a specialized football data analyst with expertise in extracting accurate 
-                match scores from various sources including match reports, live updates, and official results. 
-                You have a keen eye for identifying the definitive final score from match data and can distinguish 
-                between provisional scores, half-time scores, and the actual final result.""",
-                allow_delegation=False,
-                llm=self.llm,
-                tools=[search_tool, rag_tool]
-            )
+            parsed = parse_scoreline(match_data, home_team, away_team)
+            if parsed and parsed.confidence >= self.score_parser_min_confidence:
+                print(f"⚡ Scoreline parser found {parsed.score} (confidence {parsed.confidence:.2f}), skipping LLM extraction")
+                return self._apply_extracted_score(fixture_id, parsed.home, parsed.away, current_home_score,
+                                                   current_away_score, 'Scoreline parser')
+            if parsed:
+                print(f"🔍 Scoreline parser found {parsed.score} with low confidence ({parsed.confidence:.2f}), asking the LLM")
+            
+            from crewai import Task, Crew, Process
+            
+            score_extraction_agent = self.agents.acquire('score')
             
             # Create task for score extraction
             score_extraction_task = Task(
@@ -156,10 +240,14 @@ class AutonomousSportsBlogCrew:
             crew = Crew(
                 agents=[score_extraction_agent],
                 tasks=[score_extraction_task],
-                process=Process.sequential
+                process=Process.sequential,
+                max_rpm=self.max_rpm
             )
             
-            result = crew.kickoff()
+            try:
+                result = crew.kickoff()
+            finally:
+                self.agents.release('score', score_extraction_agent)
             extracted_result = str(result).strip()
             
             print(f"🔍 LLM extracted result: '{extracted_result}'")
@@ -195,73 +283,8 @@ class AutonomousSportsBlogCrew:
                     
                     # Validate reasonable score range (0-20 for each team)
                     if 0 <= home_score <= 20 and 0 <= away_score <= 20:
-                        extracted_score = {
-                            'home': home_score,
-                            'away': away_score
-                        }
-                        
-                        # Check if the extracted score is different from current score
-                        if (extracted_score['home'] == current_home_score and extracted_score['away'] == current_away_score):
-                            return {
-                                'found': True,
-                                'updated': False,
-                                'found_score': f"{extracted_score['home']}-{extracted_score['away']}",
-                                'message': 'LLM confirmed current database score'
-                            }
-                        
-                        # Update the database with the new score
-                        if fixture_id:
-                            try:
-                                # Import Supabase client
-                                from supabase import create_client, Client
-                                from dotenv import load_dotenv
-                                import os
-                                
-                                # Load environment variables
-                                load_dotenv()
-                                
-                                # Get Supabase configuration
-                                from config import FixtureServiceConfig
-                                supabase_url, supabase_key = FixtureServiceConfig.get_supabase_config()
-                                supabase: Client = create_client(supabase_url, supabase_key)
-                                
-                                # Update the fixture with the new score
-                                update_result = supabase.table('fixtures').update({
-                                    'home_score': extracted_score['home'],
-                                    'away_score': extracted_score['away']
-                                }).eq('id', fixture_id).execute()
-                                
-                                if update_result.data:
-                                    return {
-                                        'found': True,
-                                        'updated': True,
-                                        'old_score': f"{current_home_score}-{current_away_score}",
-                                        'new_score': extracted_score,
-                                        'found_score': f"{extracted_score['home']}-{extracted_score['away']}",
-                                        'message': f'LLM extracted and updated score from {current_home_score}-{current_away_score} to {extracted_score["home"]}-{extracted_score["away"]}'
-                                    }
-                                else:
-                                    return {
-                                        'found': True,
-                                        'updated': False,
-                                        'found_score': f"{extracted_score['home']}-{extracted_score['away']}",
-                                        'message': 'LLM found different score but database update failed'
-                                    }
-                                    
-                            except Exception as e:
-                                return {
-                                    'found': True,
-                                    'updated': False,
-                                    'found_score': f"{extracted_score['home']}-{extracted_score['away']}",
-                                    'message': f'LLM found different score but database update error: {str(e)}'
-                                }
-                        else:
-                            return {
-                                'found': True,
-                                'updated': False,
-                                'found_score': f"{extracted_score['home']}-{extracted_score['away']}",
-                                'message': 'LLM found different score but no fixture_id provided for database update'
-                            }
+                        return self._apply_extracted_score(fixture_id, home_score, away_score, current_home_score,
+                                                           current_away_score, 'LLM')
                     else:
                         return {
                             'found': False,
@@ -276,93 +299,18 @@ class AutonomousSportsBlogCrew:
                         'message': f'LLM extracted invalid score format: {extracted_result} (error: {str(e)})'
                     }
             else:
-                # LLM returned unexpected format, try fallback regex extraction
-                print(f"🔍 LLM returned unexpected format: '{extracted_result}', attempting fallback regex extraction...")
+                # LLM returned unexpected format, fall back to the parser's best guess
+                print(f"🔍 LLM returned unexpected format: '{extracted_result}', falling back to the scoreline parser...")
+                if parsed:
+                    print(f"✅ Fallback parser found score: {parsed.score}")
+                    return self._apply_extracted_score(fixture_id, parsed.home, parsed.away, current_home_score,
+                                                       current_away_score, 'Fallback scoreline parser')
                 
-                # Fallback: Try simple regex extraction if LLM failed
-                import re
-                
-                # Look for common score patterns
-                score_patterns = [
-                    r'FINAL SCORE:\s*(\d+)-(\d+)',
-                    r'final score[:\s]*(\d+)-(\d+)',
-                    r'result[:\s]*(\d+)-(\d+)',
-                    r'ended[:\s]*(\d+)-(\d+)',
-                    r'finished[:\s]*(\d+)-(\d+)',
-                    r'(\d+)-(\d+)\s*\(.*?\)',  # Pattern like "0-3 (Nottingham Forest - West Ham United)"
-                ]
-                
-                for pattern in score_patterns:
-                    match = re.search(pattern, match_data, re.IGNORECASE)
-                    if match:
-                        try:
-                            home_score = int(match.group(1))
-                            away_score = int(match.group(2))
-                            
-                            if 0 <= home_score <= 20 and 0 <= away_score <= 20:
-                                print(f"✅ Fallback regex found score: {home_score}-{away_score}")
-                                
-                                # Update database if we have a fixture_id
-                                if fixture_id and (home_score != current_home_score or away_score != current_away_score):
-                                    try:
-                                        # Import Supabase client
-                                        from supabase import create_client, Client
-                                        from dotenv import load_dotenv
-                                        import os
-                                        
-                                        # Load environment variables
-                                        load_dotenv()
-                                        
-                                        # Get Supabase configuration
-                                        from config import FixtureServiceConfig
-                                        supabase_url, supabase_key = FixtureServiceConfig.get_supabase_config()
-                                        supabase: Client = create_client(supabase_url, supabase_key)
-                                        
-                                        # Update the fixture with the new score
-                                        update_result = supabase.table('fixtures').update({
-                                            'home_score': home_score,
-                                            'away_score': away_score
-                                        }).eq('id', fixture_id).execute()
-                                        
-                                        if update_result.data:
-                                            return {
-                                                'found': True,
-                                                'updated': True,
-                                                'old_score': f"{current_home_score}-{current_away_score}",
-                                                'new_score': {'home': home_score, 'away': away_score},
-                                                'found_score': f"{home_score}-{away_score}",
-                                                'message': f'Fallback regex extracted and updated score from {current_home_score}-{current_away_score} to {home_score}-{away_score}'
-                                            }
-                                        else:
-                                            return {
-                                                'found': True,
-                                                'updated': False,
-                                                'found_score': f"{home_score}-{away_score}",
-                                                'message': 'Fallback regex found score but database update failed'
-                                            }
-                                            
-                                    except Exception as e:
-                                        return {
-                                            'found': True,
-                                            'updated': False,
-                                            'found_score': f"{home_score}-{away_score}",
-                                            'message': f'Fallback regex found score but database update error: {str(e)}'
-                                        }
-                                else:
-                                    return {
-                                        'found': True,
-                                        'updated': False,
-                                        'found_score': f"{home_score}-{away_score}",
-                                        'message': 'Fallback regex found score but no fixture_id provided for database update'
-                                    }
-                        except (ValueError, IndexError):
-                            continue
-                
-                # If we get here, neither LLM nor regex found a valid score
+                # If we get here, neither LLM nor the parser found a valid score
                 return {
                     'found': False,
                     'updated': False,
-                    'message': f'Neither LLM nor fallback regex could extract a valid score. LLM returned: {extracted_result}'
+                    'message': f'Neither LLM nor the scoreline parser could extract a valid score. LLM returned: {extracted_result}'
                 }
                 
         except Exception as e:
@@ -372,21 +320,165 @@ class AutonomousSportsBlogCrew:
                 'message': f'Error in LLM score extraction: {str(e)}'
             }
     
-    def __init__(self, model_name: str = "gpt-4o-mini"):
+    def _get_supabase(self) -> Client:
+        """Get the shared Supabase client, creating it on first use when none was injected."""
+        with self._supabase_lock:
+            if self.supabase is None:
+                from config import FixtureServiceConfig
+                supabase_url, supabase_key = FixtureServiceConfig.get_supabase_config()
+                from supabase import create_client
+                self.supabase = create_client(supabase_url, supabase_key)
+            return self.supabase
+    
+    def _apply_extracted_score(self, fixture_id: str, home_score: int, away_score: int, current_home_score: int,
+                               current_away_score: int, source: str) -> Dict[str, Any]:
+        """
+        Confirm an extracted score against the database, updating the fixture if it differs.
+        
+        Args:
+            fixture_id: ID of the fixture in the database
+            home_score: Extracted home score
+            away_score: Extracted away score
+            current_home_score: Current home score in database
+            current_away_score: Current away score in database
+            source: What extracted the score, used in messages
+            
+        Returns:
+            Dictionary with score extraction and update results
+        """
+        found_score = f"{home_score}-{away_score}"
+        
+        # Check if the extracted score is different from current score
+        if home_score == current_home_score and away_score == current_away_score:
+            return {
+                'found': True,
+                'updated': False,
+                'found_score': found_score,
+                'message': f'{source} confirmed current database score'
+            }
+        
+        if not fixture_id:
+            return {
+                'found': True,
+                'updated': False,
+                'found_score': found_score,
+                'message': f'{source} found different score but no fixture_id provided for database update'
+            }
+        
+        if self.fixture_writes is not None:
+            # Written with the rest of the processing cycle's updates
+            self.fixture_writes.update_score(fixture_id, home_score, away_score)
+            return {
+                'found': True,
+                'updated': True,
+                'old_score': f"{current_home_score}-{current_away_score}",
+                'new_score': {'home': home_score, 'away': away_score},
+                'found_score': found_score,
+                'message': f'{source} extracted score {found_score} (was {current_home_score}-{current_away_score}), update queued'
+            }
+        
+        # Update the database with the new score
+        try:
+            update_result = self._get_supabase().table('fixtures').update({
+                'home_score': home_score,
+                'away_score': away_score
+            }).eq('id', fixture_id).execute()
+            
+            if update_result.data:
+                return {
+                    'found': True,
+                    'updated': True,
+                    'old_score': f"{current_home_score}-{current_away_score}",
+                    'new_score': {'home': home_score, 'away': away_score},
+                    'found_score': found_score,
+                    'message': f'{source} extracted and updated score from {current_home_score}-{current_away_score} to {found_score}'
+                }
+            else:
+                return {
+                    'found': True,
+                    'updated': False,
+                    'found_score': found_score,
+                    'message': f'{source} found different score but database update failed'
+                }
+                
+        except Exception as e:
+            return {
+                'found': True,
+                'updated': False,
+                'found_score': found_score,
+                'message': f'{source} found different score but database update error: {str(e)}'
+            }
+    
+    def __init__(self, model_name: str = "gpt-4o-mini", max_rpm: Optional[int] = None, article_workers: int = 3,
+                 max_parallel_articles: Optional[int] = None, supabase: Optional[Client] = None,
+                 fixture_writes: Optional[Any] = None):
         """
         Initialize the crew with specified LLM model.
         
         Args:
             model_name: OpenAI model to use for all agents
+            max_rpm: Maximum LLM requests per minute for each crew run (None for no limit);
+                tool calls such as searches happen inside these requests
+            article_workers: Article crews written concurrently for one fixture; they split max_rpm,
+                and no more of them run than max_rpm allows one request per minute each
+            max_parallel_articles: Article crews running at once across all fixtures
+                (default: article_workers)
+            supabase: Shared Supabase client (created on first use if not given)
+            fixture_writes: Batch that queues fixture score updates for the caller to flush
+                (FixtureWriteBatch); without one, updates are written immediately
         """
-        self.llm = ChatOpenAI(
-            model=model_name,
-            temperature=0.7,
+        # Fail here rather than at import time, so importing this module never exits or prints
+        validate_config()
+        llm_cache, _ = get_caches()
+        from llm_cache import create_llm
+        
+        # Parsed scores at or above this confidence skip the LLM score extraction
+        self.score_parser_min_confidence = float(os.getenv("SCORE_PARSER_MIN_CONFIDENCE", "0.7"))
+        
+        self.supabase = supabase
+        self.fixture_writes = fixture_writes
+        self._supabase_lock = threading.Lock()
+        
+        self.max_rpm = max_rpm
+        self.article_workers = max(1, article_workers)
+        self.article_max_rpm = None
+        if max_rpm:
+            # Rounding each share up to 1 would let the crews exceed the budget together
+            if self.article_workers > max_rpm:
+                print(f"⚠️ {self.article_workers} article workers exceed max_rpm={max_rpm}; "
+                      f"writing {max_rpm} articles at a time")
+                self.article_workers = max_rpm
+            self.article_max_rpm = max_rpm // self.article_workers
+        
+        # Shared, bounded pool for article crews; all of them use the one LLM client below
+        self.article_executor = ThreadPoolExecutor(
+            max_workers=max_parallel_articles or self.article_workers,
+            thread_name_prefix='article-crew'
+        )
+        temperature = 0.7
+        # crewai's own OpenAI provider, since it would rebuild any other LLM object without our cache
+        self.llm = create_llm(
+            model_name,
+            cache=llm_cache,
+            temperature=temperature,
             api_key=os.getenv("OPENAI_API_KEY")
         )
+        
+        # Agents are built once per role and reused by later crews, never by two crews at once
+        self.agents = AgentRegistry(max_idle=max_parallel_articles or self.article_workers)
+        for role, factory in (
+            ('data', self._create_english_football_data_agent),
+            ('topic', self._create_topic_generation_agent),
+            ('planner', self._create_content_planner),
+            ('writer', self._create_content_writer),
+            ('editor', self._create_content_editor),
+            ('score', self._create_score_extraction_agent),
+        ):
+            self.agents.register(role, factory, llm_config=(model_name, temperature))
     
     def _create_english_football_data_agent(self) -> Agent:
         """Create the English Football Data Agent responsible for fetching recent fixtures and results."""
+        from crewai import Agent
         return Agent(
             role="English Football Data Specialist",
             goal="Fetch and analyze recent English football fixtures, results, and key statistics to identify compelling storylines",
@@ -397,11 +489,12 @@ class AutonomousSportsBlogCrew:
             standout performances, and developing narratives that would interest football fans and content creators.""",
             allow_delegation=False,
             llm=self.llm,
-            tools=[search_tool,rag_tool],
+            tools=list(get_tools()),
         )
     
     def _create_topic_generation_agent(self) -> Agent:
         """Create the Topic Generation Agent responsible for creating interesting article topics from match results."""
+        from crewai import Agent
         return Agent(
             role="English Football Topic Strategist",
             goal="Analyze match results and data to identify the 5 most interesting and engaging article topics",
@@ -413,11 +506,12 @@ class AutonomousSportsBlogCrew:
             always timely, relevant, and have strong potential for engaging content creation.""",
             allow_delegation=False,
             llm=self.llm,
-            tools=[search_tool,rag_tool]
+            tools=list(get_tools())
         )
     
     def _create_content_planner(self) -> Agent:
         """Create the European Football Content Strategist agent responsible for research and topic outlines."""
+        from crewai import Agent
         return Agent(
             role="European Football Content Strategist",
             goal="Research and create comprehensive content outlines for European football blog articles",
@@ -427,12 +521,13 @@ class AutonomousSportsBlogCrew:
             tactical developments. Your expertise spans from match analysis to player profiles, transfer rumors, 
             and emerging trends across European football.""",
             allow_delegation=False,
-            tools=[search_tool,rag_tool],
+            tools=list(get_tools()),
             llm=self.llm
         )
     
     def _create_content_writer(self) -> Agent:
         """Create the European Football Journalist agent responsible for expanding outlines into full articles."""
+        from crewai import Agent
         return Agent(
             role="European Football Journalist",
             goal="Transform detailed content outlines into engaging, well-researched European football articles",
@@ -442,12 +537,13 @@ class AutonomousSportsBlogCrew:
             explanations of match events, compelling player narratives, and ability to connect with both casual 
             fans and football connoisseurs across Europe.""",
             allow_delegation=False,
-            tools=[search_tool,rag_tool],
+            tools=list(get_tools()),
             llm=self.llm
         )
     
     def _create_content_editor(self) -> Agent:
         """Create the European Football Content Editor agent responsible for proofreading and finalizing articles."""
+        from crewai import Agent
         return Agent(
             role="European Football Content Editor",
             goal="Review, edit, and finalize European football articles to ensure high quality and consistency",
@@ -457,10 +553,25 @@ class AutonomousSportsBlogCrew:
             known for elevating good content to excellent content through careful editing and strategic improvements, 
             especially in match reports and player analysis.""",
             allow_delegation=False,
-            tools=[search_tool,rag_tool],
+            tools=list(get_tools()),
             llm=self.llm
         )
     
+    def _create_score_extraction_agent(self) -> Agent:
+        """Create the Score Extraction Specialist agent; everything it needs is in the match data, so it has no tools."""
+        from crewai import Agent
+        return Agent(
+            role="Score Extraction Specialist",
+            goal="Extract the final match score from match data and reports",
+            backstory="""You are a specialized football data analyst with expertise in extracting accurate 
+            match scores from various sources including match reports, live updates, and official results. 
+            You have a keen eye for identifying the definitive final score from match data and can distinguish 
+            between provisional scores, half-time scores, and the actual final result.""",
+            allow_delegation=False,
+            llm=self.llm,
+            tools=[]
+        )
+    
     def create_articles_for_specific_fixture(self, fixture_details: Dict[str, Any], target_length: str = "800-1200 words") -> Dict[str, Any]:
         """
         Create articles for a specific completed fixture.
@@ -489,9 +600,11 @@ class AutonomousSportsBlogCrew:
         # Create match topic
         match_topic = f"{home_team} vs {away_team} - {home_score}-{away_score} Match Analysis ({match_date})"
         
-        # Initialize agents
-        data_agent = self._create_english_football_data_agent()
-        topic_agent = self._create_topic_generation_agent()
+        from crewai import Task, Crew, Process
+        
+        # Check out agents, returned to the registry once their crew has run
+        data_agent = self.agents.acquire('data')
+        topic_agent = self.agents.acquire('topic')
         
         # Task 1: Collect specific match data and score
         data_collection_task = Task(
@@ -577,11 +690,16 @@ class AutonomousSportsBlogCrew:
             data_and_topic_crew = Crew(
                 agents=[data_agent, topic_agent],
                 tasks=[data_collection_task, topic_generation_task],
-                process=Process.sequential
+                process=Process.sequential,
+                max_rpm=self.max_rpm
             )
             
             # Get both data collection and topic generation results
-            combined_result = data_and_topic_crew.kickoff()
+            try:
+                combined_result = data_and_topic_crew.kickoff()
+            finally:
+                self.agents.release('data', data_agent)
+                self.agents.release('topic', topic_agent)
             
             # Extract the data collection output for context
             # The data collection task writes to a file, so we can read it
@@ -609,7 +727,7 @@ class AutonomousSportsBlogCrew:
             # Extract score from collected data and update database if needed
             score_update_result = self._extract_and_update_score_from_data(match_data_context, fixture_id, home_team, away_team, home_score, away_score)
             if score_update_result['updated']:
-                print(f"✅ Score updated in database: {score_update_result['old_score']} → {score_update_result['new_score']}")
+                print(f"✅ Score corrected: {score_update_result['old_score']} → {score_update_result['found_score']}")
                 # Update local variables with new score
                 home_score = score_update_result['new_score']['home']
                 away_score = score_update_result['new_score']['away']
@@ -677,16 +795,24 @@ class AutonomousSportsBlogCrew:
                     f"Tactical Breakdown: How the Match Was Won"
                 ]
             
-            # Create articles for each topic with match data context
-            for i, topic in enumerate(topics[:3]):  # Limit to 3 articles
+            # Create articles for each topic with match data context, writing them concurrently
+            article_topics = [str(topic) for topic in topics[:3]]  # Limit to 3 articles
+            article_futures = []
+            for topic in article_topics:
                 print(f"Creating article for topic: {topic}")
+                article_futures.append(self.article_executor.submit(
+                    self.create_article,
+                    topic=topic,
+                    article_type="match_report",
+                    target_length=target_length,
+                    context_data=match_data_context,  # Pass the collected match data
+                    max_rpm=self.article_max_rpm
+                ))
+            
+            # Collect the results in topic order
+            for topic, article_future in zip(article_topics, article_futures):
                 try:
-                    article_result = self.create_article(
-                        topic=str(topic), 
-                        article_type="match_report",
-                        target_length=target_length,
-                        context_data=match_data_context  # Pass the collected match data
-                    )
+                    article_result = article_future.result()
                     if article_result and 'article_content' in article_result:
                         articles.append({
                             'title': str(topic),
@@ -711,6 +837,16 @@ class AutonomousSportsBlogCrew:
                 'topics': []
             }
         
+        llm_cache, search_cache = get_caches()
+        search_cache_stats = search_cache.stats() if search_cache else None
+        if search_cache_stats:
+            print(f"🔎 Search cache: {search_cache_stats['hits']} hits, {search_cache_stats['misses']} misses "
+                  f"(hit rate {search_cache_stats['hit_rate']:.0%}, {search_cache_stats['entries']} entries)")
+        llm_cache_stats = llm_cache.stats() if llm_cache else None
+        if llm_cache_stats:
+            print(f"🧠 LLM cache ({llm_cache_mode}): {llm_cache_stats['hits']} hits, {llm_cache_stats['misses']} misses "
+                  f"(hit rate {llm_cache_stats['hit_rate']:.0%}, {llm_cache_stats['bytes'] / 1024 / 1024:.1f} MB)")
+        
         return {
             "fixture": fixture_details,
             "match_topic": match_topic,
@@ -722,11 +858,15 @@ class AutonomousSportsBlogCrew:
             "context_data_length": len(match_data_context) if match_data_context else 0,
             "score_update_result": score_update_result,  # Include score update information
             "final_score": f"{home_score}-{away_score}",  # Include final score after potential updates
+            "search_cache": search_cache_stats,
+            "agent_registry": self.agents.stats(),
+            "llm_cache": llm_cache_stats,
             "workflow_status": "completed",
             "agents_used": ["English Football Data Specialist", "English Football Topic Strategist", "European Football Content Strategist", "European Football Journalist", "European Football Content Editor"]
         }
 
-    def create_article(self, topic: str, article_type: str = "match_report", target_length: str = "800-1200 words", context_data: str = None) -> Dict[str, Any]:
+    def create_article(self, topic: str, article_type: str = "match_report", target_length: str = "800-1200 words", context_data: str = None,
+                       max_rpm: Optional[int] = None) -> Dict[str, Any]:
         """
         Execute the complete European football article creation workflow.
         
@@ -735,10 +875,19 @@ class AutonomousSportsBlogCrew:
             article_type: Type of article (match_report, player_analysis, transfer_news, etc.)
             target_length: Target word count for the final article
             context_data: Additional context data to inform the article (match details, statistics, etc.)
+            max_rpm: Request limit for this crew run (default: the crew's max_rpm)
             
         Returns:
             Dictionary containing the final article and workflow metadata
         """
+        from crewai import Task, Crew, Process
+        
+        started = time.perf_counter()
+        
+        # One agent per role, used by both the tasks and the crew
+        planner = self.agents.acquire('planner')
+        writer = self.agents.acquire('writer')
+        editor = self.agents.acquire('editor')
         
         # Task 1: Content Planning
         planning_task = Task(
@@ -762,7 +911,7 @@ class AutonomousSportsBlogCrew:
             {("IMPORTANT: Base your outline on the provided context data about this specific match. Use the actual match details, scores, and information provided above." if context_data else "Focus on European football relevance, recent results, and current player news.")}CRITICAL ERROR: SERPER_API_KEY not found!
             Include specific leagues, teams, and players where relevant.
             """,
-            agent=self._create_content_planner(),
+            agent=planner,
             expected_output="A detailed content outline with research notes, structure, and recommendations",
             verbose=True
         )
@@ -789,7 +938,7 @@ class AutonomousSportsBlogCrew:
             Make the content accessible to both casual European football fans and dedicated followers.
             Focus on recent events, current form, and emerging storylines.
             """,
-            agent=self._create_content_writer(),
+            agent=writer,
             expected_output="A complete, well-written European football blog article ready for editing",
             context=[planning_task]
         )
@@ -813,24 +962,28 @@ class AutonomousSportsBlogCrew:
             IMPORTANT: Return ONLY the final, polished article content. Do not include any editorial notes, 
             comments, or metadata in your response. Just the clean, publication-ready article.
             """,
-            agent=self._create_content_editor(),
+            agent=editor,
             expected_output="A polished, publication-ready European football blog article (content only, no notes)",
             context=[writing_task]
         )
         
         # Set up the crew for this workflow
         crew = Crew(
-            agents=[
-                self._create_content_planner(),
-                self._create_content_writer(),
-                self._create_content_editor()
-            ],
+            agents=[planner, writer, editor],
             tasks=[planning_task, writing_task, editing_task],
-            process=Process.sequential
+            process=Process.sequential,
+            max_rpm=max_rpm or self.max_rpm
         )
+        # Time from the call to the first LLM request
+        setup_seconds = time.perf_counter() - started
         
         # Execute the workflow
-        result = crew.kickoff()
+        try:
+            result = crew.kickoff()
+        finally:
+            self.agents.release('planner', planner)
+            self.agents.release('writer', writer)
+            self.agents.release('editor', editor)
         
         # Extract the article content from the result
         article_content = ""
@@ -866,6 +1019,7 @@ class AutonomousSportsBlogCrew:
             "article_content": article_content,
             "workflow_status": "completed",
             "agents_used": ["European Football Content Strategist", "European Football Journalist", "European Football Content Editor"],
+            "setup_seconds": round(setup_seconds, 4),
             "raw_result": str(result) if result else ""
         }
 
@@ -873,18 +1027,20 @@ class AutonomousSportsBlogCrew:
 def main():
     """Example usage of the European Football Blog Crew."""
     
+    # Load environment variables
+    load_dotenv()
+    
     # Check for API keys
     if not os.getenv("OPENAI_API_KEY"):
         print("Error: OPENAI_API_KEY not found in environment variables")
         print("Please create a .env file with your OpenAI API key")
         return
     
-    if not os.getenv("SERPER_API_KEY"):
-        print("⚠️  Warning: SERPER_API_KEY not found in environment variables")
-        print("   SerperDevTool (search_tool) will not work without this key")
-        print("   Please add SERPER_API_KEY=your_key_here to your .env file")
-        print("   This will affect the data collection agent's ability to fetch recent results")
-        print()
+    try:
+        validate_config()
+    except ValueError as e:
+        print(f"❌ CRITICAL ERROR: {e}")
+        return
     
     # Check if crewai_tools is properly installed
     try:
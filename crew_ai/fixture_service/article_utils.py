@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Article text helpers for the English Football Fixture Service
+Builds the denormalized excerpt and read time stored alongside each article,
+so list endpoints never need to fetch the full article body.
+"""
+
+# Longest excerpt any endpoint shows; shorter ones are trimmed from this
+EXCERPT_LENGTH = 300
+
+# Average reading speed used for the read time estimate
+WORDS_PER_MINUTE = 200
+
+def make_excerpt(content: str, length: int = EXCERPT_LENGTH) -> str:
+    """
+    Build the stored excerpt for an article
+
+    Args:
+        content: Full article content
+        length: Maximum number of characters before the ellipsis
+
+    Returns:
+        The first `length` characters of the content, with '...' if it was cut
+    """
+    content = content or ''
+    return content[:length] + '...' if len(content) > length else content
+
+def estimate_read_time(word_count: int) -> int:
+    """Estimate the read time of an article in whole minutes (at least 1)"""
+    return max(1, (word_count or 0) // WORDS_PER_MINUTE)
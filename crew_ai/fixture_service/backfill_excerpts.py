@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Excerpt Backfill Script
+Standalone script to fill the excerpt and read_time columns of existing articles.
+"""
+
+import os
+import sys
+
+# Add the fixture service directory to the path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from supabase import create_client, Client
+from config import FixtureServiceConfig
+from article_utils import make_excerpt, estimate_read_time
+
+BATCH_SIZE = 100
+
+def backfill_excerpts(supabase: Client) -> int:
+    """
+    Fill excerpt and read_time for every article that doesn't have them yet
+
+    Args:
+        supabase: Supabase client
+
+    Returns:
+        Number of articles updated
+
+    Raises:
+        RuntimeError: If a batch updates no rows (e.g. row level security blocks the updates)
+    """
+    updated = 0
+
+    while True:
+        # Updated rows drop out of the filter, so always read the first batch
+        batch = supabase.table('generated_articles').select(
+            'id, content, word_count'
+        ).is_('excerpt', 'null').limit(BATCH_SIZE).execute()
+
+        if not batch.data:
+            return updated
+
+        batch_updated = 0
+        for row in batch.data:
+            result = supabase.table('generated_articles').update({
+                'excerpt': make_excerpt(row['content']),
+                'read_time': estimate_read_time(row['word_count'])
+            }).eq('id', row['id']).execute()
+            batch_updated += len(result.data or [])
+
+        # Rows that weren't updated are read again, so a batch without progress would repeat forever
+        if not batch_updated:
+            raise RuntimeError(f"None of {len(batch.data)} articles could be updated "
+                               f"(after {updated} backfilled); check the key's update permissions")
+        updated += batch_updated
+
+        print(f"📝 Backfilled {updated} articles so far...")
+
+def main():
+    """
+    Main function to run the excerpt backfill
+    """
+    print("📝 Excerpt Backfill Script")
+    print("=" * 50)
+
+    try:
+        supabase_url, supabase_key = FixtureServiceConfig.get_supabase_config()
+        supabase: Client = create_client(supabase_url, supabase_key)
+
+        updated = backfill_excerpts(supabase)
+
+        print("\n" + "=" * 50)
+        print(f"✅ Backfilled excerpt and read time for {updated} articles")
+        print("=" * 50)
+
+    except Exception as e:
+        print(f"❌ Fatal error: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
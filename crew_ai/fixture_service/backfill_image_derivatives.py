@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Image Derivative Backfill Script
+Standalone script to create the resized WebP/JPEG derivatives for article
+images uploaded before the derivative pipeline existed.
+"""
+
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+# Add the fixture service directory to the path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from supabase import create_client, Client
+from config import FixtureServiceConfig
+from image_derivatives import DERIVATIVE_FORMATS, DERIVATIVE_WIDTHS, derivative_key, render_derivatives
+
+BUCKET = 'article-images'
+PAGE_SIZE = 1000
+
+def list_bucket(supabase: Client) -> set:
+    """List every object name in the article-images bucket"""
+    names = set()
+    offset = 0
+
+    while True:
+        page = supabase.storage.from_(BUCKET).list(
+            '', {'limit': PAGE_SIZE, 'offset': offset, 'sortBy': {'column': 'name', 'order': 'asc'}}
+        ) or []
+        names.update(item['name'] for item in page if item.get('name'))
+
+        if len(page) < PAGE_SIZE:
+            return names
+        offset += PAGE_SIZE
+
+def find_missing_derivatives(names: set) -> list:
+    """Find the article IDs whose original image is missing any derivative"""
+    article_ids = []
+    for name in sorted(names):
+        article_id, extension = os.path.splitext(name)
+        # Derivatives are named {article_id}-{size}.jpg, originals {article_id}.jpg
+        if extension != '.jpg' or article_id.rsplit('-', 1)[-1] in DERIVATIVE_WIDTHS:
+            continue
+        if any(derivative_key(article_id, size, image_format) not in names
+               for size in DERIVATIVE_WIDTHS for image_format in DERIVATIVE_FORMATS):
+            article_ids.append(article_id)
+    return article_ids
+
+def backfill_image_derivatives(supabase: Client, workers: int) -> int:
+    """
+    Create derivatives for every original image that doesn't have them yet
+
+    Args:
+        supabase: Supabase client
+        workers: Number of processes used to resize and encode images
+
+    Returns:
+        Number of articles processed
+    """
+    article_ids = find_missing_derivatives(list_bucket(supabase))
+    print(f"🖼️ Found {len(article_ids)} images without derivatives")
+
+    processed = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        originals = (supabase.storage.from_(BUCKET).download(f"{article_id}.jpg") for article_id in article_ids)
+
+        for article_id, derivatives in zip(article_ids, pool.map(render_derivatives, originals)):
+            for (size, image_format), data in derivatives.items():
+                supabase.storage.from_(BUCKET).upload(
+                    derivative_key(article_id, size, image_format),
+                    data,
+                    file_options={
+                        "content-type": DERIVATIVE_FORMATS[image_format][1],
+                        "cache-control": "31536000",
+                        "upsert": "true"
+                    }
+                )
+            processed += 1
+            print(f"✅ Created derivatives for {article_id} ({processed}/{len(article_ids)})")
+
+    return processed
+
+def main():
+    """
+    Main function to run the image derivative backfill
+    """
+    print("🖼️ Image Derivative Backfill Script")
+    print("=" * 50)
+
+    try:
+        supabase_url, supabase_key = FixtureServiceConfig.get_supabase_config()
+        supabase: Client = create_client(supabase_url, supabase_key)
+
+        processed = backfill_image_derivatives(supabase, FixtureServiceConfig.IMAGE_DERIVATIVE_WORKERS)
+
+        print("\n" + "=" * 50)
+        print(f"✅ Created image derivatives for {processed} articles")
+        print("=" * 50)
+
+    except Exception as e:
+        print(f"❌ Fatal error: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -31,7 +31,9 @@ class FixtureServiceConfig:
     
     # Service intervals (in seconds)
     SYNC_INTERVAL = int(os.getenv('SYNC_INTERVAL', '3600'))  # 1 hour
-    PROCESSING_INTERVAL = int(os.getenv('PROCESSING_INTERVAL', '3600'))  # 60 minutes
+    PROCESSING_INTERVAL = int(os.getenv('PROCESSING_INTERVAL', '3600'))  # 60 minutes, longest sleep between checks
+    COMPLETION_DELAY_HOURS = int(os.getenv('COMPLETION_DELAY_HOURS', '3'))  # kickoff to processing
+    SCHEDULER_BATCH_WINDOW = int(os.getenv('SCHEDULER_BATCH_WINDOW', '900'))  # seconds; fixtures due this close are processed together
     
     # Competition settings
     DEFAULT_COMPETITION = os.getenv('DEFAULT_COMPETITION', 'Premier League')
@@ -44,10 +46,28 @@ class FixtureServiceConfig:
     # Article generation settings
     DEFAULT_ARTICLE_LENGTH = os.getenv('DEFAULT_ARTICLE_LENGTH', '800-1200 words')
     DAYS_BACK_FOR_ARTICLES = int(os.getenv('DAYS_BACK_FOR_ARTICLES', '1'))
+    DISCOVERY_LOOKBACK_DAYS = int(os.getenv('DISCOVERY_LOOKBACK_DAYS', '7'))  # match dates checked after the first poll
     
     # Processing settings
-    MAX_RETRIES = int(os.getenv('MAX_RETRIES', '3'))
-    RETRY_DELAY = int(os.getenv('RETRY_DELAY', '60'))  # seconds
+    MAX_RETRIES = int(os.getenv('MAX_RETRIES', '3'))  # retries of a failed fixture before it is dead-lettered
+    RETRY_DELAY = int(os.getenv('RETRY_DELAY', '60'))  # seconds before the first retry, doubled per retry
+    JOB_LEASE_SECONDS = int(os.getenv('JOB_LEASE_SECONDS', '600'))  # claim lifetime without a heartbeat
+    JOB_HEARTBEAT_INTERVAL = int(os.getenv('JOB_HEARTBEAT_INTERVAL', '60'))  # seconds between lease extensions
+    FIXTURE_WORKERS = int(os.getenv('FIXTURE_WORKERS', '3'))  # fixtures processed concurrently
+    ARTICLE_WORKERS = int(os.getenv('ARTICLE_WORKERS', '3'))  # articles written concurrently per fixture
+    CREW_MAX_RPM = int(os.getenv('CREW_MAX_RPM', '0'))  # LLM requests per minute shared by all workers (0 = no limit)
+    
+    # Image settings
+    IMAGE_DERIVATIVE_WORKERS = int(os.getenv('IMAGE_DERIVATIVE_WORKERS', '2'))  # processes resizing images
+    IMAGE_GENERATION_WORKERS = int(os.getenv('IMAGE_GENERATION_WORKERS', '4'))  # concurrent generation requests
+    IMAGE_UPLOAD_WORKERS = int(os.getenv('IMAGE_UPLOAD_WORKERS', '2'))  # concurrent uploads
+    IMAGE_REQUESTS_PER_MINUTE = float(os.getenv('IMAGE_REQUESTS_PER_MINUTE', '10'))  # provider quota
+    IMAGE_GENERATION_RETRIES = int(os.getenv('IMAGE_GENERATION_RETRIES', '3'))
+    IMAGE_RETRY_BACKOFF = float(os.getenv('IMAGE_RETRY_BACKOFF', '2.0'))  # seconds, doubled per retry
+    
+    # Cache invalidation settings (must match the API's settings)
+    INVALIDATION_CHANNEL = os.getenv('INVALIDATION_CHANNEL', 'none')  # none, file, unix
+    INVALIDATION_PATH = os.getenv('INVALIDATION_PATH', '/tmp/final_whistle_invalidation')
     
     @classmethod
     def validate_config(cls) -> Dict[str, Any]:
@@ -104,6 +124,9 @@ class FixtureServiceConfig:
         print(f"  Default Season: {cls.DEFAULT_SEASON}")
         print(f"  Article Length: {cls.DEFAULT_ARTICLE_LENGTH}")
         print(f"  Days Back for Articles: {cls.DAYS_BACK_FOR_ARTICLES}")
+        print(f"  Fixture Workers: {cls.FIXTURE_WORKERS}")
+        print(f"  Crew Request Budget: {cls.CREW_MAX_RPM or 'unlimited'} requests/minute")
+        print(f"  Cache Invalidation: {cls.INVALIDATION_CHANNEL} ({cls.INVALIDATION_PATH})")
         
         print(f"\nLogging:")
         print(f"  Log Level: {cls.LOG_LEVEL}")
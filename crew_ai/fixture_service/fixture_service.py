@@ -10,23 +10,35 @@ import sys
 import asyncio
 import logging
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Set
 from dataclasses import dataclass
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
 # Add the parent directory to the path to import crew_workflow
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from supabase import create_client, Client
 from dotenv import load_dotenv
 from crew_workflow import AutonomousSportsBlogCrew
-import google.generativeai as genai
+from invalidation import InvalidationEvent, create_invalidation_channel, publish_safely
+from article_utils import make_excerpt, estimate_read_time
+from fixture_writes import FixtureWriteBatch
+from image_derivatives import DERIVATIVE_FORMATS, ImageDerivativePipeline, derivative_key
+from image_generation import ImageGenerationPool
+from job_queue import FixtureJob, FixtureJobQueue
+from scheduler import KickoffScheduler
 from PIL import Image
 import io
 import base64
 
+# supabase and the Gemini SDK are imported where they are first used, so CLI
+# commands like --config don't pay for them
+if TYPE_CHECKING:
+    from supabase import Client
+
 # Load environment variables
 load_dotenv()
 
@@ -57,6 +69,30 @@ class Fixture:
     venue: Optional[str]
     matchday: Optional[int]
     round: Optional[str]
+    
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]) -> 'Fixture':
+        """Create a fixture from a fixtures table row"""
+        return cls(
+            id=str(row['id']),
+            competition=row['competition'],
+            season=row['season'],
+            match_date=str(row['match_date']),
+            match_time=str(row['match_time']) if row['match_time'] else None,
+            home_team=row['home_team'],
+            away_team=row['away_team'],
+            home_score=row['home_score'],
+            away_score=row['away_score'],
+            status=row['status'],
+            venue=row['venue'],
+            matchday=row['matchday'],
+            round=row['round']
+        )
+
+FIXTURE_COLUMNS = (
+    'id, competition, season, match_date, match_time, home_team, away_team, '
+    'home_score, away_score, status, venue, matchday, round'
+)
 
 class FixtureService:
     """
@@ -69,18 +105,81 @@ class FixtureService:
         """
         # Get Supabase configuration
         from config import FixtureServiceConfig
+        from supabase import create_client
         try:
             supabase_url, supabase_key = FixtureServiceConfig.get_supabase_config()
             self.supabase: Client = create_client(supabase_url, supabase_key)
         except ValueError as e:
             raise ValueError(f"Supabase configuration error: {e}")
         
-        # Initialize the crew AI system
-        self.crew = AutonomousSportsBlogCrew()
+        # Initialize the crew AI system; each fixture worker runs its crew in its own
+        # thread and gets an equal share of the LLM request budget
+        self.fixture_workers = max(1, FixtureServiceConfig.FIXTURE_WORKERS)
+        crew_max_rpm = None
+        if FixtureServiceConfig.CREW_MAX_RPM > 0:
+            # Shares are at least one request per minute, so no more workers than the budget
+            if self.fixture_workers > FixtureServiceConfig.CREW_MAX_RPM:
+                print(f"⚠️ FIXTURE_WORKERS={self.fixture_workers} exceeds CREW_MAX_RPM="
+                      f"{FixtureServiceConfig.CREW_MAX_RPM}; running {FixtureServiceConfig.CREW_MAX_RPM} workers")
+                self.fixture_workers = FixtureServiceConfig.CREW_MAX_RPM
+            crew_max_rpm = FixtureServiceConfig.CREW_MAX_RPM // self.fixture_workers
+        # Score corrections found by the crews are queued and written when their job completes
+        self.fixture_writes = FixtureWriteBatch(self.supabase)
+        self.crew = AutonomousSportsBlogCrew(
+            max_rpm=crew_max_rpm,
+            article_workers=FixtureServiceConfig.ARTICLE_WORKERS,
+            max_parallel_articles=self.fixture_workers * FixtureServiceConfig.ARTICLE_WORKERS,
+            supabase=self.supabase,
+            fixture_writes=self.fixture_writes
+        )
+        self.crew_executor = ThreadPoolExecutor(max_workers=self.fixture_workers, thread_name_prefix='crew')
+        
+        # The first discovery poll looks at the whole season, later ones only at recent dates
+        self.discovery_backfilled = False
+        self.discovery_lookback_days = FixtureServiceConfig.DISCOVERY_LOOKBACK_DAYS
+        self.completion_delay_hours = FixtureServiceConfig.COMPLETION_DELAY_HOURS
+        
+        # Fixture calendar, so the service sleeps until the next fixture becomes due. Wake-ups
+        # are a minute after the deadline so clock skew with the database can't make us early.
+        self.scheduler = KickoffScheduler(
+            timedelta(hours=self.completion_delay_hours, minutes=1),
+            timedelta(seconds=FixtureServiceConfig.SCHEDULER_BATCH_WINDOW)
+        )
+        self.calendar_signature = None
+        
+        # Leased job queue, so several service replicas never process the same fixture
+        self.job_queue = FixtureJobQueue(
+            self.supabase,
+            lease_seconds=FixtureServiceConfig.JOB_LEASE_SECONDS,
+            heartbeat_interval=FixtureServiceConfig.JOB_HEARTBEAT_INTERVAL,
+            max_attempts=FixtureServiceConfig.MAX_RETRIES + 1,
+            retry_delay=FixtureServiceConfig.RETRY_DELAY
+        )
+        
+        # Channel used to tell the API which cached responses our writes affect
+        self.invalidation = create_invalidation_channel(
+            FixtureServiceConfig.INVALIDATION_CHANNEL,
+            FixtureServiceConfig.INVALIDATION_PATH
+        )
         
         # Configure Google Generative AI for image generation
+        import google.generativeai as genai
         genai.configure(api_key=os.getenv('GOOGLE_API_KEY'))
         
+        # Process pool that resizes and encodes image derivatives
+        self.image_derivatives = ImageDerivativePipeline(FixtureServiceConfig.IMAGE_DERIVATIVE_WORKERS)
+        
+        # Rate-limited workers that generate and upload article images concurrently
+        self.image_generation = ImageGenerationPool(
+            self.generate_image_with_gemini,
+            self.store_article_image,
+            workers=FixtureServiceConfig.IMAGE_GENERATION_WORKERS,
+            upload_workers=FixtureServiceConfig.IMAGE_UPLOAD_WORKERS,
+            requests_per_minute=FixtureServiceConfig.IMAGE_REQUESTS_PER_MINUTE,
+            max_retries=FixtureServiceConfig.IMAGE_GENERATION_RETRIES,
+            backoff_base=FixtureServiceConfig.IMAGE_RETRY_BACKOFF
+        )
+        
         print("✅ Fixture Service initialized successfully")
     
 
@@ -96,14 +195,14 @@ class FixtureService:
             logger.error(f"Failed to connect to Supabase: {e}")
             raise
     
-    def generate_image_with_gemini(self, article_title: str, article_content: str = "") -> Optional[bytes]:
-        """Generate an image using Gemini 2.5 Flash Image Preview based on article title and content"""
+    def generate_image_with_gemini(self, article_title: str, article_excerpt: str = "") -> Optional[bytes]:
+        """Generate an image using Gemini 2.5 Flash Image Preview based on article title and excerpt"""
         try:
-            # Extract key information from article content for more accurate image generation
+            # Extract key information from the article excerpt for more accurate image generation
             content_summary = ""
-            if article_content:
-                # Take first 200 characters of content for context
-                content_summary = article_content[:200] + "..." if len(article_content) > 200 else article_content
+            if article_excerpt:
+                # Take first 200 characters of the excerpt for context
+                content_summary = article_excerpt[:200] + "..." if len(article_excerpt) > 200 else article_excerpt
             
             # Create a detailed prompt for football-related image generation
             prompt = f"""Create a professional football match thumbnail image for the article titled: "{article_title}". 
@@ -123,6 +222,7 @@ class FixtureService:
             - Reflect the specific match or teams mentioned in the article context"""
             
             # Use Gemini's image generation model
+            import google.generativeai as genai
             model = genai.GenerativeModel('gemini-2.5-flash-image-preview')
             
             # Generate the image using the prompt
@@ -194,88 +294,119 @@ class FixtureService:
             print(f"❌ Error uploading image for article {article_id}: {e}")
             return None
     
+    async def upload_image_derivatives(self, article_id: str, image_data: bytes) -> int:
+        """
+        Upload resized WebP and JPEG versions of an article image
+        
+        Args:
+            article_id: Article the image belongs to
+            image_data: Original image bytes
+            
+        Returns:
+            Number of derivatives uploaded
+        """
+        try:
+            derivatives = await self.image_derivatives.render(image_data)
+        except Exception as e:
+            print(f"❌ Error rendering image derivatives for article {article_id}: {e}")
+            return 0
+        
+        loop = asyncio.get_running_loop()
+        uploaded = 0
+        for (size, image_format), data in derivatives.items():
+            key = derivative_key(article_id, size, image_format)
+            try:
+                await loop.run_in_executor(None, lambda: self.supabase.storage.from_('article-images').upload(
+                    key,
+                    data,
+                    file_options={
+                        "content-type": DERIVATIVE_FORMATS[image_format][1],
+                        "cache-control": "31536000",
+                        "upsert": "true"
+                    }
+                ))
+                uploaded += 1
+            except Exception as e:
+                print(f"⚠️ Failed to upload image derivative {key}: {e}")
+        
+        print(f"✅ Uploaded {uploaded}/{len(derivatives)} image derivatives for article {article_id}")
+        return uploaded
+    
+    async def store_article_image(self, article_id: str, image_data: bytes) -> Optional[str]:
+        """Upload an article image and its derivatives, returning the original's public URL"""
+        # The storage client is blocking, so uploads run in threads to keep the loop free
+        loop = asyncio.get_running_loop()
+        image_url = await loop.run_in_executor(None, self.upload_image_to_storage, article_id, image_data)
+        if image_url:
+            await self.upload_image_derivatives(article_id, image_data)
+            await loop.run_in_executor(None, self.set_image_status, [article_id], 'ready')
+        return image_url
+    
+    def set_image_status(self, article_ids: List[str], status: str):
+        """Record the image status of articles so the "needs image" query stays a single select"""
+        if not article_ids:
+            return
+        try:
+            self.supabase.table('generated_articles').update(
+                {'image_status': status}
+            ).in_('id', article_ids).execute()
+        except Exception as e:
+            print(f"⚠️ Failed to update image status for {len(article_ids)} articles: {e}")
+    
+    def list_stored_images(self, page_size: int = 1000) -> Set[str]:
+        """
+        List the original images in the article-images bucket
+        
+        Returns:
+            Set of article IDs that have an {article_id}.jpg object
+        """
+        article_ids = set()
+        offset = 0
+        
+        while True:
+            page = self.supabase.storage.from_('article-images').list(
+                '', {'limit': page_size, 'offset': offset, 'sortBy': {'column': 'name', 'order': 'asc'}}
+            ) or []
+            for item in page:
+                name = item.get('name') or ''
+                if name.endswith('.jpg'):
+                    article_ids.add(name[:-len('.jpg')])
+            
+            if len(page) < page_size:
+                return article_ids
+            offset += page_size
+    
 
     
     async def get_unprocessed_completed_fixtures(self) -> List[Fixture]:
         """
-        Get all completed fixtures that haven't been processed by the crew
+        Get all completed fixtures that don't have a processing job yet
         
-        A fixture is considered completed if it has been more than 3 hours since the match started.
-        All match dates and times are in GMT.
+        A fixture is considered completed if it has been more than COMPLETION_DELAY_HOURS (3 by
+        default) since the match started.
+        All match dates and times are in GMT. The check runs in the database; after the first
+        poll only match dates within DISCOVERY_LOOKBACK_DAYS are considered.
         
         Returns:
             List of unprocessed completed fixtures
         """
         try:
-            from datetime import datetime
-            
-            # Current time in GMT
-            now_gmt = datetime.utcnow()
+            since = None
+            if self.discovery_backfilled:
+                since = (datetime.utcnow().date() - timedelta(days=self.discovery_lookback_days)).isoformat()
             
-            print(f"🔍 Looking for all completed fixtures...")
-            print(f"🕒 Current GMT time: {now_gmt.strftime('%Y-%m-%d %H:%M:%S')}")
+            print(f"🔍 Looking for completed fixtures {f'since {since}' if since else 'across the season'}...")
             
-            # Get all fixtures (no date filtering)
-            all_fixtures = self.supabase.table('fixtures').select(
-                'id, competition, season, match_date, match_time, home_team, away_team, '
-                'home_score, away_score, status, venue, matchday, round'
-            ).execute()
+            result = self.supabase.rpc('get_unprocessed_completed_fixtures', {
+                'completed_after_hours': self.completion_delay_hours,
+                'since': since
+            }).execute()
+            self.discovery_backfilled = True
             
-            # Get processed fixture IDs
-            processed = self.supabase.table('fixture_processing_status').select(
-                'fixture_id'
-            ).eq('processing_status', 'completed').execute()
-            
-            processed_ids = {row['fixture_id'] for row in processed.data}
-            
-            # Filter fixtures based on completion time (3+ hours since match start)
-            fixtures = []
-            for row in all_fixtures.data:
-                if row['id'] not in processed_ids:
-                    try:
-                        # Parse match date and time (GMT)
-                        match_date_str = row['match_date']
-                        match_time_str = row['match_time'] or '15:00:00'  # Default to 3 PM if no time
-                        
-                        # Handle both HH:MM and HH:MM:SS formats
-                        if match_time_str and len(match_time_str.split(':')) == 2:
-                            # Add seconds if missing (HH:MM -> HH:MM:SS)
-                            match_time_str = f"{match_time_str}:00"
-                        
-                        # Combine date and time to create full datetime
-                        match_datetime_str = f"{match_date_str} {match_time_str}"
-                        match_datetime_gmt = datetime.strptime(match_datetime_str, '%Y-%m-%d %H:%M:%S')
-                        
-                        # Calculate time elapsed since match start
-                        time_since_match = now_gmt - match_datetime_gmt
-                        hours_since_match = time_since_match.total_seconds() / 3600
-                        
-                        # Check if fixture is completed (3+ hours since start)
-                        is_completed = hours_since_match >= 3
-                        
-                        if is_completed:
-                            print(f"⚽ Found completed fixture: {row['home_team']} vs {row['away_team']} "
-                                  f"({match_datetime_gmt.strftime('%Y-%m-%d %H:%M')} GMT, "
-                                  f"{hours_since_match:.1f}h ago)")
-                            
-                            fixtures.append(Fixture(
-                                id=str(row['id']),
-                                competition=row['competition'],
-                                season=row['season'],
-                                match_date=str(row['match_date']),
-                                match_time=str(row['match_time']) if row['match_time'] else None,
-                                home_team=row['home_team'],
-                                away_team=row['away_team'],
-                                home_score=row['home_score'],
-                                away_score=row['away_score'],
-                                status=row['status'],
-                                venue=row['venue'],
-                                matchday=row['matchday'],
-                                round=row['round']
-                            ))                            
-                    except ValueError as e:
-                        print(f"⚠️ Error parsing date/time for fixture {row['id']}: {e}")
-                        continue
+            fixtures = [Fixture.from_row(row) for row in result.data or []]
+            for fixture in fixtures:
+                print(f"⚽ Found completed fixture: {fixture.home_team} vs {fixture.away_team} "
+                      f"({fixture.match_date} {fixture.match_time or 'time unknown'} GMT)")
             
             print(f"📋 Found {len(fixtures)} unprocessed completed fixtures")
             return fixtures
@@ -284,91 +415,73 @@ class FixtureService:
             logger.error(f"Error getting unprocessed fixtures: {e}")
             raise
     
-    async def mark_fixture_processing_started(self, fixture_id: str) -> str:
+    async def mark_fixture_processing_completed(self, fixture: Fixture, job: FixtureJob, articles_generated: int,
+                                                topics_generated: int):
         """
-        Mark a fixture as processing started
+        Mark a fixture's processing job as completed
         
         Args:
-            fixture_id: ID of the fixture
+            fixture: Fixture that was processed
+            job: The fixture's claimed processing job
+            articles_generated: Number of articles generated
+            topics_generated: Number of topics generated
             
         Returns:
-            Processing status ID
+            False if the lease was lost and the job could not be completed
         """
         try:
-            crew_execution_id = f"crew_{int(time.time())}"
-            
-            # Check if processing status already exists
-            existing = self.supabase.table('fixture_processing_status').select('id').eq(
-                'fixture_id', fixture_id
-            ).execute()
-            
-            if existing.data:
-                # Update existing
-                processing_id = existing.data[0]['id']
-                self.supabase.table('fixture_processing_status').update({
-                    'processing_status': 'in_progress',
-                    'crew_execution_id': crew_execution_id
-                }).eq('id', processing_id).execute()
-            else:
-                # Insert new
-                result = self.supabase.table('fixture_processing_status').insert({
-                    'fixture_id': fixture_id,
-                    'processing_status': 'in_progress',
-                    'crew_execution_id': crew_execution_id
-                }).execute()
-                processing_id = result.data[0]['id']
-                
-            
-            print(f"🟡 Marked fixture {fixture_id} as processing started")
-            return str(processing_id)
+            loop = asyncio.get_running_loop()
+            if not await loop.run_in_executor(None, self.job_queue.complete, job, articles_generated, topics_generated):
+                # The articles are already saved, and the worker now holding the job will write its own
+                logger.error(f"Lost the lease on fixture {fixture.id} after saving its {articles_generated} "
+                             f"articles; the job was not completed and may be processed again, "
+                             f"duplicating them (processing id {job.id})")
+                return False
             
-        except Exception as e:
-            logger.error(f"Error marking fixture processing started: {e}")
-            raise
-    
-    async def mark_fixture_processing_completed(self, fixture_id: str, articles_generated: int, topics_generated: int):
-        """
-        Mark a fixture as processing completed
-        
-        Args:
-            fixture_id: ID of the fixture
-            articles_generated: Number of articles generated
-            topics_generated: Number of topics generated
-        """
-        try:
-            self.supabase.table('fixture_processing_status').update({
-                'processing_status': 'completed',
-                'articles_generated': articles_generated,
-                'topics_generated': topics_generated
-            }).eq('fixture_id', fixture_id).execute()
+            publish_safely(self.invalidation, InvalidationEvent(
+                kind='fixture_status',
+                fixture_id=fixture.id,
+                matchday=fixture.matchday
+            ))
             
-            print(f"✅ Marked fixture {fixture_id} as processing completed")
+            print(f"✅ Marked fixture {fixture.id} as processing completed")
+            return True
             
         except Exception as e:
             logger.error(f"Error marking fixture processing completed: {e}")
             raise
     
-    async def mark_fixture_processing_failed(self, fixture_id: str, error_message: str):
+    async def mark_fixture_processing_failed(self, fixture: Fixture, job: FixtureJob, error_message: str):
         """
-        Mark a fixture as processing failed
+        Record a failed attempt at processing a fixture
+        
+        The job is retried after a backoff until it runs out of attempts, then dead-lettered.
         
         Args:
-            fixture_id: ID of the fixture
+            fixture: Fixture that failed
+            job: The fixture's claimed processing job
             error_message: Error message
         """
         try:
-            self.supabase.table('fixture_processing_status').update({
-                'processing_status': 'failed',
-                'error_message': error_message
-            }).eq('fixture_id', fixture_id).execute()
-            
-            logger.error(f"Marked fixture {fixture_id} as processing failed: {error_message}")
+            loop = asyncio.get_running_loop()
+            status = await loop.run_in_executor(None, self.job_queue.fail, job, error_message)
+            
+            if status is None:
+                # Another worker holds the job now; this attempt isn't recorded against it
+                logger.error(f"Lost the lease on fixture {fixture.id} before recording its failure "
+                             f"(attempt {job.attempts}/{job.max_attempts}): {error_message}")
+            elif status == 'dead':
+                logger.error(f"Fixture {fixture.id} failed {job.attempts} times and was dead-lettered: {error_message}")
+            else:
+                logger.error(f"Marked fixture {fixture.id} as processing failed "
+                             f"(attempt {job.attempts}/{job.max_attempts}): {error_message}")
             
         except Exception as e:
             logger.error(f"Error marking fixture processing failed: {e}")
             raise
     
-    async def save_generated_articles(self, fixture_id: str, processing_id: str, articles: List[Dict]):
+    async def save_generated_articles(self, fixture_id: str, processing_id: str, articles: List[Dict],
+                                      matchday: Optional[int] = None):
         """
         Save generated articles to the database and export as markdown files
         
@@ -376,6 +489,7 @@ class FixtureService:
             fixture_id: ID of the fixture
             processing_id: ID of the processing status
             articles: List of article dictionaries
+            matchday: Matchday of the fixture, used for cache invalidation
         """
         try:
             # Create generated_articles directory if it doesn't exist
@@ -443,7 +557,10 @@ class FixtureService:
                     'content': content,
                     'article_type': article_type,
                     'word_count': word_count,
-                    'file_path': str(file_path) if markdown_files_created[-1] else ''
+                    'excerpt': make_excerpt(content),
+                    'read_time': estimate_read_time(word_count),
+                    'file_path': str(file_path) if markdown_files_created[-1] else '',
+                    'image_status': 'pending'
                 })
             
             # Save to database and generate images
@@ -451,27 +568,23 @@ class FixtureService:
                 # Insert articles and get their IDs
                 insert_result = self.supabase.table('generated_articles').insert(article_data).execute()
                 
-                # Generate images for each article
-                for i, article in enumerate(articles):
-                    if i < len(insert_result.data):
-                        article_id = insert_result.data[i]['id']
-                        title = article.get('title', '')
-                        content = article.get('content', '')
-                        
-                        print(f"🖼️ Generating image for article: {title}")
-                        
-                        # Generate image using Gemini
-                        image_data = self.generate_image_with_gemini(title, content)
-                        
-                        if image_data:
-                            # Upload to Supabase storage
-                            image_url = self.upload_image_to_storage(article_id, image_data)
-                            if image_url:
-                                print(f"✅ Image generated and stored for article: {title}")
-                            else:
-                                print(f"⚠️ Image generated but failed to upload for article: {title}")
-                        else:
-                            print(f"⚠️ Failed to generate image for article: {title}")
+                # Let the API drop cached pages as soon as the articles are readable
+                publish_safely(self.invalidation, InvalidationEvent(
+                    kind='articles',
+                    fixture_id=fixture_id,
+                    matchday=matchday,
+                    article_ids=[str(row['id']) for row in insert_result.data]
+                ))
+                
+                # Generate images for the inserted articles
+                await self.generate_images_for_articles([
+                    {
+                        'id': row['id'],
+                        'title': data['title'],
+                        'excerpt': data['excerpt']
+                    }
+                    for data, row in zip(article_data, insert_result.data)
+                ])
             
             successful_files = [f for f in markdown_files_created if f]
             print(f"💾 Saved {len(articles)} articles for fixture {fixture_id}")
@@ -481,12 +594,13 @@ class FixtureService:
             logger.error(f"Error saving articles: {e}")
             raise
     
-    async def process_completed_fixture(self, fixture: Fixture) -> bool:
+    async def process_completed_fixture(self, fixture: Fixture, job: FixtureJob) -> bool:
         """
         Process a completed fixture using the crew AI system
         
         Args:
             fixture: Fixture object to process
+            job: The fixture's claimed processing job
             
         Returns:
             True if processing was successful, False otherwise
@@ -494,8 +608,7 @@ class FixtureService:
         try:
             print(f"⚽ Processing completed fixture: {fixture.home_team} vs {fixture.away_team} (Date: {fixture.match_date})")
             
-            # Mark processing as started
-            processing_id = await self.mark_fixture_processing_started(fixture.id)
+            processing_id = job.id
             
             # Prepare fixture details for the crew AI
             fixture_details = {
@@ -515,17 +628,32 @@ class FixtureService:
             
             print(f"📝 Generating articles for specific fixture: {fixture.home_team} {fixture.home_score}-{fixture.away_score} {fixture.away_team}")
             
-            # Generate articles using the crew for this specific fixture
-            result = self.crew.create_articles_for_specific_fixture(
-                fixture_details=fixture_details,
-                target_length="800-1200 words"
+            # Generate articles using the crew for this specific fixture (blocking, so in a worker thread)
+            result = await asyncio.get_running_loop().run_in_executor(
+                self.crew_executor,
+                partial(
+                    self.crew.create_articles_for_specific_fixture,
+                    fixture_details=fixture_details,
+                    target_length="800-1200 words"
+                )
             )
             
             if not result or 'error' in result:
                 error_msg = result.get('error', 'Unknown error') if result else 'No result returned'
-                await self.mark_fixture_processing_failed(fixture.id, error_msg)
+                await self.mark_fixture_processing_failed(fixture, job, error_msg)
                 return False
             
+            # If the lease expired during a slow crew run, another worker may have claimed the
+            # fixture; drop this result so its articles and score aren't written twice
+            if not await asyncio.get_running_loop().run_in_executor(None, self.job_queue.confirm_lease, job):
+                logger.error(f"Lost the lease on fixture {fixture.id} while its crew ran, discarding the result")
+                self.fixture_writes.discard(fixture.id)
+                return False
+            
+            # Write the fixture's score correction before its articles and completion, so a crash
+            # or failed write leaves the job to be retried instead of losing the correction
+            await self.flush_fixture_writes([fixture.id])
+            
             # Extract articles from the result
             articles = result.get('articles', [])
             topics = result.get('topics', [])
@@ -533,7 +661,7 @@ class FixtureService:
             # Check if score was updated during data collection
             score_update_result = result.get('score_update_result', {})
             if score_update_result.get('updated', False):
-                print(f"✅ Score updated during data collection: {score_update_result.get('old_score', 'N/A')} → {score_update_result.get('found_score', 'N/A')}")
+                print(f"✅ Score corrected during data collection: {score_update_result.get('old_score', 'N/A')} → {score_update_result.get('found_score', 'N/A')} (written before the articles are saved)")
             elif score_update_result.get('found', False):
                 print(f"ℹ️ Score confirmed during data collection: {score_update_result.get('found_score', 'N/A')}")
             
@@ -541,84 +669,110 @@ class FixtureService:
             
             # Save articles to database
             if articles:
-                await self.save_generated_articles(fixture.id, processing_id, articles)
+                await self.save_generated_articles(fixture.id, processing_id, articles, matchday=fixture.matchday)
             
             # Mark processing as completed
-            await self.mark_fixture_processing_completed(
-                fixture.id,
-                len(articles),
-                len(topics)
-            )
+            if not await self.mark_fixture_processing_completed(fixture, job, len(articles), len(topics)):
+                return False
             
             print(f"🎉 Successfully processed fixture {fixture.id}: {fixture.home_team} vs {fixture.away_team}")
             return True
             
         except Exception as e:
             logger.error(f"Error processing fixture {fixture.id}: {e}")
-            await self.mark_fixture_processing_failed(fixture.id, str(e))
+            await self.mark_fixture_processing_failed(fixture, job, str(e))
             return False
         
-    async def run_fixture_processing(self):
+    async def process_fixture_jobs(self) -> List[bool]:
         """
-        Process all completed fixtures that haven't been processed yet
+        Claim and process queued fixtures with up to `fixture_workers` jobs in flight
+        
+        Each worker claims one job at a time and holds its lease with heartbeats
+        while the crew runs. A failure only affects its own fixture.
+        
+        Returns:
+            Success flag for each job processed
         """
-        print(f"🚀 Starting fixture processing for all completed fixtures...")
+        loop = asyncio.get_running_loop()
+        results = []
         
-        try:
-            # Get unprocessed completed fixtures
-            fixtures = await self.get_unprocessed_completed_fixtures()
-            
-            if not fixtures:
-                print(f"ℹ️ No unprocessed completed fixtures found")
-                return
-            
-            # Process each fixture
-            for fixture in fixtures:
-                print(f"⚡ Processing fixture: {fixture.home_team} vs {fixture.away_team} (Date: {fixture.match_date})")
-                success = await self.process_completed_fixture(fixture)
+        async def worker():
+            while True:
+                jobs = await loop.run_in_executor(None, self.job_queue.claim, 1)
+                if not jobs:
+                    return
+                job = jobs[0]
                 
-                if success:
-                    print(f"✅ Successfully processed fixture: {fixture.home_team} vs {fixture.away_team}")
-                else:
-                    print(f"❌ Failed to process fixture: {fixture.home_team} vs {fixture.away_team}")
-                    
-        except Exception as e:
-            logger.error(f"Error in fixture processing: {e}")
-            raise
+                async with self.job_queue.lease(job):
+                    try:
+                        success = await self.process_job(job)
+                    except Exception as e:
+                        logger.error(f"Error processing job {job.id} (fixture {job.fixture_id}): {e}")
+                        success = False
+                        try:
+                            await loop.run_in_executor(None, self.job_queue.fail, job, str(e))
+                        except Exception:
+                            # Left in progress, the job is re-queued when its lease expires
+                            pass
+                
+                results.append(success)
+                status = "✅ Successfully processed" if success else "❌ Failed to process"
+                print(f"{status} fixture {job.fixture_id} (attempt {job.attempts}/{job.max_attempts}, "
+                      f"{len(results)} jobs done)")
+        
+        await asyncio.gather(*(worker() for _ in range(self.fixture_workers)))
+        return results
+    
+    async def process_job(self, job: FixtureJob) -> bool:
+        """Load a claimed job's fixture and process it"""
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(
+            None,
+            lambda: self.supabase.table('fixtures').select(FIXTURE_COLUMNS).eq('id', job.fixture_id).execute()
+        )
+        if not result.data:
+            await loop.run_in_executor(None, self.job_queue.fail, job, 'Fixture not found')
+            return False
+        
+        fixture = Fixture.from_row(result.data[0])
+        print(f"⚡ Processing fixture: {fixture.home_team} vs {fixture.away_team} (Date: {fixture.match_date})")
+        return await self.process_completed_fixture(fixture, job)
     
     async def get_articles_without_images(self) -> List[Dict]:
         """
         Get all articles that don't have images in Supabase storage
         
+        Articles whose image_status is 'pending' need an image. Articles saved
+        before image_status existed (NULL) are checked once against a listing
+        of the bucket and marked 'ready' if their image is already there.
+        
         Returns:
             List of article dictionaries that need images
         """
         try:
-            # Get all articles from the database
+            # Only articles without a stored image
             articles_result = self.supabase.table('generated_articles').select(
-                'id, title, content, fixture_id, fixtures!inner(home_team, away_team, match_date)'
-            ).execute()
-            
-            articles_without_images = []
-            
-            for article in articles_result.data:
-                article_id = article['id']
-                
-                # Check if image exists in Supabase storage
-                try:
-                    # Try to get the file from storage
-                    self.supabase.storage.from_('article-images').download(f"{article_id}.jpg")
-                    # If no exception, image exists, skip this article
-                    continue
-                except Exception:
-                    # Image doesn't exist, add to list
-                    articles_without_images.append({
-                        'id': article_id,
-                        'title': article['title'],
-                        'content': article['content'],
-                        'fixture_id': article['fixture_id'],
-                        'fixture': article.get('fixtures', {})
-                    })
+                'id, title, excerpt, fixture_id, image_status, fixtures!inner(home_team, away_team, match_date)'
+            ).or_('image_status.is.null,image_status.eq.pending').execute()
+            
+            unchecked = [article for article in articles_result.data if article.get('image_status') is None]
+            stored = set()
+            if unchecked:
+                stored = self.list_stored_images()
+                self.set_image_status([article['id'] for article in unchecked if article['id'] in stored], 'ready')
+                self.set_image_status([article['id'] for article in unchecked if article['id'] not in stored], 'pending')
+            
+            articles_without_images = [
+                {
+                    'id': article['id'],
+                    'title': article['title'],
+                    'excerpt': article.get('excerpt') or '',
+                    'fixture_id': article['fixture_id'],
+                    'fixture': article.get('fixtures', {})
+                }
+                for article in articles_result.data
+                if article['id'] not in stored
+            ]
             
             print(f"📋 Found {len(articles_without_images)} articles without images")
             return articles_without_images
@@ -640,37 +794,18 @@ class FixtureService:
         
         print(f"🖼️ Generating images for {len(articles)} articles...")
         
-        for article in articles:
-            article_id = article['id']
-            title = article['title']
-            content = article['content']
-            fixture = article.get('fixture', {})
-            
-            print(f"🖼️ Generating image for article: {title}")
-            print(f"   Fixture: {fixture.get('home_team', 'Unknown')} vs {fixture.get('away_team', 'Unknown')}")
-            
-            try:
-                # Generate image using Gemini
-                image_data = self.generate_image_with_gemini(title, content)
-                
-                if image_data:
-                    # Upload to Supabase storage
-                    image_url = self.upload_image_to_storage(article_id, image_data)
-                    if image_url:
-                        print(f"✅ Image generated and stored for article: {title}")
-                    else:
-                        print(f"⚠️ Image generated but failed to upload for article: {title}")
-                else:
-                    print(f"⚠️ Failed to generate image for article: {title}")
-                
-                # Add a small delay to avoid overwhelming the API
-                await asyncio.sleep(1)
-                
-            except Exception as e:
-                print(f"❌ Error generating image for article {title}: {e}")
-                continue
+        titles = {article['id']: article['title'] for article in articles}
+        results = await self.image_generation.run(articles)
+        
+        for result in results:
+            title = titles[result.article_id]
+            if result.image_url:
+                print(f"✅ Image generated and stored for article: {title}")
+            else:
+                print(f"⚠️ Failed to create image for article {title} after {result.attempts} attempts: {result.error}")
         
-        print(f"🏁 Image generation completed for {len(articles)} articles")
+        stored = sum(1 for result in results if result.image_url)
+        print(f"🏁 Image generation completed: {stored}/{len(articles)} articles have images")
 
     async def run_fixture_processing(self):
         """
@@ -680,28 +815,23 @@ class FixtureService:
         print(f"🚀 Starting fixture processing for all completed fixtures...")
         
         try:
-            # Step 1: Get unprocessed completed fixtures
+            # Step 1: Queue completed fixtures that don't have a processing job yet
             fixtures = await self.get_unprocessed_completed_fixtures()
             
             if fixtures:
-                print(f"📝 Processing {len(fixtures)} unprocessed completed fixtures...")
-                # Process each fixture
-                for fixture in fixtures:
-                    print(f"⚡ Processing fixture: {fixture.home_team} vs {fixture.away_team} (Date: {fixture.match_date})")
-                    success = await self.process_completed_fixture(fixture)
-                    
-                    if success:
-                        print(f"✅ Successfully processed fixture: {fixture.home_team} vs {fixture.away_team}")
-                    else:
-                        print(f"❌ Failed to process fixture: {fixture.home_team} vs {fixture.away_team}")
-                    
-                    # Add a small delay between processing to avoid overwhelming the API
-                    await asyncio.sleep(2)
-                
-                print(f"✅ Processed {len(fixtures)} unprocessed completed fixtures.")
+                self.job_queue.enqueue([fixture.id for fixture in fixtures])
             else:
                 print(f"ℹ️ No unprocessed completed fixtures found")
             
+            # Jobs include retries that are due and jobs abandoned by other workers
+            print(f"📝 Processing queued fixtures with {self.fixture_workers} workers...")
+            results = await self.process_fixture_jobs()
+            if results:
+                print(f"✅ Processed {len(results)} queued fixtures ({sum(results)} succeeded).")
+            else:
+                print(f"ℹ️ No queued fixtures are due")
+            await self.retry_fixture_writes()
+            
             # Step 2: Generate images for articles that don't have them
             print(f"🖼️ Checking for articles without images...")
             articles_without_images = await self.get_articles_without_images()
@@ -716,25 +846,135 @@ class FixtureService:
         except Exception as e:
             logger.error(f"Error during fixture processing: {e}")
     
+    async def flush_fixture_writes(self, fixture_ids: Optional[List[str]] = None) -> int:
+        """
+        Write queued fixture updates and tell the API about them
+        
+        Args:
+            fixture_ids: Only write these fixtures' updates (default: every queued update)
+        
+        Returns:
+            Number of fixtures updated
+        
+        Raises:
+            Exception: If the write fails; the updates stay queued
+        """
+        if not len(self.fixture_writes):
+            return 0
+        
+        updated = await asyncio.get_running_loop().run_in_executor(
+            None, partial(self.fixture_writes.flush, fixture_ids)
+        )
+        
+        for fixture in updated:
+            publish_safely(self.invalidation, InvalidationEvent(
+                kind='score',
+                fixture_id=str(fixture['id']),
+                matchday=fixture.get('matchday')
+            ))
+        print(f"💾 Wrote {len(updated)} fixture score updates")
+        return len(updated)
+    
+    async def retry_fixture_writes(self):
+        """Write updates left queued by a failed write; errors are logged and retried on the next wake-up"""
+        try:
+            await self.flush_fixture_writes()
+        except Exception as e:
+            logger.error(f"Error writing {len(self.fixture_writes)} queued score updates: {e}")
+    
+    def get_calendar_signature(self) -> tuple:
+        """Get a fingerprint of the fixtures table that changes whenever fixtures are added or updated"""
+        result = self.supabase.table('fixtures').select(
+            'updated_at', count='exact'
+        ).order('updated_at', desc=True).limit(1).execute()
+        return (result.count, result.data[0]['updated_at'] if result.data else None)
+    
+    def reload_calendar(self):
+        """Load the due times of upcoming fixtures into the scheduler"""
+        now = datetime.utcnow()
+        signature = self.get_calendar_signature()
+        
+        earliest_date = (now - self.scheduler.completion_delay).date().isoformat()
+        result = self.supabase.table('fixtures').select(
+            'id, match_date, match_time'
+        ).gte('match_date', earliest_date).execute()
+        
+        self.scheduler.load(result.data, now)
+        # Only recorded once loaded, so a failed load is retried on the next check
+        self.calendar_signature = signature
+        next_wake = self.scheduler.next_wake()
+        print(f"📅 Loaded {len(self.scheduler)} upcoming fixtures"
+              f"{f', next due at {next_wake:%Y-%m-%d %H:%M} GMT' if next_wake else ''}")
+    
+    def seconds_until_next_run(self, max_wait: int) -> float:
+        """Get the seconds until the next fixture or queued retry is due, capped at max_wait"""
+        wait = float(max_wait)
+        
+        next_wake = self.scheduler.next_wake()
+        if next_wake:
+            wait = min(wait, (next_wake - datetime.utcnow()).total_seconds())
+        
+        job_due_in = self.job_queue.next_due_in()
+        if job_due_in is not None:
+            wait = min(wait, job_due_in)
+        
+        return max(wait, 0.0)
+    
     async def run_service(self, processing_interval: int = 3600):
         """
         Run the fixture service continuously to process all completed fixtures
         
+        Processing runs when fixtures become due (kickoff + completion delay, batched when
+        they are due together) or queued retries are due. In between the service sleeps,
+        waking at least every processing_interval seconds to check for fixture changes.
+        
         Args:
-            processing_interval: Interval in seconds between processing runs (default: 5 minutes)
+            processing_interval: Longest sleep in seconds between checks (default: 1 hour)
         """
         print("🚀 Starting Fixture Processing Service...")
-        print(f"⏰ Processing interval: {processing_interval} seconds")
-        print(f"📅 Processing all completed fixtures")
+        print(f"⏰ Checking for fixture changes at least every {processing_interval} seconds")
+        print(f"📅 Processing fixtures {self.completion_delay_hours} hours after kickoff")
         
         try:
-            while True:
-                # Run fixture processing for all completed fixtures
+            run_pending = False
+            try:
+                # Catch up on fixtures that became due while the service was down
                 await self.run_fixture_processing()
+                self.reload_calendar()
+                wait = self.seconds_until_next_run(processing_interval)
+            except Exception as e:
+                # Retried by the first check: the catch-up run stays pending and an unloaded
+                # calendar is reloaded because its signature was never recorded
+                logger.error(f"Error starting the fixture schedule: {e}")
+                run_pending = True
+                wait = min(processing_interval, 300)
+            
+            while True:
+                print(f"⏳ Sleeping {wait:.0f} seconds until the next check...")
+                await asyncio.sleep(wait)
                 
-                # Wait for next cycle
-                print(f"⏳ Processing cycle completed. Waiting {processing_interval} seconds...")
-                await asyncio.sleep(processing_interval)
+                try:
+                    await self.retry_fixture_writes()
+                    
+                    due = self.scheduler.pop_due(datetime.utcnow())
+                    if due:
+                        print(f"⚽ {len(due)} fixtures became due")
+                        run_pending = True
+                    
+                    if self.get_calendar_signature() != self.calendar_signature:
+                        print("📅 Fixtures changed, reloading the calendar")
+                        self.reload_calendar()
+                    
+                    job_due_in = self.job_queue.next_due_in()
+                    if run_pending or (job_due_in is not None and job_due_in <= 0):
+                        await self.run_fixture_processing()
+                        run_pending = False
+                    
+                    wait = self.seconds_until_next_run(processing_interval)
+                except Exception as e:
+                    # Due fixtures stay pending, so they are processed once the database is reachable
+                    logger.error(f"Error checking the fixture schedule: {e}")
+                    wait = min(processing_interval, 300)
                 
         except KeyboardInterrupt:
             print("🛑 Fixture Service stopped by user")
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Batched fixture writes for the English Football Fixture Service
+Score corrections found while crews run are queued here instead of each one
+opening its own connection, and written with the update_fixture_scores RPC
+when their fixture's job completes. Updates left by a failed write are
+written together by the next flush.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
+
+if TYPE_CHECKING:
+    from supabase import Client
+
+logger = logging.getLogger(__name__)
+
+class FixtureWriteBatch:
+    """Thread-safe queue of fixture score updates, flushed in one round trip"""
+
+    def __init__(self, supabase: Client):
+        """
+        Initialize the batch
+
+        Args:
+            supabase: Supabase client shared with the rest of the service
+        """
+        self.supabase = supabase
+        self._scores: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._scores)
+
+    def update_score(self, fixture_id: str, home_score: int, away_score: int):
+        """Queue a fixture's score; a later update of the same fixture replaces an earlier one"""
+        with self._lock:
+            self._scores[str(fixture_id)] = {'id': str(fixture_id), 'home_score': home_score, 'away_score': away_score}
+
+    def discard(self, fixture_id: str):
+        """Drop a fixture's queued update, if any"""
+        with self._lock:
+            self._scores.pop(str(fixture_id), None)
+
+    def flush(self, fixture_ids: Optional[Iterable[str]] = None) -> List[Dict]:
+        """
+        Write the queued updates
+
+        Args:
+            fixture_ids: Only write these fixtures' updates (default: every queued update)
+
+        Returns:
+            The fixtures updated, as dictionaries with 'id' and 'matchday'
+
+        Raises:
+            Exception: If the write fails; the updates stay queued for the next flush
+        """
+        with self._lock:
+            if fixture_ids is None:
+                pending, self._scores = self._scores, {}
+            else:
+                pending = {
+                    str(fixture_id): self._scores.pop(str(fixture_id))
+                    for fixture_id in fixture_ids if str(fixture_id) in self._scores
+                }
+        if not pending:
+            return []
+
+        try:
+            result = self.supabase.rpc('update_fixture_scores', {'scores': list(pending.values())}).execute()
+        except Exception:
+            with self._lock:
+                # Updates queued since the flush started are newer, keep them
+                self._scores = {**pending, **self._scores}
+            raise
+
+        updated = result.data or []
+        if len(updated) < len(pending):
+            logger.warning(f"{len(pending) - len(updated)} queued score updates matched no fixture")
+        return updated
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Responsive image derivatives for the English Football Fixture Service
+Resizes each generated article image to the widths the frontend displays and
+encodes them as WebP with a JPEG fallback, in a process pool so PIL encoding
+doesn't block the service loop.
+
+Storage keys (flat, next to the original {article_id}.jpg):
+    {article_id}-{size}.webp
+    {article_id}-{size}.jpg
+"""
+
+import asyncio
+import io
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional, Tuple
+
+from PIL import Image, ImageOps
+
+logger = logging.getLogger(__name__)
+
+# Display widths in pixels (must match IMAGE_SIZES in api/config.py)
+DERIVATIVE_WIDTHS = {
+    'strip': 320,  # Gameweek strip cards
+    'card': 640,   # Article list cards
+    'hero': 1280   # Featured hero panel and article pages
+}
+
+# Encoder settings per format: (file extension, content type, save options)
+DERIVATIVE_FORMATS = {
+    'WEBP': ('webp', 'image/webp', {'quality': 80, 'method': 4}),
+    'JPEG': ('jpg', 'image/jpeg', {'quality': 82, 'optimize': True, 'progressive': True})
+}
+
+def derivative_key(article_id: str, size: str, image_format: str) -> str:
+    """Get the storage key of one derivative"""
+    extension = DERIVATIVE_FORMATS[image_format][0]
+    return f"{article_id}-{size}.{extension}"
+
+def render_derivatives(image_data: bytes) -> Dict[Tuple[str, str], bytes]:
+    """
+    Resize and encode every derivative of an image (runs in a worker process)
+
+    Images are never upscaled, so a size wider than the original gets the
+    original dimensions. EXIF, ICC and other metadata are dropped.
+
+    Returns:
+        Dictionary mapping (size, format) to encoded bytes
+    """
+    with Image.open(io.BytesIO(image_data)) as original:
+        image = ImageOps.exif_transpose(original).convert('RGB')
+    image.info.clear()
+
+    derivatives = {}
+    for size, width in DERIVATIVE_WIDTHS.items():
+        if image.width > width:
+            resized = image.resize((width, round(image.height * width / image.width)), Image.LANCZOS)
+        else:
+            resized = image
+
+        for image_format, (_, _, options) in DERIVATIVE_FORMATS.items():
+            buffer = io.BytesIO()
+            resized.save(buffer, format=image_format, **options)
+            derivatives[(size, image_format)] = buffer.getvalue()
+
+    return derivatives
+
+class ImageDerivativePipeline:
+    """Renders image derivatives in a process pool"""
+
+    def __init__(self, max_workers: int = 2):
+        """
+        Initialize the pipeline
+
+        Args:
+            max_workers: Number of worker processes (the pool is created on first use)
+        """
+        self.max_workers = max_workers
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    async def render(self, image_data: bytes) -> Dict[Tuple[str, str], bytes]:
+        """Render all derivatives of an image without blocking the event loop"""
+        if self._pool is None:
+            # Spawned rather than forked: by now the service runs crew, image and executor
+            # threads, and a forked child could inherit a lock one of them held
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers,
+                                             mp_context=multiprocessing.get_context('spawn'))
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, render_derivatives, image_data)
+
+    def shutdown(self):
+        """Stop the worker processes"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Concurrent article image generation for the English Football Fixture Service
+Runs the blocking image generator in a bounded thread pool behind a token
+bucket sized to the provider's quota, and pipelines generation with uploads
+so the next prompt is in flight while the previous image is being stored.
+
+The generator and store callables are injected, so the pool can be exercised
+with a local fake generator:
+
+    pool = ImageGenerationPool(lambda title, excerpt: b'...', fake_store, workers=8)
+    results = asyncio.run(pool.run(articles))
+"""
+
+import asyncio
+import logging
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (article title, article excerpt) -> image bytes, or None on failure
+ImageGenerator = Callable[[str, str], Optional[bytes]]
+# (article id, image bytes) -> public URL, or None on failure
+ImageStore = Callable[[str, bytes], Awaitable[Optional[str]]]
+
+@dataclass
+class ImageGenerationResult:
+    """Data class for the outcome of one article's image generation"""
+    article_id: str
+    image_url: Optional[str]
+    attempts: int
+    error: Optional[str] = None
+
+class TokenBucket:
+    """
+    Async token bucket limiting how often requests are started
+
+    Tokens refill continuously at `rate_per_minute`; up to `capacity` unused
+    tokens accumulate, allowing a short burst after an idle period.
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: int = 1):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def acquire(self):
+        """Wait until a token is available and take it"""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        # Waiters queue on the lock, so tokens are handed out in arrival order
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+class ImageGenerationPool:
+    """Bounded, rate-limited worker pool that generates and stores article images"""
+
+    def __init__(self, generate: ImageGenerator, store: ImageStore, workers: int = 4,
+                 upload_workers: int = 2, requests_per_minute: float = 10, max_retries: int = 3,
+                 backoff_base: float = 2.0, backoff_max: float = 60.0):
+        """
+        Initialize the pool
+
+        Args:
+            generate: Blocking image generator, run in the pool's threads
+            store: Coroutine uploading an image and returning its URL
+            workers: Number of concurrent generation requests
+            upload_workers: Number of concurrent uploads
+            requests_per_minute: Generation requests allowed per minute (provider quota)
+            max_retries: Retries per article after a failed generation
+            backoff_base: First retry delay in seconds, doubled on each retry
+            backoff_max: Upper bound for a retry delay in seconds
+        """
+        self.generate = generate
+        self.store = store
+        self.workers = workers
+        self.upload_workers = upload_workers
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        # Shared across runs so the quota holds between processing cycles
+        self.limiter = TokenBucket(requests_per_minute, capacity=workers)
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='image-generation')
+
+    def retry_delay(self, attempt: int) -> float:
+        """Get the jittered backoff delay before retry number `attempt` (1-based)"""
+        delay = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        return delay * random.uniform(0.5, 1.0)
+
+    async def run(self, articles: List[Dict]) -> List[ImageGenerationResult]:
+        """
+        Generate and store images for articles
+
+        Args:
+            articles: Article dictionaries with 'id', 'title' and 'excerpt'
+
+        Returns:
+            One result per article, in input order
+        """
+        pending: asyncio.Queue = asyncio.Queue()
+        for article in articles:
+            pending.put_nowait(article)
+        # Bounded so generation can't run far ahead of slow uploads
+        uploads: asyncio.Queue = asyncio.Queue(maxsize=self.upload_workers * 2)
+        results: Dict[str, ImageGenerationResult] = {}
+
+        async def generation_worker():
+            while not pending.empty():
+                article = pending.get_nowait()
+                image_data, attempts, error = await self._generate_with_retry(article)
+                if image_data is None:
+                    results[article['id']] = ImageGenerationResult(article['id'], None, attempts, error)
+                else:
+                    await uploads.put((article, image_data, attempts))
+
+        async def upload_worker():
+            while True:
+                item = await uploads.get()
+                if item is None:
+                    return
+                article, image_data, attempts = item
+                try:
+                    image_url = await self.store(article['id'], image_data)
+                    error = None if image_url else 'upload failed'
+                except Exception as e:
+                    image_url, error = None, str(e)
+                results[article['id']] = ImageGenerationResult(article['id'], image_url, attempts, error)
+
+        uploaders = [asyncio.ensure_future(upload_worker()) for _ in range(self.upload_workers)]
+        try:
+            await asyncio.gather(*(generation_worker() for _ in range(min(self.workers, len(articles)))))
+            for _ in uploaders:
+                await uploads.put(None)
+            await asyncio.gather(*uploaders)
+        finally:
+            for uploader in uploaders:
+                uploader.cancel()
+
+        return [results[article['id']] for article in articles]
+
+    async def _generate_with_retry(self, article: Dict) -> Tuple[Optional[bytes], int, Optional[str]]:
+        """Generate one image, retrying failures with backoff"""
+        loop = asyncio.get_running_loop()
+        error = None
+
+        for attempt in range(1, self.max_retries + 2):
+            await self.limiter.acquire()
+            try:
+                image_data = await loop.run_in_executor(
+                    self._executor, self.generate, article['title'], article.get('excerpt', '')
+                )
+                if image_data:
+                    return image_data, attempt, None
+                error = 'no image returned'
+            except Exception as e:
+                error = str(e)
+
+            if attempt <= self.max_retries:
+                delay = self.retry_delay(attempt)
+                logger.warning(f"Image generation for article {article['id']} failed ({error}), "
+                               f"retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
+        return None, self.max_retries + 1, error
+
+    def shutdown(self):
+        """Stop the generation threads"""
+        self._executor.shutdown(wait=False)
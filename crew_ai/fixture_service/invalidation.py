@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Cache invalidation events for the English Football Fixture Service
+Publishes a small JSON event whenever the service writes articles, processing
+status or scores, so the read API can evict only the cache entries affected.
+
+Wire format (one JSON object per line / datagram):
+    {"kind": "articles", "fixture_id": "...", "matchday": 5,
+     "article_ids": ["..."], "published_at": 1700000000.0}
+"""
+
+import json
+import logging
+import os
+import socket
+import time
+from dataclasses import dataclass, field, asdict
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class InvalidationEvent:
+    """Data class for a cache invalidation event"""
+    kind: str  # articles, fixture_status, score
+    fixture_id: Optional[str] = None
+    matchday: Optional[int] = None
+    article_ids: List[str] = field(default_factory=list)
+    published_at: float = field(default_factory=time.time)
+
+    def to_json(self) -> str:
+        """Serialize the event to a single line of JSON"""
+        return json.dumps(asdict(self), separators=(',', ':'))
+
+class InvalidationChannel:
+    """Base channel that drops every event (used when invalidation is disabled)"""
+
+    def publish(self, event: InvalidationEvent):
+        """Publish an event to subscribers"""
+        pass
+
+class FileInvalidationChannel(InvalidationChannel):
+    """Appends events as JSON lines to a file that subscribers tail"""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def publish(self, event: InvalidationEvent):
+        # Single short appends are atomic enough for concurrent writers on one host
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(event.to_json() + '\n')
+
+class UnixSocketInvalidationChannel(InvalidationChannel):
+    """Sends events as datagrams to a Unix socket bound by the subscriber"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+
+    def publish(self, event: InvalidationEvent):
+        try:
+            self._socket.sendto(event.to_json().encode('utf-8'), self.path)
+        except (FileNotFoundError, ConnectionRefusedError):
+            # Nobody is listening (e.g. the API is not running); nothing to invalidate
+            pass
+
+def create_invalidation_channel(channel_type: str, path: str) -> InvalidationChannel:
+    """
+    Create an invalidation channel
+
+    Args:
+        channel_type: 'none', 'file' or 'unix'
+        path: File or socket path used by the channel
+
+    Returns:
+        Invalidation channel instance
+    """
+    channel_type = (channel_type or 'none').lower()
+
+    if channel_type == 'file':
+        return FileInvalidationChannel(path)
+    if channel_type == 'unix':
+        return UnixSocketInvalidationChannel(path)
+    if channel_type != 'none':
+        logger.error(f"Unknown invalidation channel '{channel_type}', invalidation disabled")
+    return InvalidationChannel()
+
+def publish_safely(channel: InvalidationChannel, event: InvalidationEvent):
+    """Publish an event, logging instead of raising so writers never fail on invalidation"""
+    try:
+        channel.publish(event)
+    except Exception as e:
+        logger.error(f"Error publishing invalidation event {event.kind} for fixture {event.fixture_id}: {e}")
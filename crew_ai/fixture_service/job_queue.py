@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Fixture processing job queue for the English Football Fixture Service
+Rows of fixture_processing_status are jobs. Workers claim them atomically
+through the claim_fixture_jobs RPC (SELECT ... FOR UPDATE SKIP LOCKED), hold
+a lease that a heartbeat keeps extending, and finish them as completed,
+failed (retried after a backoff) or dead (out of attempts). Jobs whose worker
+died are re-queued once their lease expires, so several service replicas can
+process fixtures without doing the same fixture twice.
+
+Job states:
+    pending -> in_progress -> completed
+                           -> failed -> in_progress (after the retry delay)
+                           -> dead (after max_attempts)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import socket
+import uuid
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, List, Optional
+
+if TYPE_CHECKING:
+    from supabase import Client
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class FixtureJob:
+    """Data class for a claimed fixture processing job"""
+    id: str
+    fixture_id: str
+    attempts: int
+    max_attempts: int
+    lease_lost: bool = False
+
+def make_worker_id() -> str:
+    """Get an identifier for this worker process, unique across hosts and restarts"""
+    return f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+
+class FixtureJobQueue:
+    """Leased job queue stored in the fixture_processing_status table"""
+
+    def __init__(self, supabase: Client, worker_id: Optional[str] = None, lease_seconds: int = 600,
+                 heartbeat_interval: int = 60, max_attempts: int = 3, retry_delay: int = 60):
+        """
+        Initialize the queue
+
+        Args:
+            supabase: Supabase client
+            worker_id: Lease owner name (generated if not given)
+            lease_seconds: How long a claim stays valid without a heartbeat
+            heartbeat_interval: Seconds between lease extensions while a job runs
+            max_attempts: Attempts before a job is dead-lettered
+            retry_delay: Delay before the first retry in seconds, doubled per attempt
+        """
+        self.supabase = supabase
+        self.worker_id = worker_id or make_worker_id()
+        self.lease_seconds = lease_seconds
+        self.heartbeat_interval = heartbeat_interval
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+
+    def enqueue(self, fixture_ids: List[str]) -> None:
+        """Add jobs for fixtures; fixtures that already have a job are left alone"""
+        if not fixture_ids:
+            return
+        self.supabase.table('fixture_processing_status').upsert(
+            [
+                {'fixture_id': fixture_id, 'processing_status': 'pending', 'max_attempts': self.max_attempts}
+                for fixture_id in fixture_ids
+            ],
+            on_conflict='fixture_id',
+            ignore_duplicates=True
+        ).execute()
+
+    def claim(self, batch_size: int = 1) -> List[FixtureJob]:
+        """Claim up to batch_size due jobs for this worker"""
+        result = self.supabase.rpc('claim_fixture_jobs', {
+            'worker_id': self.worker_id,
+            'batch_size': batch_size,
+            'lease_seconds': self.lease_seconds
+        }).execute()
+        return [
+            FixtureJob(
+                id=str(row['id']),
+                fixture_id=str(row['fixture_id']),
+                attempts=row['attempts'],
+                max_attempts=row['max_attempts']
+            )
+            for row in result.data or []
+        ]
+
+    def heartbeat(self, job: FixtureJob) -> bool:
+        """Extend a job's lease; returns False if the lease was lost to another worker"""
+        result = self.supabase.rpc('heartbeat_fixture_job', {
+            'job_id': job.id,
+            'worker_id': self.worker_id,
+            'lease_seconds': self.lease_seconds
+        }).execute()
+        if not result.data:
+            job.lease_lost = True
+        return bool(result.data)
+
+    def confirm_lease(self, job: FixtureJob) -> bool:
+        """
+        Check the lease is still held before a job's results are written, extending it
+
+        Returns:
+            False if the lease was lost, in which case another worker may own the job
+            and this worker's results must be dropped
+        """
+        return not job.lease_lost and self.heartbeat(job)
+
+    def complete(self, job: FixtureJob, articles_generated: int, topics_generated: int) -> bool:
+        """
+        Mark a job completed
+
+        Returns:
+            False if the lease was lost, in which case the job is left as it is
+        """
+        result = self.supabase.table('fixture_processing_status').update({
+            'processing_status': 'completed',
+            'articles_generated': articles_generated,
+            'topics_generated': topics_generated,
+            'error_message': None,
+            'lease_owner': None,
+            'lease_expires_at': None
+        }).eq('id', job.id).eq('lease_owner', self.worker_id).execute()
+        return bool(result.data)
+
+    def fail(self, job: FixtureJob, error_message: str) -> Optional[str]:
+        """
+        Record a failed attempt
+
+        Returns:
+            The job's new status ('failed' to be retried, or 'dead'), or None if the lease was lost
+        """
+        result = self.supabase.rpc('fail_fixture_job', {
+            'job_id': job.id,
+            'worker_id': self.worker_id,
+            'error': error_message,
+            'retry_delay_seconds': self.retry_delay
+        }).execute()
+        return result.data or None
+
+    def next_due_in(self) -> Optional[float]:
+        """Get the seconds until the next job can be claimed, or None if no job is waiting"""
+        result = self.supabase.rpc('next_fixture_job_due_in', {}).execute()
+        return result.data
+
+    @asynccontextmanager
+    async def lease(self, job: FixtureJob):
+        """Keep a job's lease alive with heartbeats while the block runs; job.lease_lost is set if it's lost"""
+        loop = asyncio.get_running_loop()
+
+        async def beat():
+            while True:
+                await asyncio.sleep(self.heartbeat_interval)
+                try:
+                    if not await loop.run_in_executor(None, self.heartbeat, job):
+                        logger.error(f"Lost the lease on job {job.id} (fixture {job.fixture_id})")
+                        return
+                except Exception as e:
+                    # A missed heartbeat is fine as long as a later one lands before the lease expires
+                    logger.error(f"Heartbeat failed for job {job.id}: {e}")
+
+        heartbeat = asyncio.ensure_future(beat())
+        try:
+            yield job
+        finally:
+            heartbeat.cancel()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Kickoff-aware scheduling for the English Football Fixture Service
+Keeps a min-heap of the times fixtures become due for processing
+(kickoff + completion delay), so the service sleeps until the next fixture
+can be processed instead of polling on a fixed interval.
+
+All times are naive datetimes in GMT, like the fixtures table.
+"""
+
+import heapq
+from datetime import datetime, time, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Kickoff time assumed when a fixture has no match_time (matches the discovery query)
+DEFAULT_KICKOFF = time(15, 0)
+
+def parse_kickoff(match_date: str, match_time: Optional[str]) -> datetime:
+    """Combine a fixture's match_date and match_time (HH:MM or HH:MM:SS) into a datetime"""
+    kickoff_time = DEFAULT_KICKOFF
+    if match_time:
+        hours, minutes, *seconds = (int(float(part)) for part in str(match_time).split(':'))
+        kickoff_time = time(hours, minutes, seconds[0] if seconds else 0)
+    return datetime.combine(datetime.strptime(str(match_date)[:10], '%Y-%m-%d').date(), kickoff_time)
+
+class KickoffScheduler:
+    """Min-heap of fixture due times"""
+
+    def __init__(self, completion_delay: timedelta, batch_window: timedelta = timedelta(minutes=15)):
+        """
+        Initialize the scheduler
+
+        Args:
+            completion_delay: Time after kickoff when a fixture can be processed
+            batch_window: Fixtures due within this window of the first are processed together
+        """
+        self.completion_delay = completion_delay
+        self.batch_window = batch_window
+        self._heap: List[Tuple[datetime, str]] = []
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def load(self, fixtures: Iterable[Dict], now: datetime) -> None:
+        """
+        Replace the calendar with fixtures that become due after `now`
+
+        Args:
+            fixtures: Rows with 'id', 'match_date' and 'match_time'
+            now: Current GMT time; fixtures already due are left to the next processing run
+        """
+        heap = []
+        for row in fixtures:
+            try:
+                due_at = parse_kickoff(row['match_date'], row.get('match_time')) + self.completion_delay
+            except ValueError:
+                continue
+            if due_at > now:
+                heap.append((due_at, str(row['id'])))
+
+        heapq.heapify(heap)
+        self._heap = heap
+
+    def next_wake(self) -> Optional[datetime]:
+        """
+        Get the time to wake for the next batch of due fixtures
+
+        The batch is every fixture due within `batch_window` of the earliest one,
+        so the wake time is the latest due time in that batch.
+        """
+        if not self._heap:
+            return None
+        batch_end = self._heap[0][0] + self.batch_window
+        return max(due_at for due_at, _ in self._heap if due_at <= batch_end)
+
+    def pop_due(self, now: datetime) -> List[str]:
+        """Remove and return the IDs of fixtures due at or before `now`"""
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            due.append(heapq.heappop(self._heap)[1])
+        return due
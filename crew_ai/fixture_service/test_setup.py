@@ -5,13 +5,19 @@ This script tests the setup and configuration of the fixture service.
 """
 
 import asyncio
+import subprocess
 import sys
 import os
 from pathlib import Path
+from typing import List, Tuple
 
 # Add the parent directory to the path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# Modules every CLI command imports, and how long a cold import of each may take in seconds
+IMPORT_TIME_MODULES = ['config', 'crew_workflow', 'fixture_service']
+IMPORT_TIME_BUDGET = float(os.getenv("IMPORT_TIME_BUDGET", "0.5"))
+
 def test_imports():
     """Test if all required modules can be imported"""
     print("🔍 Testing imports...")
@@ -60,6 +66,65 @@ def test_imports():
     
     return True
 
+def measure_import_time(module: str) -> Tuple[float, List[Tuple[float, str]]]:
+    """
+    Import a module in a fresh interpreter with `python -X importtime`
+    
+    Returns:
+        The cumulative import time in seconds, and the module's heaviest direct imports
+        as (seconds, name) pairs
+    
+    Raises:
+        ImportError: If the module can't be imported
+    """
+    here = os.path.dirname(os.path.abspath(__file__))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [os.path.dirname(here), os.environ.get('PYTHONPATH')])))
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            cwd=here, env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise ImportError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else f"exit code {result.returncode}")
+    
+    # Lines look like "import time:       self |  cumulative | <indent>name", nested imports indented
+    # by two spaces and listed before the import that triggered them
+    total = 0.0
+    direct = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _, cumulative, name = line.split('|', 2)
+        if not cumulative.strip().isdigit():
+            continue
+        seconds = int(cumulative) / 1e6
+        if not name[1:].startswith(' '):
+            if name.strip() == module:
+                total = seconds
+                break
+            # Imported by interpreter startup, not by the module
+            direct = []
+        elif not name[3:].startswith(' '):
+            direct.append((seconds, name.strip()))
+    return total, sorted(direct, reverse=True)[:3]
+
+def test_import_time():
+    """Test that importing the service modules stays cheap, so CLI commands start quickly"""
+    print(f"\n🔍 Testing import time (budget {IMPORT_TIME_BUDGET:.2f}s per module)...")
+    
+    within_budget = True
+    for module in IMPORT_TIME_MODULES:
+        try:
+            total, heaviest = measure_import_time(module)
+        except ImportError as e:
+            print(f"  ❌ {module}: import failed: {e}")
+            within_budget = False
+            continue
+        
+        status = "✅" if total <= IMPORT_TIME_BUDGET else "❌"
+        within_budget = within_budget and total <= IMPORT_TIME_BUDGET
+        details = ', '.join(f"{name} {seconds * 1000:.0f}ms" for seconds, name in heaviest)
+        print(f"  {status} {module}: {total * 1000:.0f}ms{f' (heaviest: {details})' if details else ''}")
+    
+    return within_budget
+
 def test_environment():
     """Test environment variables"""
     print("\n🔍 Testing environment variables...")
@@ -219,6 +284,7 @@ async def run_full_test():
     tests = [
         ("File Structure", test_file_structure),
         ("Imports", test_imports),
+        ("Import Time", test_import_time),
         ("Environment Variables", test_environment),
         ("Database Connection", test_database_connection),
         ("API Connection", test_api_connection),
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+LLM response cache for the Crew AI workflow
+Re-running a fixture repeats the same planner, writer, editor and score
+extraction calls. crewai sends them through its own OpenAI provider, so the
+cache sits in that provider's HTTP client: each request body (model,
+temperature, messages, tools) is fingerprinted and the API's response is
+stored in a local SQLite file, so identical calls are answered without
+reaching the API. Everything above the transport - tool calls, token usage,
+events - runs as it would on a live response. The file is kept under a size
+budget by evicting the least recently used responses.
+
+Modes:
+    on      serve cached responses and store new ones
+    off     no caching (for runs that need fresh, non-deterministic output)
+    replay  serve only cached responses; a miss raises ReplayCacheMiss, so a
+            pipeline can be benchmarked offline without network access
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+
+from search_cache import ReplayCacheMiss
+
+logger = logging.getLogger(__name__)
+
+LLM_CACHE_MODES = ('on', 'off', 'replay')
+
+def fingerprint(method: str, url: str, body: bytes) -> str:
+    """Build the cache key of an API request; JSON bodies are compared by content, not key order"""
+    try:
+        body = json.dumps(json.loads(body), sort_keys=True, separators=(',', ':')).encode('utf-8')
+    except ValueError:
+        pass
+    return hashlib.sha256(f"{method} {url}\x00".encode('utf-8') + body).hexdigest()
+
+def is_cacheable(request: httpx.Request) -> bool:
+    """Only complete (non-streamed) POST requests are answered from the cache"""
+    if request.method != 'POST':
+        return False
+    try:
+        return not json.loads(request.content).get('stream')
+    except (ValueError, AttributeError):
+        return False
+
+class LLMResponseCache:
+    """SQLite store of API responses with size-bounded LRU eviction"""
+
+    def __init__(self, path: str, max_bytes: int = 256 * 1024 * 1024, replay: bool = False):
+        """
+        Initialize the cache
+
+        Args:
+            path: SQLite database file (created if missing)
+            max_bytes: Total size of stored responses before the least recently used are evicted
+            replay: Only serve cached responses, raising ReplayCacheMiss on a miss
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.replay = replay
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # One connection shared by the crew threads, serialized by the lock
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS llm_http_responses ('
+            'key TEXT PRIMARY KEY, status INTEGER, content_type TEXT, body BLOB, '
+            'size INTEGER, created_at REAL, last_used REAL)'
+        )
+        self._db.execute(
+            'CREATE INDEX IF NOT EXISTS idx_llm_http_responses_last_used ON llm_http_responses(last_used)'
+        )
+
+    def lookup(self, key: str) -> Optional[Tuple[int, str, bytes]]:
+        """
+        Look up a cached response
+
+        Returns:
+            Tuple of (status, content type, body), or None on a miss
+
+        Raises:
+            ReplayCacheMiss: On a miss in replay mode
+        """
+        with self._lock:
+            row = self._db.execute(
+                'SELECT status, content_type, body FROM llm_http_responses WHERE key = ?', (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._db.execute('UPDATE llm_http_responses SET last_used = ? WHERE key = ?', (time.time(), key))
+
+        if row is None and self.replay:
+            raise ReplayCacheMiss(f"No cached LLM response for request {key[:12]}")
+        return row
+
+    def update(self, key: str, status: int, content_type: str, body: bytes) -> None:
+        """Store a response, evicting least recently used responses over the size budget"""
+        if self.replay:
+            return
+
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                'INSERT OR REPLACE INTO llm_http_responses '
+                '(key, status, content_type, body, size, created_at, last_used) VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (key, status, content_type, body, len(body), now, now)
+            )
+            excess = self._db.execute(
+                'SELECT COALESCE(SUM(size), 0) FROM llm_http_responses'
+            ).fetchone()[0] - self.max_bytes
+            if excess > 0:
+                # Oldest-used first until the excess is covered
+                keys = []
+                for old_key, entry_size in self._db.execute(
+                    'SELECT key, size FROM llm_http_responses ORDER BY last_used'
+                ):
+                    keys.append(old_key)
+                    excess -= entry_size
+                    if excess <= 0:
+                        break
+                self._db.executemany('DELETE FROM llm_http_responses WHERE key = ?', [(old_key,) for old_key in keys])
+                self.evictions += len(keys)
+
+    def respond(self, request: httpx.Request, send) -> httpx.Response:
+        """Answer a request from the cache, or with send(request) on a miss, storing successful responses"""
+        if not is_cacheable(request):
+            if self.replay:
+                raise ReplayCacheMiss(f"Uncacheable LLM request {request.method} {request.url.path} in replay mode")
+            return send(request)
+
+        key = fingerprint(request.method, str(request.url), request.content)
+        cached = self.lookup(key)
+        if cached is not None:
+            status, content_type, body = cached
+            return httpx.Response(status, headers={'content-type': content_type}, content=body, request=request)
+
+        response = send(request)
+        if response.status_code == 200:
+            body = response.read()
+            self.update(key, response.status_code, response.headers.get('content-type', 'application/json'), body)
+        return response
+
+    async def arespond(self, request: httpx.Request, send) -> httpx.Response:
+        """Async variant of respond, for send coroutines"""
+        if not is_cacheable(request):
+            if self.replay:
+                raise ReplayCacheMiss(f"Uncacheable LLM request {request.method} {request.url.path} in replay mode")
+            return await send(request)
+
+        key = fingerprint(request.method, str(request.url), request.content)
+        cached = self.lookup(key)
+        if cached is not None:
+            status, content_type, body = cached
+            return httpx.Response(status, headers={'content-type': content_type}, content=body, request=request)
+
+        response = await send(request)
+        if response.status_code == 200:
+            body = await response.aread()
+            self.update(key, response.status_code, response.headers.get('content-type', 'application/json'), body)
+        return response
+
+    def clear(self) -> None:
+        """Remove every cached response"""
+        with self._lock:
+            self._db.execute('DELETE FROM llm_http_responses')
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache counters"""
+        with self._lock:
+            entries, size = self._db.execute(
+                'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_http_responses'
+            ).fetchone()
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+                'evictions': self.evictions,
+                'entries': entries,
+                'bytes': size
+            }
+
+class CachingTransport(httpx.BaseTransport):
+    """httpx transport answering LLM requests from an LLMResponseCache"""
+
+    def __init__(self, cache: LLMResponseCache, transport: Optional[httpx.BaseTransport] = None):
+        self.cache = cache
+        self.transport = transport or httpx.HTTPTransport()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self.cache.respond(request, self.transport.handle_request)
+
+    def close(self) -> None:
+        self.transport.close()
+
+class AsyncCachingTransport(httpx.AsyncBaseTransport):
+    """Async httpx transport answering LLM requests from an LLMResponseCache"""
+
+    def __init__(self, cache: LLMResponseCache, transport: Optional[httpx.AsyncBaseTransport] = None):
+        self.cache = cache
+        self.transport = transport or httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self.cache.arespond(request, self.transport.handle_async_request)
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+def create_llm(model: str, cache: Optional[LLMResponseCache] = None, **kwargs: Any):
+    """
+    Build the crewai LLM for an OpenAI model, with its HTTP clients going through the cache
+
+    crewai turns any other LLM object (e.g. a LangChain ChatOpenAI) into its own
+    provider when an Agent is built, keeping only the model settings, so the
+    cache has to be installed on crewai's provider.
+
+    Args:
+        model: OpenAI model name
+        cache: Response cache (None for a plain LLM)
+        **kwargs: Other settings passed to the provider (temperature, api_key, ...)
+    """
+    from crewai.llms.providers.openai.completion import OpenAICompletion
+    from openai import AsyncOpenAI, OpenAI
+
+    if cache is None:
+        return OpenAICompletion(model=model, **kwargs)
+
+    class CachedOpenAICompletion(OpenAICompletion):
+        """crewai's OpenAI provider with cached HTTP clients"""
+
+        def _build_sync_client(self) -> Any:
+            return OpenAI(**{**self._get_client_params(), 'http_client': httpx.Client(transport=CachingTransport(cache))})
+
+        def _build_async_client(self) -> Any:
+            return AsyncOpenAI(**{**self._get_client_params(),
+                                  'http_client': httpx.AsyncClient(transport=AsyncCachingTransport(cache))})
+
+    if cache.replay:
+        # A replay miss is raised inside the transport; don't retry it
+        kwargs.setdefault('max_retries', 0)
+    return CachedOpenAICompletion(model=model, **kwargs)
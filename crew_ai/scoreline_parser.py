@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+Deterministic scoreline parser for collected match data
+Finds every "X-Y" mention in the text, tells half-time and in-play scores
+apart from the full-time result by the nearest marker phrase, works out
+which number belongs to which team from the team names around it (with
+common aliases such as "Spurs" or "Man Utd"), and weighs the evidence into a
+confidence score. Confident results skip the LLM score extraction entirely.
+"""
+
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Tuple
+
+# Short names used in match reports, keyed by the fixtures table's team names
+TEAM_ALIASES: Dict[str, Tuple[str, ...]] = {
+    'AFC Bournemouth': ('Bournemouth', 'Cherries'),
+    'Arsenal': ('Gunners',),
+    'Aston Villa': ('Villa',),
+    'Brentford': ('Bees',),
+    'Brighton & Hove Albion': ('Brighton and Hove Albion', 'Brighton', 'Seagulls'),
+    'Burnley': ('Clarets',),
+    'Chelsea': ('Blues',),
+    'Crystal Palace': ('Palace', 'Eagles'),
+    'Everton': ('Toffees',),
+    'Fulham': ('Cottagers',),
+    'Leeds United': ('Leeds', 'United'),
+    'Liverpool': ('Reds',),
+    'Manchester City': ('Man City', 'City', 'Citizens'),
+    'Manchester United': ('Man Utd', 'Man United', 'Manchester Utd', 'United', 'Red Devils'),
+    'Newcastle United': ('Newcastle', 'Magpies', 'United'),
+    'Nottingham Forest': ("Nott'm Forest", 'Forest', 'Reds'),
+    'Sunderland': ('Black Cats',),
+    'Tottenham Hotspur': ('Tottenham', 'Spurs'),
+    'West Ham United': ('West Ham', 'Hammers', 'United'),
+    'Wolverhampton Wanderers': ('Wolverhampton', 'Wolves'),
+}
+
+# Scores above this are treated as something else (times, statistics)
+MAX_GOALS = 20
+
+# "2-1", "2 - 1", "2:1", "2–1"; not part of dates, formations or times like 15:00
+SCORE_RE = re.compile(r'(?<![\d:/-])(?<!\d\.)(\d|1\d|20)\s?[-–—:]\s?(\d|1\d|20)(?![\d:/%-]|\.\d)')
+
+# Phrases that say which state of the match a score describes
+FULL_TIME_RE = re.compile(
+    r"\b(?:final score|final result|full[- ]?time|FT|final whistle|ended|finished|finishing|result|"
+    r"won|win|wins|beat|beating|defeated|defeating|victory|triumph|drew|draw|lost|loss|defeat|thrashed|thrashing)\b",
+    re.IGNORECASE
+)
+EXPLICIT_FULL_TIME_RE = re.compile(r'\b(?:final score|final result|full[- ]?time|FT|final whistle)\b', re.IGNORECASE)
+HALF_TIME_RE = re.compile(
+    r"\b(?:half[- ]?time|HT|at the break|the interval|first[- ]half|break)\b", re.IGNORECASE
+)
+IN_PLAY_RE = re.compile(
+    r"\b(?:live|minute|\d{1,3}(?:st|nd|rd|th)? min|\d{1,3}'|made it|makes it|goes? ahead|went ahead|"
+    r"doubled|pulled one back|equali[sz]|levelled|led|leading|lead)\b",
+    re.IGNORECASE
+)
+
+# Words between a team name and a score that say the team won or lost
+WINNER_VERBS = r'(?:won|win|wins|beat|beats|defeated|defeating|beating|edged|thrashed|secured|claimed|sealed|recorded|earned)'
+LOSER_VERBS = r'(?:lost|lose|loses|losing|fell|were beaten|was beaten|slumped|suffered|went down)'
+WIN_NOUN_RE = re.compile(r'(?:win|victory|triumph)\b')
+LOSS_NOUN_RE = re.compile(r'(?:defeat|loss)\b')
+
+# Evidence weights, combined into a confidence between 0 and 1
+BASE_WEIGHT = 0.35
+FULL_TIME_WEIGHT = 0.35
+EXPLICIT_FULL_TIME_WEIGHT = 0.45
+ORIENTATION_WEIGHT = 0.2
+ASSUMED_ORIENTATION_FACTOR = 0.8
+IN_PLAY_FACTOR = 0.5
+
+# Characters of context searched for markers and team names around a score
+CONTEXT_BEFORE = 80
+CONTEXT_AFTER = 60
+
+class TeamPatterns(NamedTuple):
+    """Compiled patterns finding one team of a fixture and what the text says it did"""
+    side: str  # 'home' or 'away'
+    name: re.Pattern
+    winner_before: re.Pattern
+    winner_after: re.Pattern
+    winner_following: re.Pattern
+    loser_before: re.Pattern
+    loser_following: re.Pattern
+
+@dataclass
+class ScoreMention:
+    """Data class for one score found in the text"""
+    home: int
+    away: int
+    weight: float
+    state: str  # 'full_time', 'half_time', 'in_play' or 'unknown'
+    text: str
+
+@dataclass
+class ScorelineResult:
+    """Data class for a parsed final score"""
+    home: int
+    away: int
+    confidence: float
+    mentions: List[ScoreMention] = field(default_factory=list)
+
+    @property
+    def score(self) -> str:
+        return f"{self.home}-{self.away}"
+
+def team_names(team: str) -> FrozenSet[str]:
+    """Get the names a team goes by in match reports"""
+    names = {team, *TEAM_ALIASES.get(team, ())}
+    stripped = re.sub(r'^A?FC\s+|\s+A?FC$', '', team)
+    names.add(stripped)
+    return frozenset(name for name in names if name)
+
+@lru_cache(maxsize=256)
+def _team_patterns(home_team: str, away_team: str) -> Tuple[TeamPatterns, TeamPatterns]:
+    """Compile the patterns of a fixture's teams, leaving out aliases both teams share"""
+    home_names, away_names = team_names(home_team), team_names(away_team)
+    shared = home_names & away_names
+
+    def compile_team(side, names):
+        # Longest first so "Man City" wins over "City"
+        alternation = '|'.join(re.escape(name) for name in sorted(names - shared, key=len, reverse=True))
+        name = rf"(?<!\w)(?:[Tt]he\s+)?(?:{alternation})(?:'s?)?(?!\w)"
+        return TeamPatterns(
+            side=side,
+            name=re.compile(name),
+            # "Palace secured a" / "Bournemouth lost" before the score
+            winner_before=re.compile(rf"{name}\W+(?:\w+\W+){{0,3}}?{WINNER_VERBS}\b"),
+            # "with United defeating Liverpool" after it
+            winner_after=re.compile(rf"{name}\W+(?:\w+\W+){{0,2}}?{WINNER_VERBS}\b"),
+            # "2-1 to Palace", "2-1 win for Leeds" straight after it
+            winner_following=re.compile(rf"(?:(?:win|victory|triumph)\s+)?(?:for|to|in favour of)\s+{name}"),
+            loser_before=re.compile(rf"{name}\W+(?:\w+\W+){{0,3}}?{LOSER_VERBS}\b"),
+            loser_following=re.compile(rf"(?:defeat|loss)\s+for\s+{name}")
+        )
+
+    return compile_team('home', home_names), compile_team('away', away_names)
+
+def _sentence_bounds(text: str, start: int, end: int) -> Tuple[int, int]:
+    """Get the context window around a score, cut at sentence and line breaks"""
+    window_start = max(0, start - CONTEXT_BEFORE)
+    window_end = min(len(text), end + CONTEXT_AFTER)
+    before = text[window_start:start]
+    breaks = [match.end() for match in re.finditer(r'[.!?]\s|\n', before)]
+    if breaks:
+        window_start += breaks[-1]
+    after_break = re.search(r'[.!?](?:\s|$)|\n', text[end:window_end])
+    if after_break:
+        window_end = end + after_break.start()
+    return window_start, window_end
+
+def _nearest_state(before: str, after: str) -> Tuple[str, bool]:
+    """
+    Classify a score by the marker phrase closest to it
+
+    Returns:
+        Tuple of (state, explicit full-time marker)
+    """
+    candidates = []  # (distance, state, explicit)
+    for pattern, state in ((HALF_TIME_RE, 'half_time'), (IN_PLAY_RE, 'in_play'), (FULL_TIME_RE, 'full_time')):
+        for match in pattern.finditer(before):
+            explicit = state == 'full_time' and bool(EXPLICIT_FULL_TIME_RE.fullmatch(match.group(0)))
+            candidates.append((len(before) - match.end(), state, explicit))
+        match = pattern.search(after)
+        if match:
+            candidates.append((match.start(), state, False))
+    if not candidates:
+        return 'unknown', False
+    # Explicit markers ("Full-time:", "Final score") win ties and beat nearer verbs like "won"
+    candidates.sort(key=lambda candidate: (candidate[0] - (40 if candidate[2] else 0), candidate[1] != 'half_time'))
+    _, state, explicit = candidates[0]
+    return state, explicit
+
+def _orientation(before: str, after: str, teams: Tuple[TeamPatterns, TeamPatterns],
+                 first: int, second: int) -> Tuple[Optional[Tuple[int, int]], bool]:
+    """
+    Assign a score's numbers to home and away from the team names around it
+
+    Returns:
+        Tuple of ((home, away) goals or None if the text doesn't say,
+        whether the score sits between the two team names like a result line)
+    """
+    def ends_with_team(text):
+        # "Tottenham 3-2", "| Everton | 2-0"
+        for team in teams:
+            match = None
+            for match in team.name.finditer(text):
+                pass
+            if match and not text[match.end():].strip(' :*(,|'):
+                return team.side
+        return None
+
+    def starts_with_team(text):
+        # "3-2 Everton", "2-0 | Brighton"
+        for team in teams:
+            if team.name.match(text.lstrip(' :*)|')):
+                return team.side
+        return None
+
+    def oriented(side, goals):
+        # goals are the named side's, the other side gets the rest
+        return goals if side == 'home' else goals[::-1]
+
+    leading, trailing = ends_with_team(before), starts_with_team(after)
+    if leading and trailing and leading != trailing:
+        return oriented(leading, (first, second)), True
+
+    high, low = max(first, second), min(first, second)
+    after_head = after.lstrip()
+
+    # "City beat Wolves 4-0", "Palace secured a 2-1 victory", "Bournemouth lost 4-2", "2-1 to Palace",
+    # "a 1-0 defeat for Everton"; the winner's goals come first in prose
+    named_before = [bool(team.name.search(before)) for team in teams]
+    for index, team in enumerate(teams):
+        # "Palace secured a 2-1 victory over ..." names only the winner before the score
+        only_team_before = named_before[index] and not named_before[1 - index]
+        winner = (team.winner_before.search(before)
+                  or team.winner_following.match(after_head)
+                  or team.winner_after.search(after)
+                  or (only_team_before and WIN_NOUN_RE.match(after_head)))
+        loser = (team.loser_before.search(before)
+                 or team.loser_following.match(after_head)
+                 or (only_team_before and LOSS_NOUN_RE.match(after_head)))
+        if winner and not loser:
+            return oriented(team.side, (high, low)), False
+        if loser and not winner:
+            return oriented(team.side, (low, high)), False
+
+    if leading:
+        return oriented(leading, (first, second)), False
+    if trailing:
+        # "... 3-2 Everton" without a leading name: the trailing team is listed second
+        return oriented(trailing, (second, first)), False
+    return None, False
+
+def find_score_mentions(text: str, home_team: str, away_team: str) -> List[ScoreMention]:
+    """Find and classify every score mention in the text"""
+    teams = _team_patterns(home_team, away_team)
+    mentions = []
+
+    for match in SCORE_RE.finditer(text):
+        first, second = int(match.group(1)), int(match.group(2))
+        if first > MAX_GOALS or second > MAX_GOALS:
+            continue
+
+        window_start, window_end = _sentence_bounds(text, match.start(), match.end())
+        before, after = text[window_start:match.start()], text[match.end():window_end]
+        state, explicit = _nearest_state(before, after)
+        oriented, result_line = _orientation(before, after, teams, first, second)
+        if state == 'unknown' and result_line:
+            # "Arsenal 2-1 Chelsea" is how results are written
+            state = 'full_time'
+
+        weight = BASE_WEIGHT
+        if state == 'full_time':
+            weight += EXPLICIT_FULL_TIME_WEIGHT if explicit else FULL_TIME_WEIGHT
+        if oriented is not None or first == second:
+            weight += ORIENTATION_WEIGHT
+        else:
+            # Reports list the home side first unless they say otherwise
+            weight *= ASSUMED_ORIENTATION_FACTOR
+        home, away = oriented or (first, second)
+
+        if state == 'in_play':
+            weight *= IN_PLAY_FACTOR
+
+        mentions.append(ScoreMention(home, away, min(weight, 1.0), state, text[window_start:window_end].strip()))
+
+    return mentions
+
+def parse_scoreline(text: str, home_team: str, away_team: str) -> Optional[ScorelineResult]:
+    """
+    Parse the final score of a match from collected match data
+
+    Args:
+        text: Match data text
+        home_team: Home team name as stored in the fixtures table
+        away_team: Away team name as stored in the fixtures table
+
+    Returns:
+        The best supported full-time score with its confidence, or None if the text has no score
+    """
+    mentions = [mention for mention in find_score_mentions(text or '', home_team, away_team)
+                if mention.state != 'half_time']
+    if any(mention.state == 'full_time' for mention in mentions):
+        # Running scores only matter when nothing reports the result
+        mentions = [mention for mention in mentions if mention.state != 'in_play']
+    if not mentions:
+        return None
+
+    support: Dict[Tuple[int, int], float] = {}
+    strongest: Dict[Tuple[int, int], float] = {}
+    for mention in mentions:
+        key = (mention.home, mention.away)
+        support[key] = support.get(key, 0.0) + mention.weight
+        strongest[key] = max(strongest.get(key, 0.0), mention.weight)
+
+    (home, away), best = max(support.items(), key=lambda item: (item[1], strongest[item[0]]))
+    # As strong as its best single piece of evidence, discounted by conflicting scores
+    confidence = strongest[(home, away)] * best / sum(support.values())
+    return ScorelineResult(
+        home=home,
+        away=away,
+        confidence=round(confidence, 3),
+        mentions=[mention for mention in mentions if (mention.home, mention.away) == (home, away)]
+    )
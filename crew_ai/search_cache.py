@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Search result cache for the Crew AI workflow
+Every agent shares the same search and website-RAG tools, and agents working
+on the same match issue near-identical queries. Tool results are cached in a
+local SQLite file keyed on the tool, the normalized query and the UTC day, with
+a TTL and least-recently-used eviction, so repeated queries are answered
+locally across agents, fixtures and service restarts.
+
+In replay mode results are only served from the cache, whatever their age or
+day, and a miss raises ReplayCacheMiss instead of reaching the network.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Results of the same query on different days are cached separately
+DATE_BUCKET_SECONDS = 24 * 60 * 60
+
+class ReplayCacheMiss(LookupError):
+    """Raised in replay mode when a call has no cached result"""
+    pass
+
+def normalize_query(value: Any) -> Any:
+    """Normalize a query argument: case and repeated whitespace don't matter (quotes do, they mark phrases)"""
+    if not isinstance(value, str):
+        return value
+    return re.sub(r'\s+', ' ', value.lower()).strip(' ?.!')
+
+def make_cache_key(tool_name: str, args: Tuple, kwargs: Dict) -> str:
+    """Build the cache key of a tool call (stored with the day bucket it was made in)"""
+    payload = json.dumps(
+        [tool_name, [normalize_query(arg) for arg in args],
+         {name: normalize_query(value) for name, value in sorted(kwargs.items())}],
+        default=str
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+class SearchCache:
+    """SQLite-backed cache of tool results with TTL and size-bounded LRU eviction"""
+
+    def __init__(self, path: str, ttl: int = 6 * 60 * 60, max_entries: int = 5000, replay: bool = False):
+        """
+        Initialize the cache
+
+        Args:
+            path: SQLite database file (created if missing)
+            ttl: Seconds a result stays valid
+            max_entries: Entries kept before the least recently used are evicted
+            replay: Only serve cached results, raising ReplayCacheMiss on a miss
+        """
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.replay = replay
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, threading.Event] = {}
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # One connection shared by the crew threads, serialized by the lock
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS search_results ('
+            'key TEXT, bucket INTEGER, tool TEXT, result TEXT, created_at REAL, last_used REAL, '
+            'PRIMARY KEY (key, bucket))'
+        )
+        self._db.execute('CREATE INDEX IF NOT EXISTS idx_search_results_last_used ON search_results(last_used)')
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """
+        Look up a cached result
+
+        Returns:
+            Tuple of (found, result)
+        """
+        now = time.time()
+        with self._lock:
+            if self.replay:
+                # Latest result from any day, however old
+                row = self._db.execute(
+                    'SELECT result, bucket FROM search_results WHERE key = ? ORDER BY created_at DESC LIMIT 1',
+                    (key,)
+                ).fetchone()
+            else:
+                row = self._db.execute(
+                    'SELECT result, bucket FROM search_results WHERE key = ? AND bucket = ? AND created_at > ?',
+                    (key, int(now // DATE_BUCKET_SECONDS), now - self.ttl)
+                ).fetchone()
+            if row is None:
+                return False, None
+            self._db.execute(
+                'UPDATE search_results SET last_used = ? WHERE key = ? AND bucket = ?', (now, key, row[1])
+            )
+        return True, json.loads(row[0])
+
+    def put(self, key: str, tool_name: str, result: Any):
+        """Store a result, evicting expired and least recently used entries when full"""
+        try:
+            data = json.dumps(result)
+        except (TypeError, ValueError):
+            return
+
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                'INSERT OR REPLACE INTO search_results (key, bucket, tool, result, created_at, last_used) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                (key, int(now // DATE_BUCKET_SECONDS), tool_name, data, now, now)
+            )
+            count = self._db.execute('SELECT COUNT(*) FROM search_results').fetchone()[0]
+            if count > self.max_entries:
+                self._db.execute('DELETE FROM search_results WHERE created_at <= ?', (now - self.ttl,))
+                deleted = self._db.execute(
+                    'DELETE FROM search_results WHERE rowid IN ('
+                    'SELECT rowid FROM search_results ORDER BY last_used LIMIT '
+                    '(SELECT MAX(COUNT(*) - ?, 0) FROM search_results))',
+                    (self.max_entries,)
+                ).rowcount
+                self.evictions += max(deleted, 0)
+
+    def get_or_run(self, tool_name: str, args: Tuple, kwargs: Dict, run: Callable[[], Any]) -> Any:
+        """
+        Get a tool call's cached result, or run the tool and cache what it returns
+
+        Concurrent identical calls wait for the first one instead of searching again.
+        Exceptions are not cached.
+        """
+        key = make_cache_key(tool_name, args, kwargs)
+
+        while True:
+            found, result = self.get(key)
+            if found:
+                with self._lock:
+                    self.hits += 1
+                return result
+
+            if self.replay:
+                with self._lock:
+                    self.misses += 1
+                raise ReplayCacheMiss(f"No cached {tool_name} result for {args or kwargs}")
+
+            with self._lock:
+                pending = self._in_flight.get(key)
+                if pending is None:
+                    self._in_flight[key] = threading.Event()
+                    self.misses += 1
+                    break
+            pending.wait()
+            # The other call may have failed; if so the loop runs the tool itself
+
+        try:
+            result = run()
+            self.put(key, tool_name, result)
+            return result
+        finally:
+            with self._lock:
+                self._in_flight.pop(key).set()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache counters"""
+        with self._lock:
+            entries = self._db.execute('SELECT COUNT(*) FROM search_results').fetchone()[0]
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+                'evictions': self.evictions,
+                'entries': entries
+            }
+
+def cached_tool_class(tool_class: type, cache: SearchCache) -> type:
+    """
+    Create a subclass of a crewai tool whose results go through the cache
+
+    Args:
+        tool_class: Tool class such as SerperDevTool
+        cache: Cache shared by every tool created from the subclass
+    """
+    class CachedTool(tool_class):
+        def _run(self, *args, **kwargs):
+            return cache.get_or_run(self.name, args, kwargs, lambda: super(CachedTool, self)._run(*args, **kwargs))
+
+    CachedTool.__name__ = f"Cached{tool_class.__name__}"
+    CachedTool.__qualname__ = CachedTool.__name__
+    return CachedTool
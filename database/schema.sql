@@ -46,19 +46,35 @@ CREATE TABLE IF NOT EXISTS generated_articles (
     content TEXT NOT NULL,
     article_type VARCHAR(100) DEFAULT 'match_report',
     word_count INTEGER DEFAULT 0,
+    excerpt TEXT, -- First 300 characters of content, served by list endpoints
+    read_time INTEGER, -- Estimated read time in minutes
     file_path VARCHAR(500),
     image_url VARCHAR(500),
+    image_status VARCHAR(20), -- NULL (not checked yet), pending or ready
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
 
+-- Columns added after the initial release
+-- (run crew_ai/fixture_service/backfill_excerpts.py to fill them for existing articles)
+ALTER TABLE generated_articles ADD COLUMN IF NOT EXISTS excerpt TEXT;
+ALTER TABLE generated_articles ADD COLUMN IF NOT EXISTS read_time INTEGER;
+ALTER TABLE generated_articles ADD COLUMN IF NOT EXISTS image_status VARCHAR(20);
+
 -- Create indexes for better performance
-CREATE INDEX IF NOT EXISTS idx_fixtures_date ON fixtures(match_date);
+-- Kickoff order, used by date filters and completed-fixture discovery
+DROP INDEX IF EXISTS idx_fixtures_date;
+CREATE INDEX IF NOT EXISTS idx_fixtures_kickoff ON fixtures(match_date, match_time);
 CREATE INDEX IF NOT EXISTS idx_fixtures_status ON fixtures(status);
 CREATE INDEX IF NOT EXISTS idx_fixtures_teams ON fixtures(home_team, away_team);
 CREATE INDEX IF NOT EXISTS idx_processing_status ON fixture_processing_status(processing_status);
 CREATE INDEX IF NOT EXISTS idx_articles_fixture ON generated_articles(fixture_id);
 CREATE INDEX IF NOT EXISTS idx_articles_type ON generated_articles(article_type);
+-- Serves newest-first listing and keyset pagination on (created_at, id)
+CREATE INDEX IF NOT EXISTS idx_articles_date ON generated_articles(created_at, id);
+-- Serves the fixture service's "needs image" query
+CREATE INDEX IF NOT EXISTS idx_articles_image_status ON generated_articles(created_at)
+    WHERE image_status IS NULL OR image_status = 'pending';
 
 -- Create updated_at trigger function
 CREATE OR REPLACE FUNCTION update_updated_at_column()
@@ -108,3 +124,355 @@ CREATE POLICY "Authenticated update access for article images" ON storage.object
 
 CREATE POLICY "Authenticated delete access for article images" ON storage.objects
     FOR DELETE USING (bucket_id = 'article-images' AND auth.role() = 'authenticated');
+
+-- Per-matchday summary so the API can resolve the latest gameweek in one indexed lookup.
+-- Kept current by triggers on fixtures and generated_articles.
+CREATE TABLE IF NOT EXISTS gameweek_summary (
+    matchday INTEGER PRIMARY KEY,
+    total_matches INTEGER NOT NULL DEFAULT 0, -- fixtures scheduled in the matchday
+    completed_matches INTEGER NOT NULL DEFAULT 0, -- fixtures with a final score
+    reported_matches INTEGER NOT NULL DEFAULT 0, -- fixtures with at least one match report
+    total_goals INTEGER NOT NULL DEFAULT 0, -- goals across the reported fixtures
+    last_match_date DATE,
+    last_report_match_date DATE, -- latest match date among the reported fixtures
+    is_latest BOOLEAN NOT NULL DEFAULT FALSE, -- latest matchday with match reports
+    gameweek_complete BOOLEAN NOT NULL DEFAULT FALSE, -- all 10 Premier League matches reported
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_gameweek_summary_latest ON gameweek_summary(is_latest) WHERE is_latest;
+CREATE INDEX IF NOT EXISTS idx_fixtures_matchday ON fixtures(matchday);
+
+-- Recompute the summary row for one matchday and move the is_latest flag if needed
+CREATE OR REPLACE FUNCTION refresh_gameweek_summary(p_matchday INTEGER)
+RETURNS VOID AS $$
+DECLARE
+    latest_matchday INTEGER;
+BEGIN
+    IF p_matchday IS NULL THEN
+        RETURN;
+    END IF;
+
+    -- One refresh at a time until commit: concurrent refreshes would each pick the
+    -- latest matchday from their own snapshot and could both set is_latest, violating
+    -- idx_gameweek_summary_latest
+    PERFORM pg_advisory_xact_lock(hashtext('refresh_gameweek_summary'));
+
+    INSERT INTO gameweek_summary (
+        matchday, total_matches, completed_matches, reported_matches, total_goals,
+        last_match_date, last_report_match_date, gameweek_complete, updated_at
+    )
+    SELECT
+        p_matchday,
+        COUNT(*),
+        COUNT(*) FILTER (WHERE f.home_score IS NOT NULL AND f.away_score IS NOT NULL),
+        COUNT(*) FILTER (WHERE f.reported),
+        COALESCE(SUM(COALESCE(f.home_score, 0) + COALESCE(f.away_score, 0)) FILTER (WHERE f.reported), 0),
+        MAX(f.match_date),
+        MAX(f.match_date) FILTER (WHERE f.reported),
+        COUNT(*) FILTER (WHERE f.reported) >= 10,
+        NOW()
+    FROM (
+        -- Correlated, so only this matchday's fixtures are looked up (idx_articles_fixture)
+        SELECT
+            fx.home_score,
+            fx.away_score,
+            fx.match_date,
+            EXISTS (
+                SELECT 1 FROM generated_articles a
+                WHERE a.fixture_id = fx.id AND a.article_type = 'match_report'
+            ) AS reported
+        FROM fixtures fx
+        WHERE fx.matchday = p_matchday
+    ) f
+    ON CONFLICT (matchday) DO UPDATE SET
+        total_matches = EXCLUDED.total_matches,
+        completed_matches = EXCLUDED.completed_matches,
+        reported_matches = EXCLUDED.reported_matches,
+        total_goals = EXCLUDED.total_goals,
+        last_match_date = EXCLUDED.last_match_date,
+        last_report_match_date = EXCLUDED.last_report_match_date,
+        gameweek_complete = EXCLUDED.gameweek_complete,
+        updated_at = EXCLUDED.updated_at;
+
+    SELECT matchday INTO latest_matchday
+    FROM gameweek_summary
+    WHERE reported_matches > 0
+    ORDER BY last_report_match_date DESC NULLS LAST, matchday DESC
+    LIMIT 1;
+
+    UPDATE gameweek_summary SET is_latest = FALSE
+    WHERE is_latest AND matchday IS DISTINCT FROM latest_matchday;
+
+    UPDATE gameweek_summary SET is_latest = TRUE
+    WHERE matchday = latest_matchday AND NOT is_latest;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION refresh_gameweek_summary_from_fixture()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM refresh_gameweek_summary(NEW.matchday);
+    END IF;
+    IF TG_OP = 'DELETE' OR (TG_OP = 'UPDATE' AND OLD.matchday IS DISTINCT FROM NEW.matchday) THEN
+        PERFORM refresh_gameweek_summary(OLD.matchday);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION refresh_gameweek_summary_from_article()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM refresh_gameweek_summary((SELECT matchday FROM fixtures WHERE id = NEW.fixture_id));
+    END IF;
+    IF TG_OP = 'DELETE' OR (TG_OP = 'UPDATE' AND OLD.fixture_id IS DISTINCT FROM NEW.fixture_id) THEN
+        PERFORM refresh_gameweek_summary((SELECT matchday FROM fixtures WHERE id = OLD.fixture_id));
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS refresh_gameweek_summary_on_fixtures ON fixtures;
+CREATE TRIGGER refresh_gameweek_summary_on_fixtures
+    AFTER INSERT OR DELETE OR UPDATE OF home_score, away_score, matchday, match_date ON fixtures
+    FOR EACH ROW EXECUTE FUNCTION refresh_gameweek_summary_from_fixture();
+
+DROP TRIGGER IF EXISTS refresh_gameweek_summary_on_articles ON generated_articles;
+CREATE TRIGGER refresh_gameweek_summary_on_articles
+    AFTER INSERT OR DELETE OR UPDATE OF fixture_id, article_type ON generated_articles
+    FOR EACH ROW EXECUTE FUNCTION refresh_gameweek_summary_from_article();
+
+-- Backfill the summary for existing fixtures
+SELECT refresh_gameweek_summary(matchday)
+FROM (SELECT DISTINCT matchday FROM fixtures WHERE matchday IS NOT NULL) m;
+
+ALTER TABLE gameweek_summary ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Public read access for gameweek summary" ON gameweek_summary
+    FOR SELECT USING (true);
+
+-- Full-text search over articles: weighted title/content vector kept current by trigger
+ALTER TABLE generated_articles ADD COLUMN IF NOT EXISTS search_vector TSVECTOR;
+
+CREATE INDEX IF NOT EXISTS idx_articles_search ON generated_articles USING GIN(search_vector);
+
+CREATE OR REPLACE FUNCTION update_article_search_vector()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('english', COALESCE(NEW.title, '')), 'A') ||
+        setweight(to_tsvector('english', COALESCE(NEW.content, '')), 'B');
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS update_articles_search_vector ON generated_articles;
+CREATE TRIGGER update_articles_search_vector
+    BEFORE INSERT OR UPDATE OF title, content ON generated_articles
+    FOR EACH ROW EXECUTE FUNCTION update_article_search_vector();
+
+-- Backfill the vector for existing articles
+UPDATE generated_articles SET search_vector =
+    setweight(to_tsvector('english', COALESCE(title, '')), 'A') ||
+    setweight(to_tsvector('english', COALESCE(content, '')), 'B')
+WHERE search_vector IS NULL;
+
+-- Escape text for use in HTML
+CREATE OR REPLACE FUNCTION html_escape(value TEXT)
+RETURNS TEXT AS $$
+    SELECT replace(replace(replace(replace(replace(value,
+        '&', '&amp;'), '<', '&lt;'), '>', '&gt;'), '"', '&quot;'), '''', '&#39;');
+$$ LANGUAGE sql IMMUTABLE;
+
+-- Ranked, paginated article search with highlighted snippets (used by /api/search)
+CREATE OR REPLACE FUNCTION search_articles(search_query TEXT, result_limit INTEGER DEFAULT 10, result_offset INTEGER DEFAULT 0)
+RETURNS TABLE (
+    id UUID,
+    title VARCHAR(500),
+    article_type VARCHAR(100),
+    word_count INTEGER,
+    read_time INTEGER,
+    created_at TIMESTAMP WITH TIME ZONE,
+    fixture_id UUID,
+    home_team VARCHAR(100),
+    away_team VARCHAR(100),
+    match_date DATE,
+    home_score INTEGER,
+    away_score INTEGER,
+    competition VARCHAR(100),
+    rank REAL,
+    snippet TEXT,
+    total_count BIGINT
+) AS $$
+    WITH query AS (
+        SELECT websearch_to_tsquery('english', search_query) AS tsq
+    ),
+    matches AS (
+        SELECT
+            a.id, a.title, a.article_type, a.word_count, a.read_time, a.created_at, a.content,
+            f.id AS fixture_id, f.home_team, f.away_team, f.match_date, f.home_score, f.away_score, f.competition,
+            ts_rank_cd(a.search_vector, query.tsq) AS rank,
+            COUNT(*) OVER () AS total_count
+        FROM generated_articles a
+        JOIN fixtures f ON f.id = a.fixture_id
+        CROSS JOIN query
+        WHERE a.search_vector @@ query.tsq
+        ORDER BY rank DESC, a.created_at DESC
+        LIMIT result_limit OFFSET result_offset
+    )
+    -- Only the returned page pays for ts_headline
+    SELECT
+        m.id, m.title, m.article_type, m.word_count, m.read_time, m.created_at,
+        m.fixture_id, m.home_team, m.away_team, m.match_date, m.home_score, m.away_score, m.competition,
+        m.rank,
+        -- Article text is LLM and scraped content: highlight with control-character markers,
+        -- HTML-escape the snippet, then turn the markers into <mark> tags
+        replace(replace(html_escape(ts_headline(
+            'english',
+            translate(m.content, chr(1) || chr(2), ''),
+            query.tsq,
+            format('StartSel=%s, StopSel=%s, MaxWords=30, MinWords=15, MaxFragments=2', chr(1), chr(2))
+        )), chr(1), '<mark>'), chr(2), '</mark>'),
+        m.total_count
+    FROM matches m
+    CROSS JOIN query
+    ORDER BY m.rank DESC, m.created_at DESC;
+$$ LANGUAGE sql STABLE;
+
+-- Number of articles matching a search, for pages past the last result
+CREATE OR REPLACE FUNCTION count_search_articles(search_query TEXT)
+RETURNS BIGINT AS $$
+    SELECT COUNT(*)
+    FROM generated_articles a
+    JOIN fixtures f ON f.id = a.fixture_id
+    WHERE a.search_vector @@ websearch_to_tsquery('english', search_query);
+$$ LANGUAGE sql STABLE;
+
+-- Fixture processing job queue: fixture_processing_status rows are jobs that
+-- workers claim with a lease, keep alive with heartbeats and finish as completed,
+-- failed (retried after a backoff) or dead (out of attempts)
+ALTER TABLE fixture_processing_status ADD COLUMN IF NOT EXISTS attempts INTEGER DEFAULT 0;
+ALTER TABLE fixture_processing_status ADD COLUMN IF NOT EXISTS max_attempts INTEGER DEFAULT 3;
+ALTER TABLE fixture_processing_status ADD COLUMN IF NOT EXISTS available_at TIMESTAMP WITH TIME ZONE DEFAULT NOW();
+ALTER TABLE fixture_processing_status ADD COLUMN IF NOT EXISTS lease_owner VARCHAR(100);
+ALTER TABLE fixture_processing_status ADD COLUMN IF NOT EXISTS lease_expires_at TIMESTAMP WITH TIME ZONE;
+ALTER TABLE fixture_processing_status ADD COLUMN IF NOT EXISTS heartbeat_at TIMESTAMP WITH TIME ZONE;
+
+-- One job per fixture, so enqueueing is an idempotent upsert
+CREATE UNIQUE INDEX IF NOT EXISTS idx_processing_fixture ON fixture_processing_status(fixture_id);
+CREATE INDEX IF NOT EXISTS idx_processing_available ON fixture_processing_status(available_at)
+    WHERE processing_status IN ('pending', 'failed', 'in_progress');
+
+-- Claim up to batch_size jobs that are due, or whose lease expired, for one worker.
+-- Jobs whose lease expired on their last attempt are moved to 'dead' instead.
+CREATE OR REPLACE FUNCTION claim_fixture_jobs(worker_id TEXT, batch_size INTEGER DEFAULT 1, lease_seconds INTEGER DEFAULT 600)
+RETURNS TABLE (
+    id UUID,
+    fixture_id UUID,
+    attempts INTEGER,
+    max_attempts INTEGER
+) AS $$
+BEGIN
+    UPDATE fixture_processing_status s
+    SET processing_status = 'dead',
+        error_message = COALESCE(s.error_message, 'Lease expired on the last attempt'),
+        lease_owner = NULL,
+        lease_expires_at = NULL
+    WHERE s.processing_status = 'in_progress'
+      AND (s.lease_expires_at IS NULL OR s.lease_expires_at < NOW())
+      AND s.attempts >= s.max_attempts;
+
+    RETURN QUERY
+    WITH due AS (
+        SELECT j.id
+        FROM fixture_processing_status j
+        WHERE (j.processing_status IN ('pending', 'failed') AND j.available_at <= NOW())
+           OR (j.processing_status = 'in_progress' AND (j.lease_expires_at IS NULL OR j.lease_expires_at < NOW()))
+        ORDER BY j.available_at
+        LIMIT batch_size
+        FOR UPDATE SKIP LOCKED
+    )
+    UPDATE fixture_processing_status s
+    SET processing_status = 'in_progress',
+        attempts = s.attempts + 1,
+        lease_owner = worker_id,
+        lease_expires_at = NOW() + make_interval(secs => lease_seconds),
+        heartbeat_at = NOW(),
+        crew_execution_id = worker_id
+    FROM due
+    WHERE s.id = due.id
+    RETURNING s.id, s.fixture_id, s.attempts, s.max_attempts;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Extend a job's lease; returns false if the worker no longer holds it
+CREATE OR REPLACE FUNCTION heartbeat_fixture_job(job_id UUID, worker_id TEXT, lease_seconds INTEGER DEFAULT 600)
+RETURNS BOOLEAN AS $$
+    WITH extended AS (
+        UPDATE fixture_processing_status
+        SET lease_expires_at = NOW() + make_interval(secs => lease_seconds),
+            heartbeat_at = NOW()
+        WHERE id = job_id AND lease_owner = worker_id AND processing_status = 'in_progress'
+        RETURNING 1
+    )
+    SELECT EXISTS (SELECT 1 FROM extended);
+$$ LANGUAGE sql;
+
+-- Record a failed attempt: retry after an exponential backoff, or dead-letter the
+-- job once it is out of attempts. Returns the new status, or NULL if the lease was lost.
+CREATE OR REPLACE FUNCTION fail_fixture_job(job_id UUID, worker_id TEXT, error TEXT, retry_delay_seconds INTEGER DEFAULT 60)
+RETURNS TEXT AS $$
+    UPDATE fixture_processing_status
+    SET processing_status = CASE WHEN attempts >= max_attempts THEN 'dead' ELSE 'failed' END,
+        error_message = error,
+        available_at = NOW() + make_interval(secs => retry_delay_seconds * power(2, GREATEST(attempts - 1, 0))),
+        lease_owner = NULL,
+        lease_expires_at = NULL
+    WHERE id = job_id AND lease_owner = worker_id AND processing_status = 'in_progress'
+    RETURNING processing_status;
+$$ LANGUAGE sql;
+
+-- Seconds until the next job can be claimed (zero or negative if one is due, NULL if none)
+CREATE OR REPLACE FUNCTION next_fixture_job_due_in()
+RETURNS DOUBLE PRECISION AS $$
+    SELECT EXTRACT(EPOCH FROM MIN(due.due_at) - NOW())::DOUBLE PRECISION
+    FROM (
+        SELECT available_at AS due_at FROM fixture_processing_status
+        WHERE processing_status IN ('pending', 'failed')
+        UNION ALL
+        SELECT COALESCE(lease_expires_at, NOW()) FROM fixture_processing_status
+        WHERE processing_status = 'in_progress'
+    ) due;
+$$ LANGUAGE sql STABLE;
+
+-- Fixtures whose kickoff (GMT, 15:00 when unknown) was at least completed_after_hours ago
+-- and that don't have a processing job yet. Pass since to only look at recent match dates,
+-- so a poll reads an index range of recent fixtures instead of the whole season.
+DROP FUNCTION IF EXISTS get_unprocessed_completed_fixtures();
+CREATE OR REPLACE FUNCTION get_unprocessed_completed_fixtures(completed_after_hours INTEGER DEFAULT 3, since DATE DEFAULT NULL)
+RETURNS SETOF fixtures AS $$
+    SELECT f.*
+    FROM fixtures f
+    WHERE f.match_date <= (NOW() AT TIME ZONE 'UTC' - make_interval(hours => completed_after_hours))::date
+      AND f.match_date + COALESCE(f.match_time, TIME '15:00') <= NOW() AT TIME ZONE 'UTC' - make_interval(hours => completed_after_hours)
+      AND (since IS NULL OR f.match_date >= since)
+      AND NOT EXISTS (
+          SELECT 1 FROM fixture_processing_status fps WHERE fps.fixture_id = f.id
+      )
+    ORDER BY f.match_date, f.match_time;
+$$ LANGUAGE sql STABLE;
+
+-- Apply a batch of score updates in one statement. scores is a JSON array of
+-- {"id", "home_score", "away_score"} objects; returns the fixtures updated.
+CREATE OR REPLACE FUNCTION update_fixture_scores(scores JSONB)
+RETURNS TABLE (id UUID, matchday INTEGER) AS $$
+    UPDATE fixtures f
+    SET home_score = s.home_score,
+        away_score = s.away_score
+    FROM jsonb_to_recordset(scores) AS s(id UUID, home_score INTEGER, away_score INTEGER)
+    WHERE f.id = s.id
+    RETURNING f.id, f.matchday;
+$$ LANGUAGE sql;